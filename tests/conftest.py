@@ -4,6 +4,8 @@ import typing
 import pytest
 import requests
 
+from .perf import report as perf_report
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption(
@@ -12,6 +14,13 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=None,
         help="Base URL for GTS tests.",
     )
+    parser.addoption(
+        "--gts-server-cmd",
+        action="store",
+        default=None,
+        help="Command that starts a GTS server on '{port}', for tests that run several local servers.",
+    )
+    perf_report.add_options(parser)
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -19,6 +28,10 @@ def pytest_configure(config: pytest.Config) -> None:
     cli_opt = config.getoption("--gts-base-url")
     if cli_opt:
         os.environ["GTS_BASE_URL"] = cli_opt
+    server_cmd = config.getoption("--gts-server-cmd")
+    if server_cmd:
+        os.environ["GTS_SERVER_CMD"] = server_cmd
+    perf_report.configure(config)
 
 
 def pytest_sessionstart(session: pytest.Session) -> None:
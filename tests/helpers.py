@@ -0,0 +1,24 @@
+"""Helpers shared by the reference implementation tests (test_refimpl_*)."""
+
+import typing
+import uuid
+
+DRAFT_07 = "http://json-schema.org/draft-07/schema#"
+
+
+def gts_schema(schema_id: str, body: dict) -> dict:
+    """A draft-07 schema document with ``$id`` ``gts://{schema_id}``."""
+    return {"$id": f"gts://{schema_id}", "$schema": DRAFT_07, **body}
+
+
+def unique_package(prefix: str) -> str:
+    """A package name no earlier run against the same server has used."""
+    return f"{prefix}_{uuid.uuid4().hex[:8]}"
+
+
+def result_id(item: typing.Any) -> str:
+    """Identifier of a /query result item (plain ID or entity document)."""
+    if isinstance(item, dict):
+        item = item.get("$id") or item.get("id") or item.get("gts_id") or ""
+    item = str(item)
+    return item[len("gts://"):] if item.startswith("gts://") else item
@@ -0,0 +1,95 @@
+"""Throwaway GTS servers on local ports for multi-process tests.
+
+Most tests talk to one already running server (``GTS_BASE_URL``). Tests of
+deployments with several processes (read replicas, shards) start their own
+servers instead. The start command is implementation specific and comes
+from ``GTS_SERVER_CMD`` (or ``--gts-server-cmd``): a command line with a
+``{port}`` placeholder, e.g. ``gts server --port {port}``. Role-specific
+arguments such as ``--follow <leader-url>`` are appended to it. When no
+command is configured, these tests are skipped.
+"""
+
+import os
+import shlex
+import socket
+import subprocess
+import tempfile
+import time
+import typing
+
+import pytest
+import requests
+
+STARTUP_TIMEOUT = 30.0
+
+
+def server_command() -> typing.Optional[str]:
+    return os.getenv("GTS_SERVER_CMD") or None
+
+
+def require_server_command() -> str:
+    """Return the configured start command or skip the calling test."""
+    command = server_command()
+    if not command:
+        pytest.skip("GTS_SERVER_CMD / --gts-server-cmd is not set; cannot start local servers")
+    return command
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class LocalServer:
+    """A server process started with ``GTS_SERVER_CMD`` plus ``args``."""
+
+    def __init__(self, *args: str, port: typing.Optional[int] = None) -> None:
+        self.args = list(args)
+        self.port = port or free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self._process: typing.Optional[subprocess.Popen] = None
+        self._log = tempfile.TemporaryFile()
+
+    def start(self, timeout: float = STARTUP_TIMEOUT) -> "LocalServer":
+        command = shlex.split(require_server_command().format(port=self.port)) + self.args
+        self._process = subprocess.Popen(command, stdout=self._log, stderr=subprocess.STDOUT)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                self._fail(f"{command} exited with {self._process.returncode}")
+            try:
+                if requests.get(self.base_url + "/entities", timeout=1).status_code == 200:
+                    return self
+            except requests.RequestException:
+                pass
+            time.sleep(0.1)
+        self._fail(f"{command} did not answer on {self.base_url} within {timeout:.0f}s")
+
+    def _fail(self, message: str) -> typing.NoReturn:
+        # __exit__ does not run when start() fails inside __enter__
+        self.stop()
+        output = self.output()
+        self._log.close()
+        raise RuntimeError(f"{message}:\n{output}")
+
+    def stop(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+
+    def output(self) -> str:
+        """Last lines the server wrote to stdout/stderr."""
+        self._log.seek(0)
+        return "\n".join(self._log.read().decode(errors="replace").splitlines()[-20:])
+
+    def __enter__(self) -> "LocalServer":
+        return self.start()
+
+    def __exit__(self, *exc: typing.Any) -> None:
+        self.stop()
+        self._log.close()
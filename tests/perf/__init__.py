@@ -0,0 +1,6 @@
+"""Performance tooling for the GTS conformance suite.
+
+Nothing in this package is collected as a test. It provides the latency
+report plugin loaded from ``tests/conftest.py`` and helpers shared by the
+performance-oriented tooling.
+"""
@@ -0,0 +1,164 @@
+"""Cross-implementation performance comparison.
+
+Replays the same fixed-seed, per-operation workload (built from the
+conformance fixtures, see ``workload.py``) against several GTS servers and
+writes a side-by-side report of throughput, tail latency and error rate.
+
+Usage (from the repository root)::
+
+    python -m tests.perf.bench \\
+        --base-url python=http://127.0.0.1:8000 \\
+        --base-url go=http://127.0.0.1:8001 \\
+        --base-url rust=http://127.0.0.1:8002 \\
+        --requests 500 --concurrency 4 --output ./bench-report
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import time
+import typing
+
+from .stats import summarize
+from .workload import group_by_operation, load_fixture_requests, sample, send
+
+
+def parse_server(value: str) -> typing.Tuple[str, str]:
+    """Parse ``NAME=URL`` (or a bare URL, named after itself)."""
+    name, sep, url = value.partition("=")
+    if not sep:
+        name, url = value, value
+    if not url.startswith(("http://", "https://")):
+        url = f"http://{url}"
+    return name, url.rstrip("/")
+
+
+def run_operation(
+    base_url: str, workload: typing.Sequence[typing.Any], concurrency: int, timeout: float,
+) -> typing.Dict[str, typing.Any]:
+    """Send the workload with ``concurrency`` workers; aggregate the results."""
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda fixture: send(base_url, fixture, timeout), workload))
+    wall = time.perf_counter() - start
+    latencies = [elapsed for elapsed, _ in results]
+    errors = sum(1 for _, ok in results if not ok)
+    aggregate = summarize(latencies)
+    aggregate.update({
+        "errors": errors,
+        "error_rate": round(errors / len(results), 4) if results else 0.0,
+        "throughput_rps": round(len(results) / wall, 1) if wall > 0 else 0.0,
+    })
+    return aggregate
+
+
+def benchmark(
+    servers: typing.Sequence[typing.Tuple[str, str]],
+    operations: typing.Optional[typing.Sequence[str]],
+    requests_per_operation: int,
+    warmup: int,
+    concurrency: int,
+    seed: int,
+    timeout: float,
+) -> typing.Dict[str, typing.Any]:
+    grouped = group_by_operation(load_fixture_requests())
+    if operations:
+        grouped = {op: grouped[op] for op in operations if op in grouped}
+    results: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+    for name, base_url in servers:
+        print(f"# {name} ({base_url})", file=sys.stderr)
+        # identical registry content on every server before anything is measured
+        for setup, _ in grouped.values():
+            for fixture in setup:
+                send(base_url, fixture, timeout)
+        for index, (operation, (_, pool)) in enumerate(grouped.items()):
+            if not pool:
+                continue
+            workload = sample(pool, warmup + requests_per_operation, seed + index)
+            for fixture in workload[:warmup]:
+                send(base_url, fixture, timeout)
+            aggregate = run_operation(base_url, workload[warmup:], concurrency, timeout)
+            results.setdefault(operation, {})[name] = aggregate
+            print(
+                f"  {operation:<6} {aggregate['throughput_rps']:>8.1f} req/s "
+                f"p99={aggregate['p99_ms']:.1f}ms errors={aggregate['errors']}",
+                file=sys.stderr,
+            )
+    return {
+        "seed": seed,
+        "requests_per_operation": requests_per_operation,
+        "warmup": warmup,
+        "concurrency": concurrency,
+        "servers": dict(servers),
+        "results": results,
+    }
+
+
+def render_markdown(report: typing.Dict[str, typing.Any]) -> str:
+    names = list(report["servers"])
+    header = "| Operation | " + " | ".join(names) + " |"
+    divider = "|---" * (len(names) + 1) + "|"
+    lines = [
+        "# GTS server comparison",
+        "",
+        f"seed={report['seed']}, {report['requests_per_operation']} requests per operation "
+        f"after {report['warmup']} warmup requests, concurrency={report['concurrency']}",
+        "",
+        "| Server | Base URL |",
+        "|---|---|",
+        *(f"| {name} | {url} |" for name, url in report["servers"].items()),
+    ]
+    columns = (
+        ("Throughput (req/s, higher is better)", "throughput_rps", "{:.1f}"),
+        ("p99 latency (ms)", "p99_ms", "{:.2f}"),
+        ("p95 latency (ms)", "p95_ms", "{:.2f}"),
+        ("Error rate", "error_rate", "{:.2%}"),
+    )
+    for title, key, fmt in columns:
+        lines += ["", f"## {title}", "", header, divider]
+        for operation, per_server in report["results"].items():
+            cells = [
+                fmt.format(per_server[name][key]) if name in per_server else "-"
+                for name in names
+            ]
+            lines.append(f"| {operation} | " + " | ".join(cells) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--base-url", dest="servers", action="append", type=parse_server, required=True,
+        metavar="[NAME=]URL", help="GTS server to benchmark; repeat for each implementation.",
+    )
+    parser.add_argument(
+        "--operation", dest="operations", action="append",
+        metavar="OP#N", help="Only benchmark these operations (default: all).",
+    )
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per operation.")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per operation.")
+    parser.add_argument("--concurrency", type=int, default=1, help="Parallel client workers.")
+    parser.add_argument("--seed", type=int, default=1234, help="Workload seed, shared by all servers.")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds.")
+    parser.add_argument("--output", default="bench-report", help="Directory for bench.json and bench.md.")
+    args = parser.parse_args(argv)
+
+    report = benchmark(
+        args.servers, args.operations, args.requests, args.warmup,
+        args.concurrency, args.seed, args.timeout,
+    )
+    os.makedirs(args.output, exist_ok=True)
+    with open(os.path.join(args.output, "bench.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    markdown = render_markdown(report)
+    with open(os.path.join(args.output, "bench.md"), "w", encoding="utf-8") as f:
+        f.write(markdown)
+    print(markdown)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
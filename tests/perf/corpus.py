@@ -0,0 +1,335 @@
+"""Deterministic identifier corpus for OP#1/OP#3 throughput benchmarks.
+
+Valid identifiers are produced production by production from the EBNF of
+section 2.3: types, chained types, well-known and combined anonymous
+instances, long chains, series of many minor versions, ``_`` namespaces
+and, for ``$id``/``$ref`` handling, the ``gts://`` URI form of section 9.1.
+A configurable share of them is then turned into *near-valid* identifiers
+by a single mutation (an uppercase letter, a leading zero in a version, a
+repeated ``gts.`` prefix, a truncated UUID, ...), the inputs validators
+most often get subtly wrong.
+
+The expected verdict of every canonical identifier comes from the section
+8.2 chained-identifier regex plus the rules around it (a standalone
+identifier must be a type, the size limits of section 2.4), not from the
+generator's intent, so a mutation that happens to stay valid is labelled
+valid. ``gts://`` entries have no expected verdict: OP#1 is defined on
+canonical identifiers only.
+
+Usage (from the repository root)::
+
+    python -m tests.perf.corpus --count 1000000 --seed 1 --output ids.jsonl
+"""
+
+import argparse
+import json
+import random
+import re
+import string
+import sys
+import typing
+
+# section 2.4
+MAX_ID_LENGTH = 1024
+MAX_CHAIN_DEPTH = 64
+MAX_TOKEN_LENGTH = 64
+MAX_VERSION_NUMBER = 2 ** 32 - 1
+
+# section 8.2, without the surrounding \s*
+CHAINED_ID_RE = re.compile(
+    r"^gts\.[a-z_][a-z0-9_]*\.[a-z_][a-z0-9_]*\.[a-z_][a-z0-9_]*\.[a-z_][a-z0-9_]*\.v(0|[1-9]\d*)(?:\.(0|[1-9]\d*))?"
+    r"(?:~[a-z_][a-z0-9_]*\.[a-z_][a-z0-9_]*\.[a-z_][a-z0-9_]*\.[a-z_][a-z0-9_]*\.v(0|[1-9]\d*)(?:\.(0|[1-9]\d*))?)*"
+    r"(?:~(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})?)?$"
+)
+
+SHAPES = (
+    ("type", 25),
+    ("chain_type", 20),
+    ("instance", 20),
+    ("anon_instance", 10),
+    ("long_chain", 5),
+    ("minor_series", 1),
+    ("uri", 10),
+)
+
+_FIRST = string.ascii_lowercase + "_"
+_REST = string.ascii_lowercase + string.digits + "_"
+
+
+class CorpusEntry(typing.NamedTuple):
+    gts_id: str
+    shape: str
+    mutation: typing.Optional[str]
+    # None for gts:// entries
+    valid: typing.Optional[bool]
+
+
+def within_limits(gts_id: str) -> bool:
+    """Section 2.4 limits for an identifier that matches ``CHAINED_ID_RE``."""
+    if len(gts_id) > MAX_ID_LENGTH:
+        return False
+    segments = gts_id[len("gts."):].split("~")
+    if segments[-1] == "" or "-" in segments[-1]:
+        # type identifier, or the UUID tail counts as a segment of its own
+        depth = len(segments) - (segments[-1] == "")
+    else:
+        depth = len(segments)
+    if depth > MAX_CHAIN_DEPTH:
+        return False
+    for gts_segment in segments:
+        if not gts_segment or "-" in gts_segment:
+            continue
+        parts = gts_segment.split(".")
+        if any(len(token) > MAX_TOKEN_LENGTH for token in parts[:4]):
+            return False
+        if any(int(n) > MAX_VERSION_NUMBER for n in [parts[4][1:]] + parts[5:]):
+            return False
+    return True
+
+
+def is_valid_id(gts_id: str) -> bool:
+    """OP#1 verdict for a canonical identifier (sections 2, 2.4 and 8.2)."""
+    return (
+        len(gts_id) <= MAX_ID_LENGTH and "~" in gts_id
+        and CHAINED_ID_RE.match(gts_id) is not None and within_limits(gts_id)
+    )
+
+
+# -- productions of section 2.3 ------------------------------------------------
+
+def segment(rng: random.Random) -> str:
+    """``segment = ( letter | "_" ) , { letter | digit | "_" }``"""
+    length = rng.choice((1, 2, 3, 4, 5, 6, 7, 8, 10, 12)) if rng.random() < 0.95 else rng.randint(16, 40)
+    return rng.choice(_FIRST) + "".join(rng.choices(_REST, k=length - 1))
+
+
+def number(rng: random.Random) -> str:
+    """``"0" | positive-integer``, mostly small, sometimes very large."""
+    if rng.random() < 0.9:
+        return str(rng.randint(0, 12))
+    return str(rng.randint(0, 10 ** rng.randint(2, 9)))
+
+
+def version(rng: random.Random, minor: typing.Optional[int] = None) -> str:
+    """``version = "v" , major , [ "." , minor ]``"""
+    if minor is not None:
+        return f"v{number(rng)}.{minor}"
+    return f"v{number(rng)}" + (f".{number(rng)}" if rng.random() < 0.6 else "")
+
+
+def gts_segment(rng: random.Random, minor: typing.Optional[int] = None) -> str:
+    """``vendor . package . namespace . type . version``; a third of namespaces are ``_``."""
+    namespace = "_" if rng.random() < 0.33 else segment(rng)
+    return f"{segment(rng)}.{segment(rng)}.{namespace}.{segment(rng)}.{version(rng, minor)}"
+
+
+def uuid(rng: random.Random) -> str:
+    hex_digits = f"{rng.getrandbits(128):032x}"
+    return "-".join((hex_digits[:8], hex_digits[8:12], hex_digits[12:16], hex_digits[16:20], hex_digits[20:]))
+
+
+def chain(segments: typing.Sequence[str], tail: str) -> str:
+    """``"gts." , gts-segment , { "~" , gts-segment }`` plus ``"~"``, ``""`` or ``"~" , uuid``."""
+    return "gts." + "~".join(segments) + tail
+
+
+def valid_id(rng: random.Random, shape: str) -> str:
+    if shape in ("type", "uri"):
+        depth = rng.choice((1, 1, 1, 2, 3)) if shape == "uri" else 1
+        gts_id = chain([gts_segment(rng) for _ in range(depth)], "~")
+        return "gts://" + gts_id if shape == "uri" else gts_id
+    if shape == "chain_type":
+        return chain([gts_segment(rng) for _ in range(rng.randint(2, 4))], "~")
+    if shape == "instance":
+        return chain([gts_segment(rng) for _ in range(rng.randint(2, 4))], "")
+    if shape == "anon_instance":
+        return chain([gts_segment(rng) for _ in range(rng.randint(1, 3))], "~" + uuid(rng))
+    if shape == "long_chain":
+        segments = [gts_segment(rng)]
+        target = rng.randint(8, 40)
+        while len(segments) < target:
+            candidate = gts_segment(rng)
+            if len(chain(segments + [candidate], "~")) > MAX_ID_LENGTH:
+                break
+            segments.append(candidate)
+        return chain(segments, rng.choice(("~", "")) if len(segments) > 1 else "~")
+    raise ValueError(shape)
+
+
+def minor_series(rng: random.Random, count: int) -> typing.List[str]:
+    """One type in ``count`` consecutive minor versions (``v3.0~`` ... ``v3.<count-1>~``)."""
+    base = [gts_segment(rng) for _ in range(rng.randint(0, 2))]
+    namespace = "_" if rng.random() < 0.33 else segment(rng)
+    prefix = f"{segment(rng)}.{segment(rng)}.{namespace}.{segment(rng)}.v{number(rng)}"
+    return [chain(base + [f"{prefix}.{minor}"], "~") for minor in range(count)]
+
+
+# -- near-valid mutations -------------------------------------------------------
+
+def _replace_at(value: str, index: int, replacement: str) -> str:
+    return value[:index] + replacement + value[index + 1:]
+
+
+def _positions(gts_id: str, chars: str) -> typing.List[int]:
+    return [i for i, c in enumerate(gts_id) if c in chars and i >= len("gts.")]
+
+
+def _uppercase(rng: random.Random, gts_id: str) -> str:
+    positions = _positions(gts_id, string.ascii_lowercase)
+    i = rng.choice(positions)
+    return _replace_at(gts_id, i, gts_id[i].upper())
+
+
+def _leading_digit(rng: random.Random, gts_id: str) -> str:
+    starts = [
+        i for i in range(len("gts."), len(gts_id))
+        if gts_id[i - 1] in ".~" and gts_id[i] in _FIRST and gts_id[i] != "v"
+    ]
+    if not starts:
+        return _uppercase(rng, gts_id)
+    return _replace_at(gts_id, rng.choice(starts), rng.choice(string.digits))
+
+
+def _hyphen(rng: random.Random, gts_id: str) -> str:
+    return _replace_at(gts_id, rng.choice(_positions(gts_id, _REST)), "-")
+
+
+def _leading_zero(rng: random.Random, gts_id: str) -> str:
+    versions = [m.start(1) for m in re.finditer(r"\.v(\d)", gts_id)]
+    i = rng.choice(versions)
+    return gts_id[:i] + "0" + gts_id[i:]
+
+
+def _missing_version(rng: random.Random, gts_id: str) -> str:
+    versions = list(re.finditer(r"\.v\d+(?:\.\d+)?(?=~|$)", gts_id))
+    m = rng.choice(versions)
+    return gts_id[:m.start()] + gts_id[m.end():]
+
+
+def _extra_version_part(rng: random.Random, gts_id: str) -> str:
+    versions = list(re.finditer(r"\.v\d+(?:\.\d+)?(?=~|$)", gts_id))
+    m = rng.choice(versions)
+    extra = ".0.1" if "." not in m.group(0)[2:] else f".{rng.randint(0, 9)}"
+    return gts_id[:m.end()] + extra + gts_id[m.end():]
+
+
+def _double_tilde(rng: random.Random, gts_id: str) -> str:
+    i = rng.choice(_positions(gts_id, "~"))
+    return gts_id[:i] + "~" + gts_id[i:]
+
+
+def _repeated_prefix(rng: random.Random, gts_id: str) -> str:
+    tildes = [i for i in _positions(gts_id, "~") if i + 1 < len(gts_id)]
+    if not tildes:
+        return "gts." + gts_id
+    i = rng.choice(tildes)
+    return gts_id[:i + 1] + "gts." + gts_id[i + 1:]
+
+
+def _missing_token(rng: random.Random, gts_id: str) -> str:
+    head, sep, rest = gts_id.partition("~")
+    tokens = head.split(".")
+    del tokens[rng.randint(1, 3)]
+    return ".".join(tokens) + sep + rest
+
+
+def _bad_uuid(rng: random.Random, gts_id: str) -> str:
+    match = re.search(r"~([0-9a-f-]{36})$", gts_id)
+    if not match:
+        return gts_id + "~" + uuid(rng)[:-1]
+    tail = match.group(1)
+    broken = rng.choice((tail[:-1], tail.upper(), tail.replace("-", "", 1), tail[:8] + "g" + tail[9:]))
+    return gts_id[:match.start(1)] + broken
+
+
+def _bare_instance(rng: random.Random, gts_id: str) -> str:
+    return gts_id.split("~", 1)[0]
+
+
+def _long_token(rng: random.Random, gts_id: str) -> str:
+    starts = [i for i in range(len("gts."), len(gts_id)) if gts_id[i - 1] in ".~" and gts_id[i] in _FIRST and gts_id[i] != "v"]
+    i = rng.choice(starts)
+    return gts_id[:i] + "".join(rng.choices(_REST, k=MAX_TOKEN_LENGTH)) + gts_id[i:]
+
+
+def _huge_version(rng: random.Random, gts_id: str) -> str:
+    versions = [m.span(1) for m in re.finditer(r"\.v(\d+)", gts_id)]
+    start, end = rng.choice(versions)
+    return gts_id[:start] + str(rng.randint(MAX_VERSION_NUMBER + 1, 10 ** 12)) + gts_id[end:]
+
+
+def _too_long(rng: random.Random, gts_id: str) -> str:
+    segments = [gts_id.rstrip("~")[len("gts."):]]
+    while len(chain(segments, "~")) <= MAX_ID_LENGTH:
+        segments.append(gts_segment(rng))
+    return chain(segments, "~")
+
+
+MUTATIONS: typing.Dict[str, typing.Callable[[random.Random, str], str]] = {
+    "uppercase": _uppercase,
+    "leading_digit": _leading_digit,
+    "hyphen": _hyphen,
+    "leading_zero": _leading_zero,
+    "missing_version": _missing_version,
+    "extra_version_part": _extra_version_part,
+    "double_tilde": _double_tilde,
+    "repeated_prefix": _repeated_prefix,
+    "missing_token": _missing_token,
+    "bad_uuid": _bad_uuid,
+    "bare_instance": _bare_instance,
+    "long_token": _long_token,
+    "huge_version": _huge_version,
+    "too_long": _too_long,
+}
+
+
+def _entry(gts_id: str, shape: str, mutation: typing.Optional[str]) -> CorpusEntry:
+    valid = None if gts_id.startswith("gts://") else is_valid_id(gts_id)
+    return CorpusEntry(gts_id, shape, mutation, valid)
+
+
+def generate(
+    count: int, seed: int = 1, near_valid_ratio: float = 0.3,
+) -> typing.Iterator[CorpusEntry]:
+    """Yield ``count`` corpus entries; the same arguments always yield the same corpus."""
+    rng = random.Random(seed)
+    shapes = [shape for shape, _ in SHAPES]
+    weights = [weight for _, weight in SHAPES]
+    mutations = sorted(MUTATIONS)
+    produced = 0
+    while produced < count:
+        shape = rng.choices(shapes, weights)[0]
+        if shape == "minor_series":
+            ids = minor_series(rng, min(rng.randint(5, 40), count - produced))
+        else:
+            ids = [valid_id(rng, shape)]
+        for gts_id in ids:
+            mutation = None
+            if shape != "uri" and rng.random() < near_valid_ratio:
+                mutation = rng.choice(mutations)
+                gts_id = MUTATIONS[mutation](rng, gts_id)
+            yield _entry(gts_id, shape, mutation)
+            produced += 1
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--near-valid-ratio", type=float, default=0.3,
+                        help="Share of identifiers with one near-valid mutation (default: 0.3).")
+    parser.add_argument("--output", default="-", help="JSON lines file (default: stdout).")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for entry in generate(args.count, args.seed, args.near_valid_ratio):
+            out.write(json.dumps(entry._asdict()) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
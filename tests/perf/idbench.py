@@ -0,0 +1,155 @@
+"""Identifier throughput benchmark for OP#1 (/validate-id) and OP#3 (/parse-id).
+
+Pushes the generated identifier corpus (``corpus.py``) through the
+operations, either over HTTP or in-process through a Python adapter (the
+same adapter interface as ``tests/vectors/runner.py``), and reports
+identifiers per second. Every canonical identifier's verdict
+(``valid`` for /validate-id, ``ok`` for /parse-id) is compared with the
+corpus label; disagreements are listed in the report and make the run
+fail.
+
+Usage (from the repository root)::
+
+    python -m tests.perf.idbench --base-url http://127.0.0.1:8000 --count 100000 --concurrency 8
+    python -m tests.perf.idbench --adapter my_gts.conformance_adapter --count 1000000
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import threading
+import time
+import typing
+
+from ..vectors.runner import adapter_target, http_target, load_adapter
+from .corpus import CorpusEntry, generate
+from .stats import summarize
+
+OPERATIONS = {
+    "validate-id": ("/validate-id", "valid"),
+    "parse-id": ("/parse-id", "ok"),
+}
+MAX_EXAMPLES = 20
+
+
+def load_corpus(path: str) -> typing.List[CorpusEntry]:
+    """Read a corpus written by ``python -m tests.perf.corpus``."""
+    with open(path, encoding="utf-8") as f:
+        return [CorpusEntry(**json.loads(line)) for line in f if line.strip()]
+
+
+def run_operation(
+    operation: str, corpus: typing.Sequence[CorpusEntry],
+    make_target: typing.Callable[[], typing.Callable], concurrency: int,
+) -> typing.Dict[str, typing.Any]:
+    path, verdict_field = OPERATIONS[operation]
+    local = threading.local()
+
+    def call(entry: CorpusEntry) -> typing.Tuple[float, int, typing.Any]:
+        target = getattr(local, "target", None)
+        if target is None:
+            target = local.target = make_target()
+        start = time.perf_counter()
+        try:
+            status, body = target({"method": "GET", "path": path, "params": {"gts_id": entry.gts_id}})
+        except Exception as e:  # counted as an error, like a non-200 response
+            status, body = 0, {"error": f"{type(e).__name__}: {e}"}
+        return (time.perf_counter() - start) * 1000.0, status, body
+
+    start = time.perf_counter()
+    if concurrency > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(call, corpus, chunksize=256))
+    else:
+        results = [call(entry) for entry in corpus]
+    seconds = time.perf_counter() - start
+
+    errors = 0
+    disagreements = []
+    by_shape: typing.Dict[str, typing.List[float]] = {}
+    for entry, (elapsed_ms, status, body) in zip(corpus, results):
+        by_shape.setdefault(entry.shape, []).append(elapsed_ms)
+        if status != 200 or not isinstance(body, dict):
+            errors += 1
+            continue
+        if entry.valid is not None and body.get(verdict_field) is not entry.valid:
+            disagreements.append({
+                "gts_id": entry.gts_id[:200],
+                "shape": entry.shape,
+                "mutation": entry.mutation,
+                "expected": entry.valid,
+                "actual": body.get(verdict_field),
+            })
+    return {
+        "ids": len(corpus),
+        "seconds": round(seconds, 3),
+        "ids_per_second": round(len(corpus) / seconds, 1) if seconds else None,
+        "latency": summarize([r[0] for r in results]),
+        "by_shape": {shape: summarize(values) for shape, values in sorted(by_shape.items())},
+        "errors": errors,
+        "disagreements": len(disagreements),
+        "examples": disagreements[:MAX_EXAMPLES],
+    }
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    where = parser.add_mutually_exclusive_group()
+    where.add_argument("--base-url", default=os.getenv("GTS_BASE_URL", "http://127.0.0.1:8000"))
+    where.add_argument("--adapter", help="Benchmark in-process against module[:attribute].")
+    parser.add_argument("--operation", action="append", choices=sorted(OPERATIONS),
+                        help="Operation to benchmark (repeatable; default: all).")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--near-valid-ratio", type=float, default=0.3)
+    parser.add_argument("--corpus", help="Use a corpus file instead of generating one.")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", default="idbench-report.json")
+    args = parser.parse_args(argv)
+
+    if args.adapter:
+        adapter = load_adapter(args.adapter)
+        make_target = lambda: adapter_target(adapter)  # noqa: E731
+        where_label = f"adapter:{args.adapter}"
+    else:
+        base_url = args.base_url if args.base_url.startswith(("http://", "https://")) else f"http://{args.base_url}"
+        make_target = lambda: http_target(base_url.rstrip("/"), args.timeout)  # noqa: E731
+        where_label = base_url
+
+    if args.corpus:
+        corpus = load_corpus(args.corpus)
+    else:
+        corpus = list(generate(args.count, args.seed, args.near_valid_ratio))
+
+    report: typing.Dict[str, typing.Any] = {
+        "target": where_label,
+        "seed": args.seed,
+        "corpus_size": len(corpus),
+        "concurrency": args.concurrency,
+        "operations": {},
+    }
+    failed = False
+    for operation in args.operation or sorted(OPERATIONS):
+        result = run_operation(operation, corpus, make_target, args.concurrency)
+        report["operations"][operation] = result
+        failed = failed or bool(result["disagreements"] or result["errors"])
+        print(
+            f"{operation}: {result['ids_per_second']} IDs/s "
+            f"(p50 {result['latency']['p50_ms']} ms, p99 {result['latency']['p99_ms']} ms), "
+            f"{result['errors']} errors, {result['disagreements']} verdict disagreements",
+            file=sys.stderr,
+        )
+        for example in result["examples"][:5]:
+            print(f"  expected valid={example['expected']}: {example['gts_id']}", file=sys.stderr)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
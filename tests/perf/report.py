@@ -0,0 +1,232 @@
+"""Per-endpoint latency and request-count report for the conformance suite.
+
+The plugin reads the step results of every HttpRunner test case after it
+runs and aggregates the client-side response times per endpoint
+(``METHOD /path/template`` from openapi.json) and per test class. The
+aggregates are written as JSON and CSV, and can be compared with a
+previously saved baseline to detect latency regressions between server
+versions.
+"""
+
+import csv
+import json
+import os
+import sys
+import types
+import typing
+
+import pytest
+
+from .stats import endpoint_name, summarize
+
+REPORT_VERSION = 1
+METRICS = ("mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+
+
+def add_options(parser: pytest.Parser) -> None:
+    group = parser.getgroup("gts-perf", "GTS latency report")
+    group.addoption(
+        "--gts-perf-report",
+        action="store",
+        default=None,
+        metavar="DIR",
+        help="Write per-endpoint and per-class latency aggregates (JSON and CSV) to DIR.",
+    )
+    group.addoption(
+        "--gts-perf-baseline",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Compare endpoint latency with the baseline JSON at PATH.",
+    )
+    group.addoption(
+        "--gts-perf-save-baseline",
+        action="store_true",
+        default=False,
+        help="Write the current aggregates to --gts-perf-baseline instead of comparing.",
+    )
+    group.addoption(
+        "--gts-perf-metric",
+        action="store",
+        default="p95_ms",
+        choices=METRICS,
+        help="Aggregate compared against the baseline (default: p95_ms).",
+    )
+    group.addoption(
+        "--gts-perf-threshold",
+        action="store",
+        type=float,
+        default=0.25,
+        help="Allowed relative slowdown per endpoint before it counts as a regression (default: 0.25).",
+    )
+    group.addoption(
+        "--gts-perf-min-delta-ms",
+        action="store",
+        type=float,
+        default=2.0,
+        help="Ignore slowdowns smaller than this many milliseconds (default: 2.0).",
+    )
+
+
+def configure(config: pytest.Config) -> None:
+    """Register the plugin when a report or baseline was requested."""
+    report_dir = config.getoption("--gts-perf-report")
+    baseline = config.getoption("--gts-perf-baseline")
+    if config.getoption("--gts-perf-save-baseline") and not baseline:
+        raise pytest.UsageError("--gts-perf-save-baseline requires --gts-perf-baseline")
+    if report_dir or baseline:
+        config.pluginmanager.register(
+            LatencyReport(
+                report_dir=report_dir,
+                baseline_path=baseline,
+                save_baseline=config.getoption("--gts-perf-save-baseline"),
+                metric=config.getoption("--gts-perf-metric"),
+                threshold=config.getoption("--gts-perf-threshold"),
+                min_delta_ms=config.getoption("--gts-perf-min-delta-ms"),
+            ),
+            "gts-latency-report",
+        )
+
+
+def _iter_requests(step_results: typing.Iterable[typing.Any]) -> typing.Iterator[typing.Tuple[str, float]]:
+    """Yield (endpoint, response_time_ms) for every request in HttpRunner step results."""
+    for step_result in step_results:
+        data = getattr(step_result, "data", None)
+        if isinstance(data, list):
+            # referenced testcase: nested step results
+            yield from _iter_requests(data)
+            continue
+        req_resps = getattr(data, "req_resps", None)
+        if not req_resps:
+            continue
+        request = req_resps[0].request
+        yield endpoint_name(str(getattr(request.method, "value", request.method)), request.url), data.stat.response_time_ms
+
+
+class LatencyReport:
+    """Collects HttpRunner step timings and writes the aggregated report."""
+
+    def __init__(
+        self,
+        report_dir: typing.Optional[str],
+        baseline_path: typing.Optional[str],
+        save_baseline: bool,
+        metric: str,
+        threshold: float,
+        min_delta_ms: float,
+    ) -> None:
+        self.report_dir = report_dir
+        self.baseline_path = baseline_path
+        self.save_baseline = save_baseline
+        self.metric = metric
+        self.threshold = threshold
+        self.min_delta_ms = min_delta_ms
+        self.endpoint_samples: typing.Dict[str, typing.List[float]] = {}
+        self.class_samples: typing.Dict[str, typing.List[float]] = {}
+        self.class_tests: typing.Dict[str, int] = {}
+        self.regressions: typing.List[typing.Dict[str, typing.Any]] = []
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item):
+        yield
+        runner = getattr(item, "instance", None)
+        if runner is None or not hasattr(runner, "get_summary"):
+            return
+        try:
+            step_results = list(runner.get_summary().step_results)
+        except Exception:
+            # the runner failed before its first step was initialised
+            return
+        session_data = getattr(runner.session, "data", None)
+        if session_data is not None and (not step_results or step_results[-1].data is not session_data):
+            # the failing step is not part of the summary, but its request was sent
+            step_results.append(types.SimpleNamespace(data=session_data))
+        class_name = f"{item.module.__name__.rsplit('.', 1)[-1]}::{item.cls.__name__}"
+        self.class_tests[class_name] = self.class_tests.get(class_name, 0) + 1
+        samples = self.class_samples.setdefault(class_name, [])
+        for endpoint, elapsed_ms in _iter_requests(step_results):
+            self.endpoint_samples.setdefault(endpoint, []).append(elapsed_ms)
+            samples.append(elapsed_ms)
+
+    def build_report(self) -> typing.Dict[str, typing.Any]:
+        classes = {}
+        for name, samples in sorted(self.class_samples.items()):
+            aggregate = summarize(samples)
+            aggregate["tests"] = self.class_tests[name]
+            classes[name] = aggregate
+        return {
+            "version": REPORT_VERSION,
+            "base_url": os.getenv("GTS_BASE_URL", ""),
+            "endpoints": {name: summarize(samples) for name, samples in sorted(self.endpoint_samples.items())},
+            "classes": classes,
+        }
+
+    def compare(self, report: typing.Dict[str, typing.Any], baseline: typing.Dict[str, typing.Any]) -> None:
+        """Record endpoints whose metric grew beyond the configured threshold."""
+        for endpoint, current in report["endpoints"].items():
+            previous = baseline.get("endpoints", {}).get(endpoint)
+            if not previous or not previous.get(self.metric):
+                continue
+            before, after = previous[self.metric], current[self.metric]
+            if after - before > self.min_delta_ms and after > before * (1 + self.threshold):
+                self.regressions.append({
+                    "endpoint": endpoint,
+                    "metric": self.metric,
+                    "baseline_ms": before,
+                    "current_ms": after,
+                    "ratio": round(after / before, 3),
+                })
+
+    def write_report(self, report: typing.Dict[str, typing.Any]) -> None:
+        os.makedirs(self.report_dir, exist_ok=True)
+        report = dict(report, regressions=self.regressions)
+        with open(os.path.join(self.report_dir, "latency.json"), "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        for kind, key in (("endpoints", "endpoint"), ("classes", "class")):
+            rows = report[kind]
+            columns = ["count", "total_ms", *METRICS] + (["tests"] if kind == "classes" else [])
+            with open(os.path.join(self.report_dir, f"{kind}.csv"), "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow([key, *columns])
+                for name, aggregate in rows.items():
+                    writer.writerow([name, *(aggregate[c] for c in columns)])
+
+    def pytest_sessionfinish(self, session: pytest.Session, exitstatus: int) -> None:
+        report = self.build_report()
+        if self.baseline_path and self.save_baseline:
+            with open(self.baseline_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+                f.write("\n")
+        elif self.baseline_path:
+            try:
+                with open(self.baseline_path, encoding="utf-8") as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"\nCannot read latency baseline {self.baseline_path}: {e}", file=sys.stderr)
+            else:
+                self.compare(report, baseline)
+        if self.report_dir:
+            self.write_report(report)
+        if self.regressions and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter: typing.Any) -> None:
+        total = sum(len(samples) for samples in self.endpoint_samples.values())
+        terminalreporter.section("GTS latency report")
+        terminalreporter.write_line(f"{total} requests across {len(self.endpoint_samples)} endpoints")
+        for endpoint, samples in sorted(self.endpoint_samples.items()):
+            aggregate = summarize(samples)
+            terminalreporter.write_line(
+                f"  {endpoint:<32} n={aggregate['count']:<5} "
+                f"p50={aggregate['p50_ms']:.1f}ms p95={aggregate['p95_ms']:.1f}ms max={aggregate['max_ms']:.1f}ms"
+            )
+        if self.save_baseline:
+            terminalreporter.write_line(f"baseline written to {self.baseline_path}")
+        for regression in self.regressions:
+            terminalreporter.write_line(
+                f"REGRESSION {regression['endpoint']}: {regression['metric']} "
+                f"{regression['baseline_ms']:.1f}ms -> {regression['current_ms']:.1f}ms "
+                f"(x{regression['ratio']})",
+                red=True,
+            )
@@ -0,0 +1,215 @@
+"""Soak runner: long mixed workload with memory-growth and latency-drift checks.
+
+Replays the conformance fixtures of OP#1 - OP#13 (see ``workload.py``)
+for a configurable duration. Each round picks one test class with a fixed
+seed and sends all of its requests with a fresh identifier suffix. The
+suffixes rotate through a bounded pool (``--id-pool``), so the registry
+stops growing once every class/suffix combination has been registered;
+memory growth after that point indicates a leak rather than new data.
+
+The runner samples ``GET /metrics`` (section 9.11 of the specification)
+and the per-operation latency in fixed windows, and fails when the
+resident memory or the p95 latency of the last windows exceeds the first
+windows after warmup by more than the configured thresholds.
+
+Usage (from the repository root)::
+
+    python -m tests.perf.soak --base-url http://127.0.0.1:8000 --duration 4h
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import typing
+
+import requests
+
+from .stats import percentile
+from .workload import freshen, load_fixture_requests, send
+
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(value: str) -> float:
+    """Parse ``90``, ``90s``, ``15m``, ``4h`` or ``2d`` into seconds."""
+    value = value.strip().lower()
+    if value and value[-1] in _UNITS:
+        return float(value[:-1]) * _UNITS[value[-1]]
+    return float(value)
+
+
+def read_memory(base_url: str, timeout: float) -> typing.Optional[int]:
+    """Current resident memory reported by the server, or None if unavailable."""
+    try:
+        response = requests.get(base_url + "/metrics", timeout=timeout)
+        if response.status_code != 200:
+            return None
+        return int(response.json()["memory"]["rss_bytes"])
+    except (requests.RequestException, ValueError, KeyError, TypeError):
+        return None
+
+
+def _scenarios(
+    fixtures: typing.Iterable[typing.Any],
+) -> typing.List[typing.List[typing.Any]]:
+    """Group fixtures into per-class request sequences, preserving order."""
+    scenarios: typing.Dict[str, typing.List[typing.Any]] = {}
+    for fixture in fixtures:
+        scenarios.setdefault(fixture.source, []).append(fixture)
+    return list(scenarios.values())
+
+
+def _window_summary(
+    started: float, samples: typing.Dict[str, typing.List[float]],
+    errors: int, memory: typing.Optional[int],
+) -> typing.Dict[str, typing.Any]:
+    return {
+        "elapsed_s": round(time.monotonic() - started, 1),
+        "rss_bytes": memory,
+        "errors": errors,
+        "operations": {
+            op: {"count": len(values), "p50_ms": round(percentile(values, 50), 3),
+                 "p95_ms": round(percentile(values, 95), 3)}
+            for op, values in sorted(samples.items())
+        },
+    }
+
+
+def evaluate(
+    windows: typing.Sequence[typing.Dict[str, typing.Any]],
+    compare_windows: int,
+    max_memory_growth: float,
+    max_latency_drift: float,
+    min_delta_ms: float,
+) -> typing.List[str]:
+    """Compare the first and last ``compare_windows`` windows; return failures."""
+    if len(windows) < 2 * compare_windows:
+        return [f"not enough samples: {len(windows)} windows after warmup, need {2 * compare_windows}"]
+    head, tail = windows[:compare_windows], windows[-compare_windows:]
+    failures = []
+
+    head_rss = [w["rss_bytes"] for w in head if w["rss_bytes"]]
+    tail_rss = [w["rss_bytes"] for w in tail if w["rss_bytes"]]
+    if head_rss and tail_rss:
+        before, after = statistics.median(head_rss), statistics.median(tail_rss)
+        if after > before * (1 + max_memory_growth):
+            failures.append(
+                f"memory grew from {before / 2**20:.1f} MiB to {after / 2**20:.1f} MiB "
+                f"(+{(after / before - 1):.0%}, limit +{max_memory_growth:.0%})"
+            )
+
+    operations = set()
+    for window in windows:
+        operations.update(window["operations"])
+    for op in sorted(operations):
+        head_p95 = [w["operations"][op]["p95_ms"] for w in head if op in w["operations"]]
+        tail_p95 = [w["operations"][op]["p95_ms"] for w in tail if op in w["operations"]]
+        if not head_p95 or not tail_p95:
+            continue
+        before, after = statistics.median(head_p95), statistics.median(tail_p95)
+        if after - before > min_delta_ms and after > before * (1 + max_latency_drift):
+            failures.append(
+                f"{op} p95 latency drifted from {before:.2f} ms to {after:.2f} ms "
+                f"(+{(after / before - 1):.0%}, limit +{max_latency_drift:.0%})"
+            )
+    return failures
+
+
+def soak(args: argparse.Namespace) -> typing.Dict[str, typing.Any]:
+    scenarios = _scenarios(load_fixture_requests())
+    rng = random.Random(args.seed)
+    started = time.monotonic()
+    deadline = started + args.duration
+    warmup_until = started + args.warmup
+    window_end = started + args.sample_interval
+    samples: typing.Dict[str, typing.List[float]] = {}
+    errors = 0
+    rounds = 0
+    windows: typing.List[typing.Dict[str, typing.Any]] = []
+    warmup_windows = 0
+
+    while time.monotonic() < deadline:
+        suffix = f"s{rounds % args.id_pool}"
+        for fixture in rng.choice(scenarios):
+            elapsed_ms, ok = send(args.base_url, freshen(fixture, suffix), args.timeout)
+            label = "registration" if fixture.is_setup else fixture.operation
+            samples.setdefault(label, []).append(elapsed_ms)
+            errors += 0 if ok else 1
+        rounds += 1
+        now = time.monotonic()
+        if now >= window_end:
+            window = _window_summary(started, samples, errors, read_memory(args.base_url, args.timeout))
+            windows.append(window)
+            if now < warmup_until:
+                warmup_windows += 1
+            rss = window["rss_bytes"]
+            print(
+                f"[{window['elapsed_s']:>8.0f}s] rounds={rounds} errors={errors} "
+                f"rss={'n/a' if rss is None else f'{rss / 2**20:.1f}MiB'}",
+                file=sys.stderr,
+            )
+            samples, errors = {}, 0
+            window_end = now + args.sample_interval
+
+    measured = windows[warmup_windows:]
+    failures = evaluate(
+        measured, args.compare_windows, args.max_memory_growth,
+        args.max_latency_drift, args.min_delta_ms,
+    )
+    if all(w["rss_bytes"] is None for w in windows):
+        print("warning: GET /metrics is not available, memory growth is not checked", file=sys.stderr)
+    return {
+        "base_url": args.base_url,
+        "seed": args.seed,
+        "duration_s": args.duration,
+        "rounds": rounds,
+        "warmup_windows": warmup_windows,
+        "windows": windows,
+        "failures": failures,
+    }
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default=os.getenv("GTS_BASE_URL", "http://127.0.0.1:8000"))
+    parser.add_argument("--duration", type=parse_duration, default=parse_duration("1h"),
+                        help="Total run time, e.g. 30m, 4h, 2d (default: 1h).")
+    parser.add_argument("--warmup", type=parse_duration, default=parse_duration("5m"),
+                        help="Windows started before this time are not evaluated (default: 5m).")
+    parser.add_argument("--sample-interval", type=parse_duration, default=parse_duration("30s"),
+                        help="Length of a sampling window (default: 30s).")
+    parser.add_argument("--compare-windows", type=int, default=3,
+                        help="Windows averaged at the start and at the end of the run (default: 3).")
+    parser.add_argument("--id-pool", type=int, default=50,
+                        help="Number of rotating identifier suffixes (default: 50).")
+    parser.add_argument("--max-memory-growth", type=float, default=0.2,
+                        help="Allowed relative RSS growth (default: 0.2).")
+    parser.add_argument("--max-latency-drift", type=float, default=0.5,
+                        help="Allowed relative p95 growth per operation (default: 0.5).")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0,
+                        help="Ignore p95 drift smaller than this many milliseconds (default: 2.0).")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", default="soak-report.json")
+    args = parser.parse_args(argv)
+    if not args.base_url.startswith(("http://", "https://")):
+        args.base_url = f"http://{args.base_url}"
+    args.base_url = args.base_url.rstrip("/")
+
+    report = soak(args)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    for failure in report["failures"]:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    if not report["failures"]:
+        print(f"OK: {report['rounds']} rounds, no memory growth or latency drift", file=sys.stderr)
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Latency statistics and endpoint naming helpers."""
+
+import json
+import math
+import os
+import re
+import typing
+from urllib.parse import unquote, urlsplit
+
+OPENAPI_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "openapi.json")
+
+
+def percentile(values: typing.Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100) of a sequence, 0.0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(values: typing.Sequence[float]) -> typing.Dict[str, float]:
+    """Summarize latency samples (milliseconds) into the report aggregates."""
+    count = len(values)
+    total = sum(values)
+    return {
+        "count": count,
+        "total_ms": round(total, 3),
+        "mean_ms": round(total / count, 3) if count else 0.0,
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "max_ms": round(max(values), 3) if count else 0.0,
+    }
+
+
+def _load_path_templates() -> typing.List[typing.Tuple[typing.Pattern, str]]:
+    """Compile the path templates from openapi.json, literal paths first."""
+    try:
+        with open(OPENAPI_PATH, encoding="utf-8") as f:
+            paths = json.load(f).get("paths", {})
+    except (OSError, ValueError):
+        return []
+    templates = []
+    for path in sorted(paths, key=lambda p: ("{" in p, p)):
+        pattern = re.sub(r"\\\{[^}]+\\\}", "[^/]+", re.escape(path))
+        templates.append((re.compile(f"^{pattern}$"), path))
+    return templates
+
+
+_PATH_TEMPLATES = _load_path_templates()
+
+
+def endpoint_name(method: str, url: str) -> str:
+    """Map a request to ``METHOD /path/template`` using the openapi.json paths.
+
+    Paths that do not match any template are reported as-is.
+    """
+    path = unquote(urlsplit(url).path) or "/"
+    for regex, template in _PATH_TEMPLATES:
+        if regex.match(path):
+            path = template
+            break
+    return f"{method.upper()} {path}"
@@ -0,0 +1,223 @@
+"""Request workloads derived from the conformance test fixtures.
+
+The HttpRunner test classes in ``tests/test_op*.py`` already describe
+several hundred requests covering OP#1 - OP#13. This module turns their
+``teststeps`` back into plain HTTP requests so that performance tooling
+can replay them without HttpRunner: registration steps become the setup
+of a workload, every other step becomes a request of its operation.
+"""
+
+import importlib
+import inspect
+import random
+import re
+import threading
+import time
+import typing
+
+import requests
+
+OPERATION_MODULES = (
+    "test_op1_id_validation",
+    "test_op2_id_extraction",
+    "test_op2_schema_id_priority",
+    "test_op3_id_parsing",
+    "test_op4_id_match_pattern",
+    "test_op5_id_uuid",
+    "test_op6_schema_validation",
+    "test_op7_relationship_resolution",
+    "test_op8_compatibility_checking",
+    "test_op9_version_casting",
+    "test_op10_query_execution",
+    "test_op11_attribute_access",
+    "test_op12_schema_vs_schema_validation",
+    "test_op13_schema_traits_validation",
+)
+
+REGISTRATION_PATHS = ("/entities", "/entities/bulk", "/schemas")
+
+_VARIABLE_RE = re.compile(r"\$\$|\$\{(\w+)\}|\$(\w+)")
+# package token of the leftmost (absolute) segment of a GTS identifier
+_ABSOLUTE_SEGMENT_RE = re.compile(r"(?<![a-z0-9_.])gts\.([a-z_][a-z0-9_]*)\.([a-z_][a-z0-9_]*)\.")
+
+
+class UnresolvedVariable(Exception):
+    """A fixture refers to an HttpRunner variable that is not available."""
+
+
+class FixtureRequest(typing.NamedTuple):
+    operation: str
+    source: str
+    method: str
+    path: str
+    params: typing.Dict[str, str]
+    body: typing.Any
+    expected_status: int
+
+    @property
+    def is_setup(self) -> bool:
+        """Successful registrations prepare the registry, they are not measured."""
+        return (
+            self.method == "POST"
+            and self.path in REGISTRATION_PATHS
+            and self.expected_status == 200
+        )
+
+
+def operation_label(module_name: str) -> str:
+    """Map ``test_op12_schema_vs_schema_validation`` to ``OP#12``."""
+    match = re.match(r"test_op(\d+)_", module_name)
+    return f"OP#{match.group(1)}" if match else module_name
+
+
+def substitute(value: typing.Any, variables: typing.Dict[str, typing.Any]) -> typing.Any:
+    """Resolve HttpRunner ``$var``/``${var}`` references and ``$$`` escapes."""
+
+    def replace(match: typing.Match) -> str:
+        if match.group(0) == "$$":
+            return "$"
+        name = match.group(1) or match.group(2)
+        if name not in variables:
+            raise UnresolvedVariable(name)
+        return str(variables[name])
+
+    if isinstance(value, str):
+        return _VARIABLE_RE.sub(replace, value)
+    if isinstance(value, dict):
+        return {substitute(k, variables): substitute(v, variables) for k, v in value.items()}
+    if isinstance(value, list):
+        return [substitute(v, variables) for v in value]
+    return value
+
+
+def freshen(fixture: FixtureRequest, suffix: str) -> FixtureRequest:
+    """Copy of a fixture whose GTS identifiers live in a separate package.
+
+    The package of the leftmost segment of every identifier (and pattern)
+    gets ``_<suffix>`` appended, e.g. ``gts.x.test6.events.type.v1~`` becomes
+    ``gts.x.test6_s7.events.type.v1~``. References between the requests of
+    one test class stay consistent, while different suffixes never collide.
+    """
+
+    def rewrite(value: typing.Any) -> typing.Any:
+        if isinstance(value, str):
+            return _ABSOLUTE_SEGMENT_RE.sub(rf"gts.\1.\2_{suffix}.", value)
+        if isinstance(value, dict):
+            return {rewrite(k): rewrite(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [rewrite(v) for v in value]
+        return value
+
+    return fixture._replace(
+        path=rewrite(fixture.path),
+        params=rewrite(fixture.params),
+        body=rewrite(fixture.body),
+    )
+
+
+def _expected_status(validators: typing.List[typing.Dict[str, typing.Any]]) -> int:
+    for validator in validators:
+        for check, expect in validator.items():
+            if check in ("equal", "eq") and expect[0] == "status_code":
+                return int(expect[1])
+    return 200
+
+
+def class_parameters(cls: type) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Parameter sets of a ``@pytest.mark.parametrize("param", Parameters(...))`` class."""
+    for mark in getattr(cls.test_start, "pytestmark", []):
+        if mark.name == "parametrize" and mark.args[0] == "param":
+            return list(mark.args[1])
+    return [{}]
+
+
+def fixture_classes(module_name: str) -> typing.List[type]:
+    """HttpRunner test classes defined in ``tests/<module_name>.py``, in source order."""
+    module = importlib.import_module(f"{__package__.rsplit('.', 1)[0]}.{module_name}")
+    classes = [
+        cls for name, cls in inspect.getmembers(module, inspect.isclass)
+        if name.startswith("TestCase") and cls.__module__ == module.__name__
+    ]
+    classes.sort(key=lambda cls: inspect.getsourcelines(cls)[1])
+    return classes
+
+
+def load_fixture_requests(
+    modules: typing.Iterable[str] = OPERATION_MODULES,
+) -> typing.List[FixtureRequest]:
+    """Collect the requests of every HttpRunner test class, in suite order.
+
+    Parametrized classes are expanded once per parameter set. Steps that
+    refer to variables extracted at runtime are skipped.
+    """
+    fixtures = []
+    for module_name in modules:
+        operation = operation_label(module_name)
+        for cls in fixture_classes(module_name):
+            for variables in class_parameters(cls):
+                for step in cls.teststeps:
+                    struct = step.struct()
+                    request = struct.request
+                    if request is None:
+                        continue
+                    try:
+                        fixtures.append(FixtureRequest(
+                            operation=operation,
+                            source=f"{module_name}::{cls.__name__}",
+                            method=str(getattr(request.method, "value", request.method)).upper(),
+                            path=substitute(request.url, variables),
+                            params=substitute(dict(request.params), variables),
+                            body=substitute(request.req_json, variables),
+                            expected_status=_expected_status(struct.validators),
+                        ))
+                    except UnresolvedVariable:
+                        continue
+    return fixtures
+
+
+def group_by_operation(
+    fixtures: typing.Iterable[FixtureRequest],
+) -> typing.Dict[str, typing.Tuple[typing.List[FixtureRequest], typing.List[FixtureRequest]]]:
+    """Split fixtures into ``{operation: (setup_requests, measured_requests)}``."""
+    grouped: typing.Dict[str, typing.Tuple[typing.List[FixtureRequest], typing.List[FixtureRequest]]] = {}
+    for fixture in fixtures:
+        setup, measured = grouped.setdefault(fixture.operation, ([], []))
+        (setup if fixture.is_setup else measured).append(fixture)
+    return grouped
+
+
+def sample(
+    pool: typing.Sequence[FixtureRequest], count: int, seed: int,
+) -> typing.List[FixtureRequest]:
+    """Deterministic sequence of ``count`` requests drawn from ``pool``."""
+    rng = random.Random(seed)
+    return [rng.choice(pool) for _ in range(count)] if pool else []
+
+
+_local = threading.local()
+
+
+def _session() -> requests.Session:
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session
+
+
+def send(
+    base_url: str, fixture: FixtureRequest, timeout: float = 30.0,
+) -> typing.Tuple[float, bool]:
+    """Send a fixture request; return (elapsed_ms, matched_expected_status)."""
+    start = time.perf_counter()
+    try:
+        response = _session().request(
+            fixture.method,
+            base_url + fixture.path,
+            params=fixture.params or None,
+            json=fixture.body,
+            timeout=timeout,
+        )
+        ok = response.status_code == fixture.expected_status
+    except requests.RequestException:
+        ok = False
+    return (time.perf_counter() - start) * 1000.0, ok
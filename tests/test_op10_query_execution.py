@@ -663,5 +663,215 @@ class TestCaseTestOp10Query_UseCase4_AllV1BaseAndDerived(HttpRunner):
     ]
 
 
+# 8. Filter types by effective traits
+
+TRAITS_BASE = "gts.x.test13.ovt.event.v1~"
+AUDIT_TOPIC = "gts.x.core.events.topic.v1~x.core._.audit.v1"
+NOTIFICATION_TOPIC = "gts.x.core.events.topic.v1~x.core._.notification.v1"
+
+
+def _register_trait_schema(label, gts_id, base_ref=None, traits=None):
+    body = {
+        "$$schema": "http://json-schema.org/draft-07/schema#",
+        "$$id": f"gts://{gts_id}",
+        "type": "object",
+    }
+    if base_ref is None:
+        body.update({
+            "x-gts-traits-schema": {
+                "type": "object",
+                "properties": {
+                    "topicRef": {
+                        "type": "string",
+                        "x-gts-ref": "gts.x.core.events.topic.v1~",
+                    },
+                    "retention": {
+                        "type": "string",
+                        "default": "P30D",
+                    },
+                },
+            },
+            "required": ["id"],
+            "properties": {
+                "id": {"type": "string"},
+            },
+        })
+    else:
+        body["allOf"] = [
+            {"$$ref": f"gts://{base_ref}"},
+            {"type": "object", "x-gts-traits": traits},
+        ]
+    return Step(
+        RunRequest(label)
+        .post("/entities")
+        .with_json(body)
+        .validate()
+        .assert_equal("status_code", 200)
+    )
+
+
+# Helper function to register the trait fixtures of the OP#13 tests
+def register_trait_usecase_entities():
+    """Register the audit/notification fixtures of the OP#13 traits tests:
+    - gts.x.test13.ovt.event.v1~ (trait schema: topicRef, retention default P30D)
+    - ...~x.test13._.audit_evt.v1~ (topicRef = audit topic)
+    - ...~x.test13._.audit_evt.v1~x.test13._.most_derived.v1~
+      (overrides topicRef with the notification topic: invalid traits)
+    - ...~x.test13._.notification_evt.v1~ (topicRef = notification topic)
+    - an instance of the audit event type
+    """
+    return [
+        _register_trait_schema("register base with topicRef + retention traits", TRAITS_BASE),
+        _register_trait_schema(
+            "register audit event type",
+            f"{TRAITS_BASE}x.test13._.audit_evt.v1~",
+            TRAITS_BASE,
+            {"topicRef": AUDIT_TOPIC},
+        ),
+        _register_trait_schema(
+            "register leaf overriding topicRef (invalid traits)",
+            f"{TRAITS_BASE}x.test13._.audit_evt.v1~x.test13._.most_derived.v1~",
+            f"{TRAITS_BASE}x.test13._.audit_evt.v1~",
+            {"topicRef": NOTIFICATION_TOPIC},
+        ),
+        _register_trait_schema(
+            "register notification event type",
+            f"{TRAITS_BASE}x.test13._.notification_evt.v1~",
+            TRAITS_BASE,
+            {"topicRef": NOTIFICATION_TOPIC, "retention": "P7D"},
+        ),
+        Step(
+            RunRequest("register audit event instance")
+            .post("/entities")
+            .with_json({
+                "id": f"{TRAITS_BASE}x.test13._.audit_evt.v1~x.test10._.evt_1.v1",
+                "type": f"{TRAITS_BASE}x.test13._.audit_evt.v1~",
+            })
+            .validate()
+            .assert_equal("status_code", 200)
+        ),
+    ]
+
+
+def _trait_query(label, expr, count):
+    return Step(
+        RunRequest(label)
+        .get("/query")
+        .with_params(**{"expr": expr})
+        .validate()
+        .assert_equal("status_code", 200)
+        .assert_length_equal("body.results", count)
+    )
+
+
+class TestCaseTestOp10Query_TraitValue(HttpRunner):
+    """OP#10 - Trait query: types routed to a topic
+    Pattern: gts.x.test13.ovt.event.v1~*[x-gts-traits.topicRef=<topic>]
+    Expected: the audit type for the audit topic, the notification type for
+    the notification topic; the leaf with overridden (invalid) traits never matches
+    """
+    config = Config("OP#10 - Trait query (value)").base_url(
+        get_gts_base_url()
+    )
+
+    def test_start(self):
+        super().test_start()
+
+    teststeps = register_trait_usecase_entities() + [
+        _trait_query(
+            "types routed to the audit topic",
+            f'{TRAITS_BASE}*[x-gts-traits.topicRef="{AUDIT_TOPIC}"]',
+            1,
+        ),
+        _trait_query(
+            "types routed to the notification topic",
+            f'{TRAITS_BASE}*[x-gts-traits.topicRef="{NOTIFICATION_TOPIC}"]',
+            1,
+        ),
+        _trait_query(
+            "types below the audit type routed to the audit topic",
+            f'{TRAITS_BASE}x.test13._.audit_evt.v1~*[x-gts-traits.topicRef="{AUDIT_TOPIC}"]',
+            0,
+        ),
+    ]
+
+
+class TestCaseTestOp10Query_TraitDefault(HttpRunner):
+    """OP#10 - Trait query: values filled from trait schema defaults
+    Pattern: gts.x.test13.ovt.event.v1~*[x-gts-traits.retention=P30D]
+    Expected: only the audit type (the notification type sets P7D)
+    """
+    config = Config("OP#10 - Trait query (default)").base_url(
+        get_gts_base_url()
+    )
+
+    def test_start(self):
+        super().test_start()
+
+    teststeps = register_trait_usecase_entities() + [
+        _trait_query(
+            "types with the default retention",
+            f"{TRAITS_BASE}*[x-gts-traits.retention=P30D]",
+            1,
+        ),
+        _trait_query(
+            "types with an explicit retention",
+            f'{TRAITS_BASE}*[x-gts-traits.retention="P7D"]',
+            1,
+        ),
+    ]
+
+
+class TestCaseTestOp10Query_TraitMultipleFilters(HttpRunner):
+    """OP#10 - Trait query: combined and wildcard trait filters
+    Expected: instances never match, all filters must hold
+    """
+    config = Config("OP#10 - Trait query (multiple filters)").base_url(
+        get_gts_base_url()
+    )
+
+    def test_start(self):
+        super().test_start()
+
+    teststeps = register_trait_usecase_entities() + [
+        _trait_query(
+            "types with any topic",
+            f"{TRAITS_BASE}*[x-gts-traits.topicRef=*]",
+            2,
+        ),
+        _trait_query(
+            "audit topic and explicit retention",
+            f'{TRAITS_BASE}*[x-gts-traits.topicRef="{AUDIT_TOPIC}", x-gts-traits.retention="P7D"]',
+            0,
+        ),
+        _trait_query(
+            "notification topic and explicit retention",
+            f'{TRAITS_BASE}*[x-gts-traits.topicRef="{NOTIFICATION_TOPIC}", x-gts-traits.retention="P7D"]',
+            1,
+        ),
+    ]
+
+
+class TestCaseTestOp10Query_InvalidTraitFilter(HttpRunner):
+    """OP#10 - Trait query: a trait parameter without a trait name is invalid"""
+    config = Config("OP#10 - Trait query (invalid)").base_url(
+        get_gts_base_url()
+    )
+
+    def test_start(self):
+        super().test_start()
+
+    teststeps = [
+        Step(
+            RunRequest("query with an empty trait name")
+            .get("/query")
+            .with_params(**{"expr": f"{TRAITS_BASE}*[x-gts-traits.=P30D]"})
+            .validate()
+            .assert_equal("status_code", 200)
+            .assert_startswith("body.error", "Invalid query")
+        ),
+    ]
+
+
 if __name__ == "__main__":
     TestCaseTestOp10Query_ExactMatch().test_start()
@@ -207,6 +207,97 @@ class TestCaseTestOp1IdValidation_VersionEdgeCases(HttpRunner):
     ]
 
 
+class TestCaseTestOp1IdValidation_SizeLimitsValid(HttpRunner):
+    """OP#1 Extended - IDs exactly at the size limits of section 2.4"""
+    config = Config(
+        "OP#1 Extended - Size Limits (valid)"
+    ).base_url(
+        get_gts_base_url()
+    )
+
+    @pytest.mark.parametrize(
+        "param",
+        Parameters(
+            {
+                "id": [
+                    # 64-character tokens
+                    "gts." + "v" * 64 + ".pkg.ns.type.v1~",
+                    "gts.x.pkg.ns." + "t" * 64 + ".v1~",
+                    # largest version numbers
+                    "gts.x.pkg.ns.type.v4294967295~",
+                    "gts.x.pkg.ns.type.v1.4294967295~",
+                    # 64 chained segments (708 characters)
+                    "gts." + "~".join(["a.b.c.d.v1"] * 64) + "~",
+                    # 63 chained segments plus the UUID tail
+                    "gts." + "~".join(["a.b.c.d.v1"] * 63) + "~7a1d2f34-5678-49ab-9012-abcdef123456",
+                    # exactly 1024 characters
+                    "gts." + "~".join(["x.pkg.ns.type_0001.v1.0"] * 41) + "~x.pkg.ns." + "t" * 23 + ".v1~",
+                ]
+            }
+        ),
+    )
+    def test_start(self, param):
+        super().test_start(param)
+
+    teststeps = [
+        Step(
+            RunRequest("validate ids at the size limits")
+            .get("/validate-id")
+            .with_params(**{"gts_id": "${id}"})
+            .validate()
+            .assert_equal("status_code", 200)
+            .assert_equal("body.valid", True)
+        ),
+    ]
+
+
+class TestCaseTestOp1IdValidation_SizeLimitsInvalid(HttpRunner):
+    """OP#1 Extended - IDs just over the size limits of section 2.4"""
+    config = Config(
+        "OP#1 Extended - Size Limits (invalid)"
+    ).base_url(
+        get_gts_base_url()
+    )
+
+    @pytest.mark.parametrize(
+        "param",
+        Parameters(
+            {
+                "id": [
+                    # 65-character tokens
+                    "gts." + "v" * 65 + ".pkg.ns.type.v1~",
+                    "gts.x.pkg.ns." + "t" * 65 + ".v1~",
+                    # version numbers above 2^32 - 1
+                    "gts.x.pkg.ns.type.v4294967296~",
+                    "gts.x.pkg.ns.type.v1.4294967296~",
+                    "gts.x.pkg.ns.type.v12345678901~",
+                    # 65 chained segments
+                    "gts." + "~".join(["a.b.c.d.v1"] * 65) + "~",
+                    "gts." + "~".join(["a.b.c.d.v1"] * 65),
+                    # 64 chained segments plus the UUID tail
+                    "gts." + "~".join(["a.b.c.d.v1"] * 64) + "~7a1d2f34-5678-49ab-9012-abcdef123456",
+                    # 1025 characters
+                    "gts." + "~".join(["x.pkg.ns.type_0001.v1.0"] * 41) + "~x.pkg.ns." + "t" * 24 + ".v1~",
+                ]
+            }
+        ),
+    )
+    def test_start(self, param):
+        super().test_start(param)
+
+    teststeps = [
+        Step(
+            RunRequest("validate ids over the size limits")
+            .get("/validate-id")
+            .with_params(**{"gts_id": "${id}"})
+            .validate()
+            .assert_equal("status_code", 200)
+            .assert_equal("body.valid", False)
+            .assert_not_equal("body.error", "")
+        ),
+    ]
+
+
 class TestCaseTestOp1IdValidation_UnderscorePlaceholder(HttpRunner):
     """OP#1 Extended - Underscore placeholder usage"""
     config = Config(
@@ -0,0 +1,200 @@
+"""Concurrent registration tests: readers running while writers register.
+
+All other tests are strictly sequential. Here several writers register
+derived schemas (POST /entities) while readers run /query,
+/resolve-relationships and GET /entities/{gts_id} against the same base
+type. Every read must observe a consistent registry:
+
+- a query only returns identifiers that were actually registered;
+- once a registration has been acknowledged, every query started after
+  that moment returns it, and it never disappears again for that reader;
+- a derived schema returned by a query is complete: it resolves and its
+  stored document is the one that was registered (no half-registered
+  derived schemas).
+
+A second test measures how much reader throughput drops while writes are
+in progress.
+"""
+
+import concurrent.futures
+import random
+import threading
+import time
+import typing
+
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema, result_id, unique_package
+
+WRITERS = 4
+READERS = 4
+DERIVED_PER_WRITER = 25
+PHASE_SECONDS = 3.0
+# reads must keep flowing while writers are active; a registry that blocks
+# all reads during registration falls far below this ratio
+MIN_READ_THROUGHPUT_RATIO = 0.1
+
+
+def _base_schema(base_id: str) -> dict:
+    return gts_schema(base_id, {
+        "type": "object",
+        "required": ["id"],
+        "properties": {"id": {"type": "string"}},
+    })
+
+
+def _derived_schema(base_id: str, derived_id: str, seq: int) -> dict:
+    return gts_schema(derived_id, {
+        "type": "object",
+        "allOf": [
+            {"$ref": f"gts://{base_id}"},
+            {
+                "type": "object",
+                "required": ["seq"],
+                "properties": {"seq": {"type": "integer", "const": seq}},
+            },
+        ],
+    })
+
+
+def _query_ids(session: requests.Session, base_url: str, base_id: str) -> typing.Set[str]:
+    r = session.get(base_url + "/query", params={"expr": base_id + "*", "limit": 1000}, timeout=30)
+    assert r.status_code == 200, r.text
+    return {result_id(item) for item in r.json().get("results", [])}
+
+
+def _register(session: requests.Session, base_url: str, body: dict) -> None:
+    r = session.post(base_url + "/entities", json=body, timeout=30)
+    assert r.status_code == 200, r.text
+
+
+def test_concurrent_registration_reads_see_consistent_snapshots() -> None:
+    base_url = get_gts_base_url()
+    package = unique_package("testconc")
+    base_id = f"gts.x.{package}.core.item.v1~"
+    derived = {
+        f"{base_id}x.{package}._.item_w{w}_{i}.v1~": w * DERIVED_PER_WRITER + i
+        for w in range(WRITERS)
+        for i in range(DERIVED_PER_WRITER)
+    }
+    _register(requests.Session(), base_url, _base_schema(base_id))
+
+    acknowledged: typing.Dict[str, float] = {}
+    done = threading.Event()
+    problems: typing.List[str] = []
+
+    def writer(w: int) -> None:
+        session = requests.Session()
+        for i in range(DERIVED_PER_WRITER):
+            derived_id = f"{base_id}x.{package}._.item_w{w}_{i}.v1~"
+            _register(session, base_url, _derived_schema(base_id, derived_id, derived[derived_id]))
+            acknowledged[derived_id] = time.monotonic()
+
+    def reader(r: int) -> int:
+        session = requests.Session()
+        rng = random.Random(r)
+        seen: typing.Set[str] = set()
+        reads = 0
+        while not done.is_set() or reads == 0:
+            started = time.monotonic()
+            must_see = {i for i, at in list(acknowledged.items()) if at < started}
+            visible = _query_ids(session, base_url, base_id)
+            reads += 1
+            if visible - set(derived):
+                problems.append(f"reader {r}: unknown ids {sorted(visible - set(derived))[:3]}")
+            if must_see - visible:
+                problems.append(f"reader {r}: acknowledged ids missing {sorted(must_see - visible)[:3]}")
+            if seen - visible:
+                problems.append(f"reader {r}: ids disappeared {sorted(seen - visible)[:3]}")
+            seen |= visible
+            known = visible & set(derived)
+            if not known:
+                continue
+            probe = rng.choice(sorted(known))
+            resolved = session.get(base_url + "/resolve-relationships", params={"gts_id": probe}, timeout=30)
+            if resolved.status_code != 200:
+                problems.append(f"reader {r}: {probe} visible but not resolvable ({resolved.status_code})")
+            entity = session.get(f"{base_url}/entities/{probe}", timeout=30)
+            if entity.status_code != 200:
+                problems.append(f"reader {r}: {probe} visible but not retrievable ({entity.status_code})")
+            elif entity.json().get("content", {}).get("allOf") != _derived_schema(base_id, probe, derived[probe])["allOf"]:
+                problems.append(f"reader {r}: {probe} returned incomplete content")
+        return reads
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=WRITERS + READERS) as pool:
+        readers = [pool.submit(reader, r) for r in range(READERS)]
+        writers = [pool.submit(writer, w) for w in range(WRITERS)]
+        for future in writers:
+            future.result()
+        done.set()
+        reads = sum(future.result() for future in readers)
+
+    assert not problems, f"{len(problems)} inconsistent reads out of {reads}: {problems[:5]}"
+    assert _query_ids(requests.Session(), base_url, base_id) == set(derived)
+
+
+def _read_loop(base_url: str, base_id: str, stop: threading.Event, seed: int) -> int:
+    """Alternate /query and /resolve-relationships until stopped; return the read count."""
+    session = requests.Session()
+    rng = random.Random(seed)
+    reads = 0
+    while not stop.is_set():
+        visible = sorted(_query_ids(session, base_url, base_id))
+        reads += 1
+        if visible:
+            r = session.get(
+                base_url + "/resolve-relationships",
+                params={"gts_id": rng.choice(visible)},
+                timeout=30,
+            )
+            assert r.status_code == 200, r.text
+            reads += 1
+    return reads
+
+
+def _measure_reads(base_url: str, base_id: str, seconds: float, write: typing.Optional[typing.Callable]) -> float:
+    stop = threading.Event()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=READERS + WRITERS) as pool:
+        readers = [pool.submit(_read_loop, base_url, base_id, stop, seed) for seed in range(READERS)]
+        writers = [pool.submit(write, w, stop) for w in range(WRITERS)] if write else []
+        time.sleep(seconds)
+        stop.set()
+        for future in writers:
+            future.result()
+        return sum(future.result() for future in readers) / seconds
+
+
+def test_concurrent_registration_read_throughput(record_property) -> None:
+    base_url = get_gts_base_url()
+    package = unique_package("testconc")
+    base_id = f"gts.x.{package}.core.item.v1~"
+    session = requests.Session()
+    _register(session, base_url, _base_schema(base_id))
+    for i in range(DERIVED_PER_WRITER):
+        derived_id = f"{base_id}x.{package}._.seed_{i}.v1~"
+        _register(session, base_url, _derived_schema(base_id, derived_id, i))
+
+    # writers extend a sibling base type, so the readers' result sets keep
+    # their size and only contention is measured
+    load_base_id = f"gts.x.{package}.core.load.v1~"
+    _register(session, base_url, _base_schema(load_base_id))
+
+    def writer(w: int, stop: threading.Event) -> None:
+        writer_session = requests.Session()
+        i = 0
+        while not stop.is_set():
+            derived_id = f"{load_base_id}x.{package}._.load_w{w}_{i}.v1~"
+            _register(writer_session, base_url, _derived_schema(load_base_id, derived_id, i))
+            i += 1
+
+    idle_rps = _measure_reads(base_url, base_id, PHASE_SECONDS, None)
+    loaded_rps = _measure_reads(base_url, base_id, PHASE_SECONDS, writer)
+    drop = 1 - loaded_rps / idle_rps if idle_rps else 0.0
+    record_property("read_rps_idle", round(idle_rps, 1))
+    record_property("read_rps_during_writes", round(loaded_rps, 1))
+    record_property("read_throughput_drop", round(drop, 3))
+    assert loaded_rps >= idle_rps * MIN_READ_THROUGHPUT_RATIO, (
+        f"reads nearly stalled during registration: {loaded_rps:.1f} req/s "
+        f"vs {idle_rps:.1f} req/s without writers"
+    )
@@ -0,0 +1,258 @@
+"""Deep inheritance chains: $ref resolution, OP#6, OP#7, OP#12 and OP#13 (section 9.12.3).
+
+Chains of depth 25 and 50 use chained identifiers; a 100-level hierarchy,
+deeper than chained identifiers allow (section 2.4), composes distinct
+types through allOf/$ref. Every level adds a required property; the base
+defines a constrained ``data`` property and a trait schema whose value is
+set at level 2. The conformance cases check the verdicts at the deepest
+level, the benchmark asserts sub-quadratic latency growth with depth.
+"""
+
+import statistics
+import time
+import typing
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema, unique_package
+from httprunner import HttpRunner, Config, Step, RunRequest
+
+# ---------------------------------------------------------------------------
+# Generated chains
+# ---------------------------------------------------------------------------
+
+
+def _chained_ids(package: str, depth: int) -> typing.List[str]:
+    ids = [f"gts.x.{package}.chain.root.v1~"]
+    for k in range(2, depth + 1):
+        ids.append(f"{ids[-1]}x.d{k}._.t.v1~")
+    return ids
+
+
+def _composed_ids(package: str, depth: int) -> typing.List[str]:
+    return [f"gts.x.{package}.chain.level_{k}.v1~" for k in range(1, depth + 1)]
+
+
+def _base_body() -> dict:
+    return {
+        "type": "object",
+        "x-gts-traits-schema": {
+            "type": "object",
+            "properties": {"retention": {"type": "string"}},
+        },
+        "required": ["id", "data"],
+        "properties": {
+            "id": {"type": "string"},
+            "data": {"type": "string", "maxLength": 128},
+        },
+    }
+
+
+def _level_body(parent: str, k: int, properties: typing.Optional[dict] = None, traits: typing.Optional[dict] = None) -> dict:
+    overlay: dict = {
+        "type": "object",
+        "required": [f"level_{k}"],
+        "properties": {f"level_{k}": {"type": "integer", "const": k}, **(properties or {})},
+    }
+    if traits is not None:
+        overlay["x-gts-traits"] = traits
+    return {"type": "object", "allOf": [{"$ref": f"gts://{parent}"}, overlay]}
+
+
+def _chain(ids: typing.List[str]) -> typing.List[typing.Tuple[str, dict]]:
+    """(schema id, schema body without $id/$schema) for every level."""
+    schemas = [(ids[0], _base_body())]
+    for k in range(2, len(ids) + 1):
+        traits = {"retention": "P30D"} if k == 2 else None
+        schemas.append((ids[k - 1], _level_body(ids[k - 2], k, traits=traits)))
+    return schemas
+
+
+def _instance(instance_id: str, depth: int, **overrides: typing.Any) -> dict:
+    return {"id": instance_id, "data": "payload", **{f"level_{k}": k for k in range(2, depth + 1)}, **overrides}
+
+
+# ---------------------------------------------------------------------------
+# Conformance cases
+# ---------------------------------------------------------------------------
+
+
+def _escape(value: typing.Any) -> typing.Any:
+    """Escape $-keywords for HttpRunner request bodies."""
+    if isinstance(value, dict):
+        return {(f"${k}" if k.startswith("$") else k): _escape(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_escape(v) for v in value]
+    return value
+
+
+def _register(label: str, body: dict) -> Step:
+    return Step(
+        RunRequest(label)
+        .post("/entities")
+        .with_json(_escape(body))
+        .validate()
+        .assert_equal("status_code", 200)
+    )
+
+
+def _register_schema(label: str, schema_id: str, body: dict) -> Step:
+    return _register(label, gts_schema(schema_id, body))
+
+
+def _validate(label: str, path: str, field: str, gts_id: str, expect_ok: bool) -> Step:
+    return Step(
+        RunRequest(label)
+        .post(path)
+        .with_json({field: gts_id})
+        .validate()
+        .assert_equal("status_code", 200)
+        .assert_equal("body.ok", expect_ok)
+    )
+
+
+def _sibling(ids: typing.List[str], name: str) -> str:
+    """A type with the same parent and depth as the leaf of ids."""
+    leaf = ids[-1]
+    if leaf.count("~") > 1:
+        return f"{ids[-2]}x.{name}._.t.v1~"
+    return leaf.replace(".level_", f".{name}_level_")
+
+
+def _deep_chain_steps(ids: typing.List[str]) -> typing.List[Step]:
+    depth = len(ids)
+    leaf, parent = ids[-1], ids[-2]
+    good, bad = f"{leaf}x.deep._.good.v1", f"{leaf}x.deep._.bad.v1"
+    loose = _sibling(ids, "loose")
+    override = _sibling(ids, "override")
+    return [
+        _register_schema(f"register level {k}", schema_id, body)
+        for k, (schema_id, body) in enumerate(_chain(ids), start=1)
+    ] + [
+        _validate(f"OP#12/OP#13 - level {depth} is valid", "/validate-schema", "schema_id", leaf, True),
+        Step(
+            RunRequest(f"OP#7 - resolve level {depth}")
+            .get("/resolve-relationships")
+            .with_params(**{"gts_id": leaf})
+            .validate()
+            .assert_equal("status_code", 200)
+        ),
+        _register("register valid instance", _instance(good, depth)),
+        _register("register instance violating level 2", _instance(bad, depth, level_2=3)),
+        _validate("OP#6 - valid instance", "/validate-instance", "instance_id", good, True),
+        _validate("OP#6 - level 2 constraint holds at the deepest level", "/validate-instance", "instance_id", bad, False),
+        _register_schema(
+            "register leaf loosening the base maxLength", loose,
+            _level_body(parent, depth, {"data": {"type": "string", "maxLength": 256}}),
+        ),
+        _validate("OP#12 - loosening a base constraint fails", "/validate-schema", "schema_id", loose, False),
+        _register_schema(
+            "register leaf overriding the level 2 trait", override,
+            _level_body(parent, depth, traits={"retention": "P365D"}),
+        ),
+        _validate("OP#13 - overriding a level 2 trait fails", "/validate-schema", "schema_id", override, False),
+    ]
+
+
+class TestCaseDeepChain_Chained25(HttpRunner):
+    """Deep chain: 25 levels with chained identifiers"""
+    config = Config("Deep chain - chained, depth 25").base_url(get_gts_base_url())
+
+    def test_start(self):
+        super().test_start()
+
+    teststeps = _deep_chain_steps(_chained_ids("test_deep25", 25))
+
+
+class TestCaseDeepChain_Chained50(HttpRunner):
+    """Deep chain: 50 levels with chained identifiers"""
+    config = Config("Deep chain - chained, depth 50").base_url(get_gts_base_url())
+
+    def test_start(self):
+        super().test_start()
+
+    teststeps = _deep_chain_steps(_chained_ids("test_deep50", 50))
+
+
+class TestCaseDeepChain_Composed100(HttpRunner):
+    """Deep chain: 100 levels composed through allOf/$ref"""
+    config = Config("Deep chain - composed, depth 100").base_url(get_gts_base_url())
+
+    def test_start(self):
+        super().test_start()
+
+    teststeps = _deep_chain_steps(_composed_ids("test_deep100", 100))
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+CHAINED_DEPTHS = (25, 50)
+COMPOSED_DEPTHS = (25, 50, 100)
+REPEATS = 30
+# latency may grow at most like depth ** GROWTH_EXPONENT between consecutive depths, plus slack
+GROWTH_EXPONENT = 1.5
+GROWTH_SLACK_MS = 2.0
+
+
+class Timings(typing.NamedTuple):
+    validate_schema: float
+    resolve_relationships: float
+    validate_instance: float
+
+
+def _p50(session: requests.Session, method: str, path: str, **kwargs: typing.Any) -> float:
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        r = session.request(method, get_gts_base_url() + path, timeout=60, **kwargs)
+        samples.append((time.perf_counter() - start) * 1000.0)
+        assert r.status_code == 200, r.text[:500]
+    return statistics.median(samples)
+
+
+def _measure(ids: typing.List[str]) -> Timings:
+    session = requests.Session()
+    entities = [gts_schema(schema_id, body) for schema_id, body in _chain(ids)]
+    instance_id = f"{ids[-1]}x.deep._.bench.v1"
+    entities.append(_instance(instance_id, len(ids)))
+    r = session.post(get_gts_base_url() + "/entities/bulk", json=entities, timeout=120)
+    assert r.status_code == 200, r.text[:500]
+    assert session.post(get_gts_base_url() + "/validate-instance", json={"instance_id": instance_id}, timeout=60).json()["ok"] is True
+    return Timings(
+        _p50(session, "POST", "/validate-schema", json={"schema_id": ids[-1]}),
+        _p50(session, "GET", "/resolve-relationships", params={"gts_id": ids[-1]}),
+        _p50(session, "POST", "/validate-instance", json={"instance_id": instance_id}),
+    )
+
+
+@pytest.mark.parametrize("kind, depths, make_ids", [
+    ("chained", CHAINED_DEPTHS, _chained_ids),
+    ("composed", COMPOSED_DEPTHS, _composed_ids),
+])
+def test_latency_grows_subquadratically(
+    kind: str,
+    depths: typing.Sequence[int],
+    make_ids: typing.Callable[[str, int], typing.List[str]],
+    record_property,
+) -> None:
+    timings = {}
+    for depth in depths:
+        timings[depth] = _measure(make_ids(unique_package("testdeep"), depth))
+        for name, value in timings[depth]._asdict().items():
+            record_property(f"{kind}_{depth}_{name}_p50_ms", round(value, 3))
+
+    failures = []
+    for shallow, deep in zip(depths, depths[1:]):
+        factor = (deep / shallow) ** GROWTH_EXPONENT
+        for name in Timings._fields:
+            before, after = getattr(timings[shallow], name), getattr(timings[deep], name)
+            limit = before * factor + GROWTH_SLACK_MS
+            if after > limit:
+                failures.append(
+                    f"{name}: depth {deep} p50 {after:.3f} ms, limit {limit:.3f} ms (depth {shallow}: {before:.3f} ms)"
+                )
+    assert not failures, f"{kind} chains: " + "; ".join(failures)
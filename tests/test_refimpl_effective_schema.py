@@ -0,0 +1,120 @@
+"""Flattened effective schema export: GET /effective-schema/{type_id} (section 9.12.5).
+
+The OP#6 conformance cases are replayed in suite order. For every
+/validate-instance request whose instance was registered, the exported
+schema of the instance's type is fetched and the instance is validated
+locally with a stock draft-07 validator. The local verdict must equal the
+verdict of /validate-instance.
+"""
+
+import json
+import os
+import typing
+
+import jsonschema
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .perf.workload import load_fixture_requests
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "events")
+ORDER_PLACED = "gts.x.core.events.type.v1~x.commerce.orders.order_placed.v1.0~"
+
+
+def _gts_refs(schema: typing.Any) -> typing.List[str]:
+    """Every $ref in schema that points to a gts:// identifier."""
+    if isinstance(schema, dict):
+        found = [schema["$ref"]] if str(schema.get("$ref", "")).startswith("gts://") else []
+        return found + [ref for value in schema.values() for ref in _gts_refs(value)]
+    if isinstance(schema, list):
+        return [ref for value in schema for ref in _gts_refs(value)]
+    return []
+
+
+def _effective_schema(session: requests.Session, type_id: str) -> dict:
+    r = session.get(get_gts_base_url() + f"/effective-schema/{type_id}", timeout=30)
+    assert r.status_code == 200, r.text[:500]
+    schema = r.json()
+    assert schema.get("$id") == f"gts://{type_id}"
+    assert not _gts_refs(schema), f"exported schema of {type_id} still references {_gts_refs(schema)[:3]}"
+    return schema
+
+
+FORMAT_CHECKER = jsonschema.FormatChecker()
+
+
+def _local_verdict(schema: dict, instance: dict) -> bool:
+    # without the format-nongpl extra, "date-time" values are silently accepted
+    assert "date-time" in FORMAT_CHECKER.checkers, "install jsonschema[format-nongpl] (tests/requirements.txt)"
+    # every known format, including "uuid", which draft-07 itself does not define
+    validator = jsonschema.Draft7Validator(schema, format_checker=FORMAT_CHECKER)
+    return validator.is_valid(instance)
+
+
+def _type_of(instance: dict) -> str:
+    instance_id = instance["id"]
+    return instance_id[: instance_id.rindex("~") + 1] if "~" in instance_id else instance["type"]
+
+
+def test_local_verdicts_match_op6_fixtures() -> None:
+    session = requests.Session()
+    instances: typing.Dict[str, dict] = {}
+    compared = 0
+    mismatches = []
+    for fixture in load_fixture_requests(["test_op6_schema_validation"]):
+        r = session.request(
+            fixture.method, get_gts_base_url() + fixture.path,
+            params=fixture.params or None, json=fixture.body, timeout=30,
+        )
+        if (
+            fixture.path == "/entities" and fixture.expected_status == 200
+            and r.status_code == 200 and "id" in fixture.body
+        ):
+            instances[fixture.body["id"]] = fixture.body
+        if fixture.path != "/validate-instance" or r.status_code != 200:
+            continue
+        instance = instances.get(fixture.body["instance_id"])
+        if instance is None:
+            continue
+        expected = r.json()["ok"]
+        local = _local_verdict(_effective_schema(session, _type_of(instance)), instance)
+        if local is not expected:
+            mismatches.append(f"{fixture.source}: local ok={local}, /validate-instance ok={expected}")
+        compared += 1
+    assert compared, "no registered instance was validated by the OP#6 fixtures"
+    assert not mismatches, f"{len(mismatches)} of {compared} verdicts differ: {mismatches[:5]}"
+
+
+def _load(*parts: str) -> typing.Any:
+    with open(os.path.join(EXAMPLES_DIR, *parts), encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="module")
+def events() -> None:
+    schemas = [_load("schemas", name) for name in os.listdir(os.path.join(EXAMPLES_DIR, "schemas"))]
+    for schema in sorted(schemas, key=lambda s: s["$id"].count("~")):
+        r = requests.post(get_gts_base_url() + "/entities", json=schema, timeout=30)
+        assert r.status_code == 200, r.text
+
+
+def test_export_inlines_ancestors_and_lists_registry_checks(events: None) -> None:
+    schema = _effective_schema(requests.Session(), ORDER_PLACED)
+    # the derived schema uses x-gts-ref, which a local validator cannot check
+    assert "x-gts-ref" in schema.get("x-gts-registry-checks", [])
+    instance = _load("instances", "gts.x.core.events.type.v1~x.commerce.orders.order_placed.v1~.examples.json")[0]
+    assert _local_verdict(schema, instance) is True
+    assert _local_verdict(schema, {**instance, "payload": {}}) is False
+    # properties required by the base type survive the flattening
+    assert _local_verdict(schema, {k: v for k, v in instance.items() if k != "occurredAt"}) is False
+
+
+@pytest.mark.parametrize("type_id, status", [
+    ("gts.x.core.events.type.v1~x.commerce.orders.unknown.v1~", 404),
+    ("gts.x.core.events.topic.v1~x.commerce._.orders.v1", 422),
+    ("gts.x.core.events.type.v1~*", 422),
+])
+def test_invalid_type_ids_are_rejected(events: None, type_id: str, status: int) -> None:
+    r = requests.get(get_gts_base_url() + f"/effective-schema/{type_id}", timeout=30)
+    assert r.status_code == status, r.text
@@ -0,0 +1,266 @@
+"""Tests for the effective traits endpoint (GET /traits/{type_id}, section 9.7.6)."""
+
+import statistics
+import time
+import typing
+
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema, unique_package
+from httprunner import HttpRunner, Config, Step, RunRequest
+
+
+# ---------------------------------------------------------------------------
+# Helper functions
+# ---------------------------------------------------------------------------
+
+def _register(gts_id, schema_body, label="register schema"):
+    """Register a schema via POST /entities."""
+    body = {
+        "$$id": gts_id,
+        "$$schema": "http://json-schema.org/draft-07/schema#",
+        **schema_body,
+    }
+    return Step(
+        RunRequest(label)
+        .post("/entities")
+        .with_json(body)
+        .validate()
+        .assert_equal("status_code", 200)
+    )
+
+
+def _register_derived(gts_id, base_ref, overlay, label="register derived"):
+    """Register a derived schema that uses allOf with a $$ref."""
+    return _register(gts_id, {"type": "object", "allOf": [{"$$ref": base_ref}, overlay]}, label)
+
+
+def _traits(type_id, label="get effective traits"):
+    """GET /traits/{type_id}; returns the RunRequest so that callers can add assertions."""
+    return (
+        RunRequest(label)
+        .get(f"/traits/{type_id}")
+        .validate()
+        .assert_equal("status_code", 200)
+        .assert_equal("body.id", type_id)
+    )
+
+
+TRAITS_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "topicRef": {"type": "string", "x-gts-ref": "gts.x.core.events.topic.v1~"},
+        "retention": {"type": "string", "default": "P30D"},
+        "priority": {"type": "integer", "minimum": 0, "default": 1},
+    },
+}
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestCaseEffectiveTraits_DefaultsAndSources(HttpRunner):
+    """Effective traits combine values set along the chain with trait-schema defaults."""
+    config = Config("Effective traits - defaults and sources").base_url(get_gts_base_url())
+
+    def test_start(self):
+        super().test_start()
+
+    teststeps = [
+        _register(
+            "gts://gts.x.testtraits.dflt.event.v1~",
+            {
+                "type": "object",
+                "x-gts-traits-schema": TRAITS_SCHEMA,
+                "properties": {"id": {"type": "string"}},
+            },
+            "register base with trait schema",
+        ),
+        _register_derived(
+            "gts://gts.x.testtraits.dflt.event.v1~x.testtraits._.orders.v1~",
+            "gts://gts.x.testtraits.dflt.event.v1~",
+            {"type": "object", "x-gts-traits": {"topicRef": "gts.x.core.events.topic.v1~x.testtraits._.orders.v1"}},
+            "register mid-level setting topicRef",
+        ),
+        _register_derived(
+            "gts://gts.x.testtraits.dflt.event.v1~x.testtraits._.orders.v1~x.testtraits._.placed.v1~",
+            "gts://gts.x.testtraits.dflt.event.v1~x.testtraits._.orders.v1~",
+            {"type": "object", "x-gts-traits": {"retention": "P90D"}},
+            "register leaf setting retention",
+        ),
+        Step(
+            _traits("gts.x.testtraits.dflt.event.v1~x.testtraits._.orders.v1~x.testtraits._.placed.v1~", "leaf traits")
+            .assert_equal("body.ok", True)
+            .assert_equal("body.traits.topicRef", "gts.x.core.events.topic.v1~x.testtraits._.orders.v1")
+            .assert_equal("body.traits.retention", "P90D")
+            .assert_equal("body.traits.priority", 1)
+            .assert_equal("body.sources.topicRef", "gts.x.testtraits.dflt.event.v1~x.testtraits._.orders.v1~")
+            .assert_equal(
+                "body.sources.retention",
+                "gts.x.testtraits.dflt.event.v1~x.testtraits._.orders.v1~x.testtraits._.placed.v1~",
+            )
+            .assert_equal("body.sources.priority", "default")
+            .assert_equal("body.defaults", ["priority"])
+            .assert_equal("body.missing", [])
+        ),
+        Step(
+            _traits("gts.x.testtraits.dflt.event.v1~x.testtraits._.orders.v1~", "mid-level traits")
+            .assert_equal("body.ok", True)
+            .assert_equal("body.traits.topicRef", "gts.x.core.events.topic.v1~x.testtraits._.orders.v1")
+            .assert_equal("body.traits.retention", "P30D")
+            .assert_equal("body.sources.retention", "default")
+        ),
+        Step(
+            _traits("gts.x.testtraits.dflt.event.v1~", "base traits")
+            .assert_equal("body.traits.retention", "P30D")
+            .assert_equal("body.traits.priority", 1)
+            .assert_equal("body.missing", ["topicRef"])
+        ),
+    ]
+
+
+class TestCaseEffectiveTraits_Invalid_Override(HttpRunner):
+    """A descendant overriding a trait value reports ok=false, like /validate-schema."""
+    config = Config("Effective traits - override conflict").base_url(get_gts_base_url())
+
+    def test_start(self):
+        super().test_start()
+
+    teststeps = [
+        _register(
+            "gts://gts.x.testtraits.ovr.event.v1~",
+            {"type": "object", "x-gts-traits-schema": TRAITS_SCHEMA},
+            "register base with trait schema",
+        ),
+        _register_derived(
+            "gts://gts.x.testtraits.ovr.event.v1~x.testtraits._.audit.v1~",
+            "gts://gts.x.testtraits.ovr.event.v1~",
+            {"type": "object", "x-gts-traits": {"topicRef": "gts.x.core.events.topic.v1~x.core._.audit.v1"}},
+            "register audit event",
+        ),
+        _register_derived(
+            "gts://gts.x.testtraits.ovr.event.v1~x.testtraits._.audit.v1~x.testtraits._.notify.v1~",
+            "gts://gts.x.testtraits.ovr.event.v1~x.testtraits._.audit.v1~",
+            {"type": "object", "x-gts-traits": {"topicRef": "gts.x.core.events.topic.v1~x.core._.notification.v1"}},
+            "register descendant overriding topicRef",
+        ),
+        Step(
+            _traits("gts.x.testtraits.ovr.event.v1~x.testtraits._.audit.v1~x.testtraits._.notify.v1~", "traits of the overriding type")
+            .assert_equal("body.ok", False)
+            .assert_not_equal("body.error", "")
+        ),
+        Step(
+            RunRequest("verdict agrees with /validate-schema")
+            .post("/validate-schema")
+            .with_json({"schema_id": "gts.x.testtraits.ovr.event.v1~x.testtraits._.audit.v1~x.testtraits._.notify.v1~"})
+            .validate()
+            .assert_equal("status_code", 200)
+            .assert_equal("body.ok", False)
+        ),
+    ]
+
+
+class TestCaseEffectiveTraits_NoTraitSchema(HttpRunner):
+    """A chain without trait schemas has empty effective traits; unknown and non-type IDs are rejected."""
+    config = Config("Effective traits - no trait schema").base_url(get_gts_base_url())
+
+    def test_start(self):
+        super().test_start()
+
+    teststeps = [
+        _register(
+            "gts://gts.x.testtraits.none.item.v1~",
+            {"type": "object", "properties": {"id": {"type": "string"}}},
+            "register schema without traits",
+        ),
+        Step(
+            _traits("gts.x.testtraits.none.item.v1~", "traits of a schema without traits")
+            .assert_equal("body.ok", True)
+            .assert_equal("body.traits", {})
+        ),
+        Step(
+            RunRequest("unregistered type")
+            .get("/traits/gts.x.testtraits.none.unknown.v1~")
+            .validate()
+            .assert_equal("status_code", 404)
+        ),
+        Step(
+            RunRequest("instance identifier is not a type")
+            .get("/traits/gts.x.testtraits.none.item.v1~x.vendor._.one.v1")
+            .validate()
+            .assert_equal("status_code", 422)
+        ),
+    ]
+
+
+# -- caching: cost independent of chain length, recomputed on re-registration ---
+
+CHAIN_DEPTH = 12
+LOOKUPS = 300
+# p50 for the deep type may exceed the p50 for the base by this factor plus slack
+CACHE_TOLERANCE = 1.5
+CACHE_SLACK_MS = 1.0
+
+
+def _traits_p50(session: requests.Session, type_id: str) -> float:
+    url = get_gts_base_url() + f"/traits/{type_id}"
+    samples = []
+    for _ in range(LOOKUPS):
+        start = time.perf_counter()
+        r = session.get(url, timeout=30)
+        samples.append((time.perf_counter() - start) * 1000.0)
+        assert r.status_code == 200, r.text
+    return statistics.median(samples[LOOKUPS // 10:])
+
+
+def _chain(package: str) -> typing.Tuple[typing.List[str], typing.List[dict]]:
+    """CHAIN_DEPTH schemas, each one adding a trait with a default and setting the previous one."""
+    ids = [f"gts.x.{package}.core.event.v1~"]
+    for k in range(1, CHAIN_DEPTH):
+        ids.append(f"{ids[-1]}x.{package}._.level_{k}.v1~")
+    schemas = []
+    for k, schema_id in enumerate(ids):
+        overlay = {
+            "type": "object",
+            "x-gts-traits-schema": {"type": "object", "properties": {f"trait_{k}": {"type": "integer", "default": 0}}},
+        }
+        if k:
+            overlay["x-gts-traits"] = {f"trait_{k - 1}": k}
+            schemas.append(gts_schema(schema_id, {"type": "object", "allOf": [{"$ref": f"gts://{ids[k - 1]}"}, overlay]}))
+        else:
+            schemas.append(gts_schema(schema_id, overlay))
+    return ids, schemas
+
+
+def test_effective_traits_are_cached_and_invalidated(record_property) -> None:
+    session = requests.Session()
+    ids, schemas = _chain(unique_package("testtraits"))
+    r = session.post(get_gts_base_url() + "/entities/bulk", json=schemas, timeout=60)
+    assert r.status_code == 200, r.text
+
+    leaf = session.get(get_gts_base_url() + f"/traits/{ids[-1]}", timeout=30).json()
+    assert leaf["ok"] is True, leaf
+    assert leaf["traits"] == {**{f"trait_{k}": k + 1 for k in range(CHAIN_DEPTH - 1)}, f"trait_{CHAIN_DEPTH - 1}": 0}
+
+    base_p50 = _traits_p50(session, ids[0])
+    leaf_p50 = _traits_p50(session, ids[-1])
+    record_property("base_p50_ms", round(base_p50, 3))
+    record_property("leaf_p50_ms", round(leaf_p50, 3))
+    limit = base_p50 * CACHE_TOLERANCE + CACHE_SLACK_MS
+    assert leaf_p50 <= limit, (
+        f"traits of a {CHAIN_DEPTH}-level type: p50 {leaf_p50:.3f} ms, limit {limit:.3f} ms "
+        f"({base_p50:.3f} ms for the base type)"
+    )
+
+    # a new default in the middle of the chain must show up in the leaf's traits
+    middle = CHAIN_DEPTH // 2
+    changed = schemas[middle]
+    changed["allOf"][1]["x-gts-traits-schema"]["properties"]["extra"] = {"type": "string", "default": "new"}
+    r = session.post(get_gts_base_url() + "/entities", json=changed, timeout=30)
+    assert r.status_code == 200, r.text
+    leaf = session.get(get_gts_base_url() + f"/traits/{ids[-1]}", timeout=30).json()
+    assert leaf["traits"].get("extra") == "new", leaf
@@ -0,0 +1,35 @@
+"""OP#1/OP#3 verdicts on a generated identifier corpus (see perf/corpus.py).
+
+A small, fixed sample of the benchmark corpus: valid and near-valid
+identifiers produced from the section 2.3 grammar, labelled with the
+section 8.2 regex. Larger runs and throughput numbers come from
+``python -m tests.perf.idbench``.
+"""
+
+import time
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .perf.corpus import generate
+
+CORPUS_SIZE = 2000
+CORPUS_SEED = 20240
+
+
+@pytest.mark.parametrize("path, verdict_field", [("/validate-id", "valid"), ("/parse-id", "ok")])
+def test_generated_corpus_verdicts(path: str, verdict_field: str, record_property) -> None:
+    session = requests.Session()
+    url = get_gts_base_url() + path
+    corpus = [entry for entry in generate(CORPUS_SIZE, CORPUS_SEED) if entry.valid is not None]
+    disagreements = []
+    start = time.perf_counter()
+    for entry in corpus:
+        r = session.get(url, params={"gts_id": entry.gts_id}, timeout=30)
+        assert r.status_code == 200, f"{entry.gts_id}: {r.status_code} {r.text[:200]}"
+        if r.json().get(verdict_field) is not entry.valid:
+            disagreements.append(f"{entry.mutation or entry.shape}: expected {entry.valid} for {entry.gts_id[:120]}")
+    ids_per_second = len(corpus) / (time.perf_counter() - start)
+    record_property("ids_per_second", round(ids_per_second, 1))
+    assert not disagreements, f"{len(disagreements)} verdicts differ: {disagreements[:5]}"
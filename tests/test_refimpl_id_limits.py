@@ -0,0 +1,113 @@
+"""Oversized identifiers must be rejected early (section 2.4).
+
+Megabyte-long identifiers and 1000-segment chains are sent to OP#1, OP#3
+and registration. Each must be refused, either by the operation itself
+(``valid: false``, ``ok: false``, ``422``) or by the HTTP layer before it
+(``413``, ``414``, ``431``, ``400``), and the refusal must take about as
+long as refusing an identifier one character over the limit: the cost of
+rejecting an identifier must not grow with its length.
+"""
+
+import statistics
+import time
+import typing
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema
+
+REPEATS = 3
+# absolute budget for one rejection, and allowed slowdown over rejecting a
+# barely oversized identifier (megabyte payloads still have to be sent)
+BUDGET_MS = 200.0
+MAX_SLOWDOWN = 10.0
+MEGABYTE = 1024 * 1024
+
+HTTP_REJECTIONS = (400, 413, 414, 431)
+SEGMENT = "a.b.c.d.v1"
+UUID_TAIL = "7a1d2f34-5678-49ab-9012-abcdef123456"
+
+OVERSIZED: typing.Dict[str, typing.Callable[[], str]] = {
+    # one character over the length limit; the reference point for latency
+    "length_1025": lambda: "gts." + "~".join(["x.pkg.ns.type_0001.v1.0"] * 41) + "~x.pkg.ns." + "t" * 24 + ".v1~",
+    "chain_1000_segments": lambda: "gts." + "~".join([SEGMENT] * 1000) + "~",
+    "chain_1000_segments_instance": lambda: "gts." + "~".join([SEGMENT] * 1000),
+    "chain_1000_segments_uuid": lambda: "gts." + "~".join([SEGMENT] * 1000) + "~" + UUID_TAIL,
+    "token_1mb": lambda: "gts.x.pkg.ns." + "t" * MEGABYTE + ".v1~",
+    "version_1mb": lambda: "gts.x.pkg.ns.type.v1" + "0" * MEGABYTE + "~",
+    "chain_1mb": lambda: "gts." + "~".join([SEGMENT] * (MEGABYTE // (len(SEGMENT) + 1))) + "~",
+}
+REFERENCE = "length_1025"
+
+
+def _median_ms(call: typing.Callable[[], requests.Response]) -> typing.Tuple[float, requests.Response]:
+    samples = []
+    response = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        response = call()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    assert response is not None
+    return statistics.median(samples), response
+
+
+def _check_latency(label: str, latency: float, reference: float) -> None:
+    limit = max(BUDGET_MS, reference * MAX_SLOWDOWN)
+    assert latency <= limit, f"{label}: rejected in {latency:.1f} ms, limit {limit:.1f} ms"
+
+
+def _get(session: requests.Session, path: str, gts_id: str) -> requests.Response:
+    return session.get(get_gts_base_url() + path, params={"gts_id": gts_id}, timeout=30)
+
+
+def _post(session: requests.Session, body: dict) -> requests.Response:
+    return session.post(get_gts_base_url() + "/entities", json=body, timeout=30)
+
+
+def _schema(schema_id: str, **body: typing.Any) -> dict:
+    return gts_schema(schema_id, {"type": "object", **body})
+
+
+REGISTRATIONS: typing.Dict[str, typing.Callable[[str], dict]] = {
+    "schema_id": lambda gts_id: _schema(gts_id),
+    "schema_ref": lambda gts_id: _schema(
+        "gts.x.testlimits.core.holder.v1~",
+        allOf=[{"$ref": f"gts://{gts_id}"}],
+    ),
+    "instance_id": lambda gts_id: {"id": gts_id, "name": "oversized"},
+}
+
+
+@pytest.fixture(scope="module")
+def session() -> requests.Session:
+    return requests.Session()
+
+
+@pytest.mark.parametrize("path, verdict_field", [("/validate-id", "valid"), ("/parse-id", "ok")])
+def test_oversized_id_is_rejected_early(session: requests.Session, path: str, verdict_field: str, record_property) -> None:
+    reference, _ = _median_ms(lambda: _get(session, path, OVERSIZED[REFERENCE]()))
+    for name, make in sorted(OVERSIZED.items()):
+        gts_id = make()
+        latency, r = _median_ms(lambda: _get(session, path, gts_id))
+        record_property(f"{name}_ms", round(latency, 3))
+        if r.status_code == 200:
+            body = r.json()
+            assert body[verdict_field] is False, f"{path} accepted {name} ({len(gts_id)} chars)"
+            assert body.get("error"), f"{path}: no error for {name}"
+        else:
+            assert r.status_code in HTTP_REJECTIONS, f"{path} {name}: {r.status_code} {r.text[:200]}"
+        _check_latency(f"{path} {name} ({len(gts_id)} chars)", latency, reference)
+
+
+@pytest.mark.parametrize("where", sorted(REGISTRATIONS))
+def test_oversized_id_registration_is_rejected_early(session: requests.Session, where: str, record_property) -> None:
+    make_body = REGISTRATIONS[where]
+    reference, _ = _median_ms(lambda: _post(session, make_body(OVERSIZED[REFERENCE]())))
+    for name, make in sorted(OVERSIZED.items()):
+        body = make_body(make())
+        latency, r = _median_ms(lambda: _post(session, body))
+        record_property(f"{name}_ms", round(latency, 3))
+        assert r.status_code in (422, 413), f"{where} {name}: {r.status_code} {r.text[:200]}"
+        _check_latency(f"{where} {name}", latency, reference)
@@ -0,0 +1,98 @@
+"""Pathological OP#1 inputs must be rejected in linear time (section 8.3).
+
+Every input below is a near miss: a long, mostly well-formed identifier
+that fails only at its end, which is the worst case for validators that
+backtrack or re-validate chain prefixes. Each one is sent to /validate-id
+near the 1024-character limit and well above it. Verdicts must be
+``valid: false`` and the latency must stay within a small budget over a
+short valid identifier.
+"""
+
+import statistics
+import time
+import typing
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+
+REPEATS = 5
+# allowed latency over the baseline: a budget, or a factor for slow hosts
+BUDGET_MS = 20.0
+MAX_SLOWDOWN = 5.0
+# just below the 1024-character limit and far above it; kept well under
+# common HTTP request-line limits (8 KiB)
+SIZES = (1000, 6000)
+
+SEGMENT = "a.b.c.d.v1.2~"
+
+
+def _fill(head: str, unit: str, tail: str, size: int) -> str:
+    return head + unit * max(1, (size - len(head) - len(tail)) // len(unit)) + tail
+
+
+PATHOLOGICAL: typing.Dict[str, typing.Callable[[int], str]] = {
+    # long valid chain, bad final character
+    "chain_bad_tail": lambda n: _fill("gts.", SEGMENT, "A", n),
+    # long valid chain, last segment without version
+    "chain_missing_version": lambda n: _fill("gts.", SEGMENT, "a.b.c.d.", n),
+    # long chain ending in a truncated UUID
+    "chain_bad_uuid": lambda n: _fill("gts.", SEGMENT, "0123abcd-0123-4567-89ab-0123456789a", n),
+    # minor-version repetition: v1.2.2.2...
+    "repeated_minor": lambda n: _fill("gts.a.b.c.d.v1", ".2", "~", n),
+    # digit run followed by an invalid character
+    "digit_run": lambda n: _fill("gts.a.b.c.d.v1", "1", "x~", n),
+    # token run: far too many dot-separated tokens before the version
+    "token_run": lambda n: _fill("gts.", "a.", "v1~", n),
+    # tilde run after a valid type
+    "tilde_run": lambda n: _fill("gts.a.b.c.d.v1", "~", "x", n),
+    # whitespace run (not permitted anywhere in an identifier)
+    "whitespace_run": lambda n: _fill("gts.a.b.c.d.v1~", " ", "x", n),
+    # alternating segment/UUID-like prefixes
+    "uuid_like_segments": lambda n: _fill("gts.a.b.c.d.v1", "~abcdef01.b.c.d.v1", "~abcdef01-", n),
+}
+
+
+def _median_latency_ms(session: requests.Session, gts_id: str) -> typing.Tuple[float, dict]:
+    url = get_gts_base_url() + "/validate-id"
+    samples = []
+    body: dict = {}
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        r = session.get(url, params={"gts_id": gts_id}, timeout=30)
+        samples.append((time.perf_counter() - start) * 1000.0)
+        assert r.status_code == 200, f"{r.status_code}: {r.text[:200]}"
+        body = r.json()
+    return statistics.median(samples), body
+
+
+@pytest.fixture(scope="module")
+def baseline_ms() -> float:
+    session = requests.Session()
+    _median_latency_ms(session, "gts.x.core.events.type.v1~")  # warm up the connection
+    latency, body = _median_latency_ms(session, "gts.x.core.events.type.v1~x.commerce.orders.order_placed.v1.0~")
+    assert body["valid"] is True
+    return latency
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("family", sorted(PATHOLOGICAL))
+def test_pathological_id_is_rejected_quickly(family: str, size: int, baseline_ms: float, record_property) -> None:
+    gts_id = PATHOLOGICAL[family](size)
+    latency, body = _median_latency_ms(requests.Session(), gts_id)
+    record_property("latency_ms", round(latency, 3))
+    assert body["valid"] is False, f"{family} ({len(gts_id)} chars) was accepted"
+    limit = max(baseline_ms + BUDGET_MS, baseline_ms * MAX_SLOWDOWN)
+    assert latency <= limit, (
+        f"{family} ({len(gts_id)} chars): {latency:.1f} ms, "
+        f"limit {limit:.1f} ms (baseline {baseline_ms:.1f} ms)"
+    )
+
+
+def test_long_valid_chain_is_accepted_quickly(baseline_ms: float) -> None:
+    gts_id = _fill("gts.", SEGMENT, "", 1020)
+    assert len(gts_id) <= 1024
+    latency, body = _median_latency_ms(requests.Session(), gts_id)
+    assert body["valid"] is True, body
+    assert latency <= max(baseline_ms + BUDGET_MS, baseline_ms * MAX_SLOWDOWN)
@@ -0,0 +1,166 @@
+"""Incremental OP#12 validation against cached parent constraints (section 9.12.2).
+
+Each family is one base type with BASE_FIELDS constrained properties, one
+middle layer tightening some of them and a number of leaf types, each
+tightening one property and adding one of its own. All leaves are
+validated with /validate-schema:
+
+- the total time must grow near-linearly from SMALL to LARGE leaves;
+- the time per leaf must not depend on the size of the shared ancestry
+  (BASE_FIELDS versus LIGHT_FIELDS properties);
+- verdicts must still reflect every ancestor's constraints.
+"""
+
+import statistics
+import time
+import typing
+import uuid
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema, unique_package
+
+SMALL = 1000
+LARGE = 5000
+BASE_FIELDS = 200
+LIGHT_FIELDS = 2
+# LARGE leaves may take at most this factor over LARGE / SMALL times the SMALL run, plus slack
+SCALING_TOLERANCE = 1.3
+SCALING_SLACK_MS = 200.0
+# leaf p50 below the large ancestry vs below the light one
+ANCESTRY_TOLERANCE = 1.5
+ANCESTRY_SLACK_MS = 1.0
+
+
+class Family(typing.NamedTuple):
+    package: str
+    base: str
+    middle: str
+    leaves: typing.List[str]
+
+
+def _derived(schema_id: str, parent: str, properties: dict) -> dict:
+    return gts_schema(schema_id, {
+        "type": "object",
+        "allOf": [{"$ref": f"gts://{parent}"}, {"type": "object", "properties": properties}],
+    })
+
+
+def _field(k: int) -> dict:
+    kinds = (
+        {"type": "string", "maxLength": 128},
+        {"type": "integer", "minimum": 0, "maximum": 1000},
+        {"type": "string", "enum": ["a", "b", "c", "d"]},
+        {"type": "string", "pattern": "^[a-z]+$"},
+    )
+    return dict(kinds[k % len(kinds)])
+
+
+def _tightened(k: int) -> dict:
+    tighter = (
+        {"type": "string", "maxLength": 64},
+        {"type": "integer", "minimum": 10, "maximum": 500},
+        {"type": "string", "enum": ["a", "b"]},
+        {"type": "string", "pattern": "^[a-z]+$", "maxLength": 32},
+    )
+    return dict(tighter[k % len(tighter)])
+
+
+def _family(fields: int, leaves: int) -> Family:
+    package = unique_package("testincr")
+    base = f"gts.x.{package}.core.record.v1~"
+    middle = f"{base}x.{package}._.middle.v1~"
+    leaf_ids = [f"{middle}x.{package}._.leaf_{n}.v1~" for n in range(leaves)]
+    entities = [
+        gts_schema(base, {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": {"type": "string"}, **{f"field_{k}": _field(k) for k in range(fields)}},
+        }),
+        _derived(middle, base, {f"field_{k}": _tightened(k) for k in range(0, fields, 2)}),
+    ]
+    for n, leaf in enumerate(leaf_ids):
+        # odd fields are tightened here for the first time, even ones repeat the middle layer
+        k = n % fields
+        entities.append(_derived(leaf, middle, {f"field_{k}": _tightened(k), f"own_{n}": {"type": "string"}}))
+    r = requests.post(get_gts_base_url() + "/entities/bulk", json=entities, timeout=600)
+    assert r.status_code == 200, r.text[:500]
+    return Family(package, base, middle, leaf_ids)
+
+
+def _validate(session: requests.Session, schema_id: str) -> typing.Tuple[float, dict]:
+    start = time.perf_counter()
+    r = session.post(get_gts_base_url() + "/validate-schema", json={"schema_id": schema_id}, timeout=60)
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    assert r.status_code == 200, r.text[:500]
+    return elapsed_ms, r.json()
+
+
+def _validate_leaves(family: Family) -> typing.Tuple[float, float]:
+    """Validate every leaf once; returns (total ms, p50 ms per leaf)."""
+    session = requests.Session()
+    samples = []
+    for leaf in family.leaves:
+        elapsed_ms, body = _validate(session, leaf)
+        assert body["ok"] is True, body
+        samples.append(elapsed_ms)
+    return sum(samples), statistics.median(samples)
+
+
+def test_leaf_validation_scales_linearly(record_property) -> None:
+    small_total, small_p50 = _validate_leaves(_family(BASE_FIELDS, SMALL))
+    large_total, _ = _validate_leaves(_family(BASE_FIELDS, LARGE))
+    _, light_p50 = _validate_leaves(_family(LIGHT_FIELDS, SMALL))
+    record_property(f"validate_{SMALL}_leaves_ms", round(small_total, 1))
+    record_property(f"validate_{LARGE}_leaves_ms", round(large_total, 1))
+    record_property("leaf_p50_ms", round(small_p50, 3))
+    record_property("leaf_p50_light_ancestry_ms", round(light_p50, 3))
+
+    limit = small_total * LARGE / SMALL * SCALING_TOLERANCE + SCALING_SLACK_MS
+    assert large_total <= limit, (
+        f"validating {LARGE} leaves took {large_total:.0f} ms, limit {limit:.0f} ms "
+        f"({small_total:.0f} ms for {SMALL} leaves)"
+    )
+    limit = light_p50 * ANCESTRY_TOLERANCE + ANCESTRY_SLACK_MS
+    assert small_p50 <= limit, (
+        f"leaf below a {BASE_FIELDS}-property ancestry: p50 {small_p50:.3f} ms, limit {limit:.3f} ms "
+        f"({light_p50:.3f} ms below a {LIGHT_FIELDS}-property ancestry)"
+    )
+
+
+@pytest.fixture(scope="module")
+def family() -> Family:
+    return _family(BASE_FIELDS, 10)
+
+
+def _register(entity: dict) -> None:
+    r = requests.post(get_gts_base_url() + "/entities", json=entity, timeout=30)
+    assert r.status_code == 200, r.text
+
+
+@pytest.mark.parametrize("field, prop", [
+    # field_0 has maxLength 128 in the base and 64 in the middle layer
+    ("field_0", {"type": "string", "maxLength": 100}),
+    ("field_0", {"type": "string", "maxLength": 256}),
+    # field_1 is only constrained by the base
+    ("field_1", {"type": "integer", "minimum": -5}),
+    ("field_3", {"type": "string"}),
+])
+def test_leaf_loosening_an_ancestor_fails(family: Family, field: str, prop: dict) -> None:
+    leaf = f"{family.middle}x.{family.package}._.loose_{uuid.uuid4().hex[:8]}.v1~"
+    _register(_derived(leaf, family.middle, {field: prop}))
+    _, body = _validate(requests.Session(), leaf)
+    assert body["ok"] is False, body
+
+
+def test_leaf_below_invalid_parent_fails(family: Family) -> None:
+    bad_middle = f"{family.base}x.{family.package}._.bad_middle.v1~"
+    leaf = f"{bad_middle}x.{family.package}._.leaf.v1~"
+    _register(_derived(bad_middle, family.base, {"field_1": {"type": "integer", "maximum": 5000}}))
+    _register(_derived(leaf, bad_middle, {"field_2": {"type": "string", "enum": ["a"]}}))
+    session = requests.Session()
+    assert _validate(session, bad_middle)[1]["ok"] is False
+    _, body = _validate(session, leaf)
+    assert body["ok"] is False, body
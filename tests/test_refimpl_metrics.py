@@ -0,0 +1,57 @@
+"""Tests for the runtime metrics endpoint (GET /metrics, section 9.11)."""
+
+from .conftest import get_gts_base_url
+from httprunner import HttpRunner, Config, Step, RunRequest
+
+
+class TestCaseRefimplMetrics_Shape(HttpRunner):
+    """GET /metrics reports memory, registry size and uptime as integers."""
+    config = Config("Metrics - response shape").base_url(get_gts_base_url())
+
+    def test_start(self):
+        super().test_start()
+
+    teststeps = [
+        Step(
+            RunRequest("get runtime metrics")
+            .get("/metrics")
+            .validate()
+            .assert_equal("status_code", 200)
+            .assert_type_match("body.memory.rss_bytes", "int")
+            .assert_greater_than("body.memory.rss_bytes", 0)
+            .assert_type_match("body.memory.peak_rss_bytes", "int")
+            .assert_type_match("body.registry.entities", "int")
+            .assert_type_match("body.uptime_seconds", "int")
+        ),
+    ]
+
+
+class TestCaseRefimplMetrics_RegistryCount(HttpRunner):
+    """registry.entities counts registered entities."""
+    config = Config("Metrics - registry entity count").base_url(get_gts_base_url())
+
+    def test_start(self):
+        super().test_start()
+
+    teststeps = [
+        Step(
+            RunRequest("register schema")
+            .post("/entities")
+            .with_json({
+                "$$id": "gts://gts.x.testmetrics.core.item.v1~",
+                "$$schema": "http://json-schema.org/draft-07/schema#",
+                "type": "object",
+                "properties": {"id": {"type": "string"}},
+            })
+            .validate()
+            .assert_equal("status_code", 200)
+        ),
+        Step(
+            RunRequest("registry is not empty")
+            .get("/metrics")
+            .validate()
+            .assert_equal("status_code", 200)
+            .assert_greater_or_equals("body.registry.entities", 1)
+            .assert_greater_or_equals("body.memory.peak_rss_bytes", 1)
+        ),
+    ]
@@ -0,0 +1,155 @@
+"""Read replicas: a follower replicates registrations from its leader (section 9.3.2).
+
+These tests start their own leader and follower processes on free local
+ports with ``GTS_SERVER_CMD`` (see ``local_servers.py``); they are skipped
+when no start command is configured.
+"""
+
+import time
+import typing
+
+import pytest
+import requests
+
+from .helpers import gts_schema
+from .local_servers import LocalServer, require_server_command
+
+GENERATION_HEADER = "GTS-Registry-Generation"
+# section 9.3.2 asks for 1 second under nominal load; allow for slow CI hosts
+MAX_LAG_SECONDS = 2.0
+STREAM_SIZE = 50
+PACKAGE = "testreplica"
+BASE_ID = f"gts.x.{PACKAGE}.core.item.v1~"
+
+
+@pytest.fixture(scope="module")
+def leader() -> typing.Iterator[LocalServer]:
+    require_server_command()
+    with LocalServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def follower(leader: LocalServer) -> typing.Iterator[LocalServer]:
+    with LocalServer("--follow", leader.base_url) as server:
+        yield server
+
+
+def _derived(derived_id: str, seq: int) -> dict:
+    return gts_schema(derived_id, {
+        "type": "object",
+        "allOf": [
+            {"$ref": f"gts://{BASE_ID}"},
+            {"type": "object", "properties": {"seq": {"const": seq}}},
+        ],
+    })
+
+
+def _register(server: LocalServer, body: dict) -> int:
+    r = requests.post(server.base_url + "/entities", json=body, timeout=30)
+    assert r.status_code == 200, r.text
+    return int(r.headers[GENERATION_HEADER])
+
+
+def _applied_generation(server: LocalServer) -> int:
+    r = requests.get(server.base_url + "/metrics", timeout=30)
+    assert r.status_code == 200, r.text
+    return int(r.json()["registry"]["generation"])
+
+
+def _wait_for_generation(server: LocalServer, generation: int, timeout: float) -> float:
+    """Seconds until ``server`` has applied ``generation``; fails after ``timeout``."""
+    started = time.monotonic()
+    while True:
+        if _applied_generation(server) >= generation:
+            return time.monotonic() - started
+        if time.monotonic() - started > timeout:
+            pytest.fail(f"{server.base_url} did not reach generation {generation} within {timeout}s")
+        time.sleep(0.01)
+
+
+@pytest.fixture(scope="module")
+def base_type(leader: LocalServer) -> int:
+    return _register(leader, gts_schema(BASE_ID, {
+        "type": "object",
+        "required": ["id", "name"],
+        "properties": {"id": {"type": "string"}, "name": {"type": "string"}, "seq": {"type": "integer"}},
+    }))
+
+
+def test_follower_serves_replicated_reads(leader: LocalServer, follower: LocalServer, base_type: int) -> None:
+    derived_id = f"{BASE_ID}x.{PACKAGE}._.reads.v1~"
+    instance_id = f"{derived_id}x.{PACKAGE}._.obj.v1"
+    _register(leader, _derived(derived_id, 1))
+    generation = _register(leader, {"id": instance_id, "name": "replicated", "seq": 1})
+    _wait_for_generation(follower, generation, MAX_LAG_SECONDS)
+
+    r = requests.get(follower.base_url + "/query", params={"expr": BASE_ID + "*"}, timeout=30)
+    assert r.status_code == 200 and int(r.headers[GENERATION_HEADER]) >= generation
+    assert derived_id in r.text
+
+    r = requests.post(follower.base_url + "/validate-instance", json={"instance_id": instance_id}, timeout=30)
+    assert r.status_code == 200 and r.json()["ok"] is True, r.text
+
+    r = requests.get(follower.base_url + "/attr", params={"gts_with_path": f"{instance_id}@name"}, timeout=30)
+    assert r.status_code == 200 and r.json()["value"] == "replicated", r.text
+
+    r = requests.get(follower.base_url + "/resolve-relationships", params={"gts_id": derived_id}, timeout=30)
+    assert r.status_code == 200, r.text
+
+    # generation numbers are shared: a leader generation can pin a follower read
+    r = requests.get(
+        follower.base_url + "/query",
+        params={"expr": BASE_ID + "*"},
+        headers={GENERATION_HEADER: str(base_type)},
+        timeout=30,
+    )
+    assert r.status_code == 200 and derived_id not in r.text
+
+
+def test_follower_lag_is_bounded(leader: LocalServer, follower: LocalServer, base_type: int, record_property) -> None:
+    lags = []
+    for seq in range(STREAM_SIZE):
+        generation = _register(leader, _derived(f"{BASE_ID}x.{PACKAGE}._.stream_{seq}.v1~", seq))
+        lags.append(_wait_for_generation(follower, generation, MAX_LAG_SECONDS))
+    lags.sort()
+    record_property("follower_lag_p50_ms", round(lags[len(lags) // 2] * 1000, 1))
+    record_property("follower_lag_max_ms", round(lags[-1] * 1000, 1))
+
+    r = requests.get(
+        follower.base_url + "/query",
+        params={"expr": f"{BASE_ID}x.{PACKAGE}._.stream_*", "limit": 1000},
+        timeout=30,
+    )
+    assert r.status_code == 200
+    assert len(r.json()["results"]) == STREAM_SIZE
+
+
+def test_follower_does_not_accept_local_writes(leader: LocalServer, follower: LocalServer, base_type: int) -> None:
+    derived_id = f"{BASE_ID}x.{PACKAGE}._.via_follower.v1~"
+    r = requests.post(follower.base_url + "/entities", json=_derived(derived_id, 0), timeout=30)
+    if r.status_code == 405:
+        assert r.headers.get("GTS-Leader", "").rstrip("/") == leader.base_url
+        r = requests.get(f"{leader.base_url}/entities/{derived_id}", timeout=30)
+        assert r.status_code == 404
+        return
+
+    # forwarded: acknowledged only once the follower applied it (read-your-writes)
+    assert r.status_code == 200, r.text
+    for server in (follower, leader):
+        r = requests.get(f"{server.base_url}/entities/{derived_id}", timeout=30)
+        assert r.status_code == 200, f"{server.base_url}: {r.status_code}"
+
+
+def test_follower_keeps_serving_without_leader() -> None:
+    # stops its leader, so it runs on a pair of its own instead of the module one
+    derived_id = f"{BASE_ID}x.{PACKAGE}._.survivor.v1~"
+    with LocalServer() as leader, LocalServer("--follow", leader.base_url) as follower:
+        _register(leader, gts_schema(BASE_ID, {"type": "object"}))
+        generation = _register(leader, _derived(derived_id, 0))
+        _wait_for_generation(follower, generation, MAX_LAG_SECONDS)
+        leader.stop()
+
+        r = requests.get(f"{follower.base_url}/entities/{derived_id}", timeout=30)
+        assert r.status_code == 200
+        assert _applied_generation(follower) >= generation
@@ -0,0 +1,120 @@
+"""Bounded-time cycle detection in $ref graphs (section 9.12.4).
+
+Three generated graphs are registered without validation:
+
+- a ring of CYCLE_NODES types, each ``allOf``-referencing the next one;
+- a diamond DAG of LAYERS layers with two types per layer, each referencing
+  both types of the layer below (2 ** LAYERS paths, no cycle);
+- the same DAG with its bottom referencing its top (a cycle hidden behind
+  2 ** LAYERS paths).
+
+Every resolution endpoint must give the right verdict within BUDGET_MS of
+the same request on a 3-node graph of the same shape.
+"""
+
+import time
+import typing
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema, unique_package
+
+CYCLE_NODES = 1000
+LAYERS = 30
+SMALL_LAYERS = 3
+BUDGET_MS = 250.0
+# a server that does not terminate fails the test instead of hanging it
+TIMEOUT_S = 30
+
+
+class Graph(typing.NamedTuple):
+    entry: str
+    instance_id: str
+    ok: bool
+
+
+def _node(schema_id: str, refs: typing.Sequence[str], prop: str) -> dict:
+    return gts_schema(schema_id, {
+        "type": "object",
+        "allOf": [{"$ref": f"gts://{ref}"} for ref in refs] + [
+            {"type": "object", "properties": {prop: {"type": "integer"}}},
+        ],
+    })
+
+
+def _register(entities: typing.List[dict], entry: str, ok: bool) -> Graph:
+    instance_id = f"{entry}x.testcycles._.instance.v1"
+    r = requests.post(
+        get_gts_base_url() + "/entities/bulk",
+        json=entities + [{"id": instance_id}],
+        timeout=TIMEOUT_S,
+    )
+    assert r.status_code == 200, r.text[:500]
+    return Graph(entry, instance_id, ok)
+
+
+def _ring(nodes: int) -> Graph:
+    package = unique_package("testcycles")
+    ids = [f"gts.x.{package}.ring.node_{k}.v1~" for k in range(nodes)]
+    entities = [_node(ids[k], [ids[(k + 1) % nodes]], f"p_{k}") for k in range(nodes)]
+    return _register(entities, ids[0], ok=False)
+
+
+def _diamonds(layers: int, closed: bool) -> Graph:
+    package = unique_package("testcycles")
+    ids = [[f"gts.x.{package}.dag.{side}_{k}.v1~" for side in ("a", "b")] for k in range(layers + 1)]
+    entities = []
+    for k in range(layers):
+        for side in (0, 1):
+            entities.append(_node(ids[k][side], ids[k + 1], f"p_{k}_{side}"))
+    bottom_refs = [ids[0][0]] if closed else []
+    entities.append(_node(ids[layers][0], bottom_refs, "bottom_a"))
+    entities.append(_node(ids[layers][1], [], "bottom_b"))
+    return _register(entities, ids[0][0], ok=not closed)
+
+
+ENDPOINTS: typing.Dict[str, typing.Callable[[Graph], typing.Tuple[str, str, dict]]] = {
+    "validate-schema": lambda g: ("POST", "/validate-schema", {"json": {"schema_id": g.entry}}),
+    "validate-entity": lambda g: ("POST", "/validate-entity", {"json": {"entity_id": g.entry}}),
+    "validate-instance": lambda g: ("POST", "/validate-instance", {"json": {"instance_id": g.instance_id}}),
+    "resolve-relationships": lambda g: ("GET", "/resolve-relationships", {"params": {"gts_id": g.entry}}),
+}
+
+
+def _call(graph: Graph, endpoint: str) -> typing.Tuple[float, requests.Response]:
+    method, path, kwargs = ENDPOINTS[endpoint](graph)
+    start = time.perf_counter()
+    r = requests.request(method, get_gts_base_url() + path, timeout=TIMEOUT_S, **kwargs)
+    return (time.perf_counter() - start) * 1000.0, r
+
+
+GRAPHS: typing.Dict[str, typing.Callable[[], typing.Tuple[Graph, Graph]]] = {
+    "ring": lambda: (_ring(3), _ring(CYCLE_NODES)),
+    "diamonds": lambda: (_diamonds(SMALL_LAYERS, closed=False), _diamonds(LAYERS, closed=False)),
+    "closed_diamonds": lambda: (_diamonds(SMALL_LAYERS, closed=True), _diamonds(LAYERS, closed=True)),
+}
+
+
+@pytest.fixture(scope="module", params=sorted(GRAPHS))
+def graphs(request) -> typing.Tuple[str, Graph, Graph]:
+    small, large = GRAPHS[request.param]()
+    return request.param, small, large
+
+
+@pytest.mark.parametrize("endpoint", sorted(ENDPOINTS))
+def test_resolution_is_bounded(graphs: typing.Tuple[str, Graph, Graph], endpoint: str, record_property) -> None:
+    name, small, large = graphs
+    baseline, r = _call(small, endpoint)
+    assert r.status_code == 200, r.text[:500]
+    elapsed, r = _call(large, endpoint)
+    assert r.status_code == 200, r.text[:500]
+    record_property(f"{name}_{endpoint}_ms", round(elapsed, 3))
+
+    if endpoint != "resolve-relationships":
+        assert r.json()["ok"] is large.ok, r.text[:500]
+    assert elapsed <= baseline + BUDGET_MS, (
+        f"{endpoint} on {name} took {elapsed:.1f} ms "
+        f"({baseline:.1f} ms on the small graph, budget {BUDGET_MS} ms)"
+    )
@@ -0,0 +1,138 @@
+"""Reverse x-gts-ref index: GET /referrers (section 9.6).
+
+Built on ``examples/modules``: the module instances reference capability
+instances (``capabilities``) and other modules (``requirements``) through
+``x-gts-ref``. The expected edges are read from the example files.
+"""
+
+import json
+import os
+import typing
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import unique_package
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "modules")
+CAPABILITY = "gts.x.core.modules.capability.v1~"
+MODULE = "gts.x.core.modules.module.v1~"
+HAS_WS = CAPABILITY + "x.core.api.has_ws.v1"
+CHAT = MODULE + "x.webstore._.chat.v1"
+CATALOG = MODULE + "x.webstore._.catalog.v1"
+# the module schema's x-gts-ref array fields
+REF_FIELDS = ("capabilities", "requirements")
+
+Edge = typing.Tuple[str, str, str]  # (referrer, path, target)
+
+
+def _load(*parts: str) -> typing.Any:
+    with open(os.path.join(EXAMPLES_DIR, *parts), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _register(body: dict) -> None:
+    r = requests.post(get_gts_base_url() + "/entities", json=body, timeout=30)
+    assert r.status_code == 200, r.text
+
+
+def _referrers(target: str, **params: typing.Any) -> dict:
+    r = requests.get(get_gts_base_url() + "/referrers", params={"target": target, **params}, timeout=30)
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def _edges(body: dict) -> typing.List[Edge]:
+    return [(item["id"], item["path"], item["target"]) for item in body["referrers"]]
+
+
+def _instance_edges(instance: dict) -> typing.List[Edge]:
+    return [
+        (instance["id"], f"/{field}/{k}", target)
+        for field in REF_FIELDS
+        for k, target in enumerate(instance.get(field, []))
+    ]
+
+
+@pytest.fixture(scope="module")
+def modules() -> typing.Dict[str, dict]:
+    for name in sorted(os.listdir(os.path.join(EXAMPLES_DIR, "schemas"))):
+        _register(_load("schemas", name))
+    instances = {}
+    for name in sorted(os.listdir(os.path.join(EXAMPLES_DIR, "instances"))):
+        instance = _load("instances", name)
+        _register(instance)
+        instances[instance["id"]] = instance
+    return instances
+
+
+@pytest.fixture(scope="module")
+def expected_edges(modules: typing.Dict[str, dict]) -> typing.List[Edge]:
+    return sorted(edge for instance in modules.values() for edge in _instance_edges(instance))
+
+
+def test_referrers_of_a_capability(expected_edges: typing.List[Edge]) -> None:
+    body = _referrers(HAS_WS)
+    assert body["target"] == HAS_WS
+    assert body["truncated"] is False
+    assert _edges(body) == [edge for edge in expected_edges if edge[2] == HAS_WS]
+    assert [edge[0] for edge in _edges(body)] == [CHAT]
+
+
+def test_referrers_of_a_module_through_requirements(expected_edges: typing.List[Edge]) -> None:
+    assert _edges(_referrers(CATALOG)) == [(CHAT, "/requirements/0", CATALOG)]
+
+
+def test_referrers_by_wildcard(expected_edges: typing.List[Edge]) -> None:
+    pattern = CAPABILITY + "x.core.api.*"
+    expected = sorted((edge for edge in expected_edges if edge[2].startswith(pattern[:-1])), key=lambda e: (e[2], e[0], e[1]))
+    body = _referrers(pattern)
+    assert _edges(body) == expected
+    assert {edge[0] for edge in expected} == {CHAT, CATALOG}
+
+
+def test_dangling_targets_are_indexed(modules: typing.Dict[str, dict]) -> None:
+    # a package of its own keeps the gateway out of the x.core.api.* wildcard above
+    package = unique_package("testreferrers")
+    has_grpc = CAPABILITY + f"x.{package}.api.has_grpc.v1"
+    gateway = MODULE + f"x.{package}._.grpc_gateway.v1"
+    _register({
+        "id": gateway,
+        "displayName": "WebStore gRPC Gateway",
+        "description": "Module referencing a capability that is not registered.",
+        "capabilities": [has_grpc],
+    })
+    assert has_grpc not in modules
+    assert requests.get(get_gts_base_url() + f"/entities/{has_grpc}", timeout=30).status_code != 200
+    assert _edges(_referrers(has_grpc)) == [(gateway, "/capabilities/0", has_grpc)]
+
+
+def test_self_identification_is_not_an_edge(modules: typing.Dict[str, dict]) -> None:
+    # capability instances carry their own id in an x-gts-ref "/$id" field
+    assert _edges(_referrers(HAS_WS))[0][0] != HAS_WS
+    assert all(edge[0] != HAS_WS for edge in _edges(_referrers(CAPABILITY + "*")))
+
+
+def test_limit_truncates(expected_edges: typing.List[Edge]) -> None:
+    body = _referrers(CAPABILITY + "*", limit=1)
+    assert len(body["referrers"]) == 1
+    assert body["truncated"] is True
+
+
+def test_reregistration_replaces_edges(modules: typing.Dict[str, dict]) -> None:
+    original = modules[CHAT]
+    without_ws = {**original, "capabilities": [c for c in original["capabilities"] if c != HAS_WS]}
+    try:
+        _register(without_ws)
+        assert _edges(_referrers(HAS_WS)) == []
+        assert CHAT in {edge[0] for edge in _edges(_referrers(CATALOG))}
+    finally:
+        _register(original)
+    assert [edge[0] for edge in _edges(_referrers(HAS_WS))] == [CHAT]
+
+
+@pytest.mark.parametrize("target", ["gts.x.core.modules.capability.v1~x.core.api.has_ws", "gts.x.core.*.capability", "not-a-gts-id"])
+def test_invalid_target_is_rejected(target: str) -> None:
+    r = requests.get(get_gts_base_url() + "/referrers", params={"target": target}, timeout=30)
+    assert r.status_code == 422, r.text
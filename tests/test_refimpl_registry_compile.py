@@ -0,0 +1,134 @@
+"""Registry warmup with POST /registry/compile (section 9.12.1).
+
+A base type with a trait schema, TYPES derived types and one well-known
+instance per derived type are registered in one bulk upload, then
+compiled by the warmup operation. Afterwards the first /validate-instance
+call of every type must be as fast as the steady state.
+"""
+
+import time
+import typing
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema, unique_package
+from .perf.stats import summarize
+
+GENERATION_HEADER = "GTS-Registry-Generation"
+TYPES = 200
+STEADY_ROUNDS = 5
+# first-call p50 may exceed the steady-state p50 by this factor plus slack
+TOLERANCE = 1.5
+SLACK_MS = 1.0
+
+
+def _entities(package: str) -> typing.Tuple[typing.List[dict], typing.List[str]]:
+    base_id = f"gts.x.{package}.core.item.v1~"
+    entities = [gts_schema(base_id, {
+        "type": "object",
+        "required": ["id", "name"],
+        "properties": {
+            "id": {"type": "string"},
+            "name": {"type": "string", "minLength": 1},
+            "tags": {"type": "array", "items": {"type": "string", "pattern": "^[a-z][a-z0-9-]*$"}},
+        },
+        "x-gts-traits-schema": {
+            "type": "object",
+            "properties": {
+                "retention": {"type": "string", "default": "P30D"},
+                "priority": {"type": "integer", "minimum": 0, "default": 1},
+            },
+        },
+    })]
+    instance_ids = []
+    for k in range(TYPES):
+        derived_id = f"{base_id}x.{package}._.kind_{k}.v1~"
+        entities.append(gts_schema(derived_id, {
+            "type": "object",
+            "allOf": [
+                {"$ref": f"gts://{base_id}"},
+                {
+                    "type": "object",
+                    "required": [f"field_{k}"],
+                    "properties": {f"field_{k}": {"type": "integer", "minimum": k}},
+                    "x-gts-traits": {"priority": k % 5},
+                },
+            ],
+        }))
+        instance_id = f"{derived_id}x.{package}._.item_{k}.v1"
+        entities.append({"id": instance_id, "name": f"item {k}", "tags": ["warm", "up"], f"field_{k}": k})
+        instance_ids.append(instance_id)
+    return entities, instance_ids
+
+
+def _compile(session: requests.Session, body: typing.Optional[dict]) -> requests.Response:
+    r = session.post(get_gts_base_url() + "/registry/compile", json=body, timeout=300)
+    assert r.status_code == 200, r.text
+    return r
+
+
+def _validate(session: requests.Session, instance_id: str) -> float:
+    start = time.perf_counter()
+    r = session.post(get_gts_base_url() + "/validate-instance", json={"instance_id": instance_id}, timeout=30)
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    assert r.status_code == 200, r.text
+    assert r.json()["ok"] is True, f"{instance_id}: {r.text}"
+    return elapsed_ms
+
+
+@pytest.fixture(scope="module")
+def session() -> requests.Session:
+    return requests.Session()
+
+
+@pytest.fixture
+def registered(session: requests.Session) -> typing.Tuple[str, typing.List[str]]:
+    package = unique_package("testwarm")
+    entities, instance_ids = _entities(package)
+    r = session.post(get_gts_base_url() + "/entities/bulk", json=entities, timeout=300)
+    assert r.status_code == 200, r.text
+    return package, instance_ids
+
+
+def test_compile_reports_selected_types(session: requests.Session, registered: typing.Tuple[str, typing.List[str]]) -> None:
+    package, _ = registered
+    r = _compile(session, {"pattern": f"gts.x.{package}.*", "workers": 4})
+    body = r.json()
+    assert body["ok"] is True, body
+    assert body["errors"] == []
+    assert body["types"] == TYPES + 1
+    assert body["compiled"] == TYPES + 1
+    assert 1 <= body["workers"] <= 4
+    if GENERATION_HEADER in r.headers:
+        assert int(r.headers[GENERATION_HEADER]) == body["generation"]
+
+
+def test_compile_without_body_covers_all_types(session: requests.Session, registered: typing.Tuple[str, typing.List[str]]) -> None:
+    body = _compile(session, None).json()
+    assert body["types"] >= TYPES + 1
+    assert body["compiled"] + len(body["errors"]) == body["types"]
+
+
+def test_first_call_after_warmup_matches_steady_state(
+    session: requests.Session, registered: typing.Tuple[str, typing.List[str]], record_property,
+) -> None:
+    package, instance_ids = registered
+    session.get(get_gts_base_url() + "/validate-id", params={"gts_id": instance_ids[0]}, timeout=30)  # warm up the connection
+    compile_ms = _compile(session, {"pattern": f"gts.x.{package}.*"}).json()["elapsed_ms"]
+
+    first = summarize([_validate(session, instance_id) for instance_id in instance_ids])
+    steady = summarize([
+        _validate(session, instance_id)
+        for _ in range(STEADY_ROUNDS)
+        for instance_id in instance_ids
+    ])
+    record_property("compile_ms", compile_ms)
+    record_property("first_p50_ms", first["p50_ms"])
+    record_property("steady_p50_ms", steady["p50_ms"])
+    limit = steady["p50_ms"] * TOLERANCE + SLACK_MS
+    assert first["p50_ms"] <= limit, (
+        f"first-call p50 {first['p50_ms']} ms after warmup exceeds {limit:.3f} ms "
+        f"(steady state p50 {steady['p50_ms']} ms)"
+    )
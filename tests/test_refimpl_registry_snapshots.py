@@ -0,0 +1,187 @@
+"""Snapshot-isolated registry reads (section 9.3.1).
+
+Registrations publish numbered registry generations; every read is
+evaluated against exactly one generation, reported in the
+GTS-Registry-Generation response header, and can be pinned to an earlier
+generation with the same request header.
+"""
+
+import concurrent.futures
+import threading
+import typing
+
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema, result_id, unique_package
+
+GENERATION_HEADER = "GTS-Registry-Generation"
+BULK_SIZE = 20
+ROUNDS = 30
+
+
+def _generation(response: requests.Response) -> int:
+    assert GENERATION_HEADER in response.headers, (
+        f"{response.request.method} {response.request.path_url} "
+        f"did not report {GENERATION_HEADER}"
+    )
+    return int(response.headers[GENERATION_HEADER])
+
+
+def _derived(base_id: str, derived_id: str, overlay: dict) -> dict:
+    return gts_schema(derived_id, {
+        "type": "object",
+        "allOf": [{"$ref": f"gts://{base_id}"}, overlay],
+    })
+
+
+def _register(body: typing.Any, bulk: bool = False) -> requests.Response:
+    url = get_gts_base_url() + ("/entities/bulk" if bulk else "/entities")
+    r = requests.post(url, json=body, timeout=30)
+    assert r.status_code == 200, r.text
+    return r
+
+
+def _query_ids(expr: str, generation: typing.Optional[int] = None) -> typing.Tuple[typing.Set[str], int]:
+    headers = {GENERATION_HEADER: str(generation)} if generation is not None else {}
+    r = requests.get(
+        get_gts_base_url() + "/query",
+        params={"expr": expr, "limit": 1000},
+        headers=headers,
+        timeout=30,
+    )
+    assert r.status_code == 200, r.text
+    return {result_id(item) for item in r.json().get("results", [])}, _generation(r)
+
+
+def test_registration_publishes_increasing_generations() -> None:
+    package = unique_package("testsnap")
+    base_id = f"gts.x.{package}.core.item.v1~"
+    first = _generation(_register(gts_schema(base_id, {"type": "object"})))
+    second = _generation(_register(_derived(base_id, f"{base_id}x.{package}._.a.v1~", {"type": "object"})))
+    assert second > first
+
+    r = requests.get(get_gts_base_url() + "/metrics", timeout=30)
+    assert r.status_code == 200
+    assert r.json()["registry"]["generation"] >= second
+
+
+def test_pinned_read_sees_registry_as_of_that_generation() -> None:
+    package = unique_package("testsnap")
+    base_id = f"gts.x.{package}.core.item.v1~"
+    a_id = f"{base_id}x.{package}._.a.v1~"
+    b_id = f"{base_id}x.{package}._.b.v1~"
+    _register(gts_schema(base_id, {"type": "object"}))
+    g1 = _generation(_register(_derived(base_id, a_id, {"type": "object"})))
+    g2 = _generation(_register(_derived(base_id, b_id, {"type": "object"})))
+
+    ids, generation = _query_ids(base_id + "*", g1)
+    assert (ids, generation) == ({a_id}, g1)
+    ids, generation = _query_ids(base_id + "*")
+    assert ids == {a_id, b_id} and generation >= g2
+
+    pinned = {GENERATION_HEADER: str(g1)}
+    r = requests.get(f"{get_gts_base_url()}/entities/{b_id}", headers=pinned, timeout=30)
+    assert r.status_code == 404
+    r = requests.get(f"{get_gts_base_url()}/entities/{a_id}", headers=pinned, timeout=30)
+    assert r.status_code == 200 and _generation(r) == g1
+
+
+def test_pinned_read_of_unpublished_generation_is_rejected() -> None:
+    _, current = _query_ids("gts.x.*")
+    r = requests.get(
+        get_gts_base_url() + "/query",
+        params={"expr": "gts.x.*"},
+        headers={GENERATION_HEADER: str(current + 1_000_000)},
+        timeout=30,
+    )
+    assert r.status_code == 422
+
+
+def test_bulk_registration_is_published_as_one_generation() -> None:
+    """Concurrent readers see none or all of a bulk upload, never a part of it."""
+    package = unique_package("testsnap")
+    base_id = f"gts.x.{package}.core.item.v1~"
+    _register(gts_schema(base_id, {"type": "object"}))
+    batches = [
+        [_derived(base_id, f"{base_id}x.{package}._.r{r}_{i}.v1~", {"type": "object"}) for i in range(BULK_SIZE)]
+        for r in range(ROUNDS)
+    ]
+    done = threading.Event()
+
+    def reader() -> typing.List[int]:
+        partial = []
+        while not done.is_set():
+            ids, _ = _query_ids(base_id + "*")
+            if len(ids) % BULK_SIZE:
+                partial.append(len(ids))
+        return partial
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        readers = [pool.submit(reader) for _ in range(3)]
+        for batch in batches:
+            _register(batch, bulk=True)
+        done.set()
+        partial = [count for future in readers for count in future.result()]
+
+    assert not partial, f"readers observed partially published bulk uploads: {partial[:10]}"
+    ids, _ = _query_ids(base_id + "*")
+    assert len(ids) == BULK_SIZE * ROUNDS
+
+
+def test_validation_never_mixes_generations() -> None:
+    """Each generation replaces base schema, derived schema and instance together.
+
+    Generation k requires ``a == k`` in the base and ``b == k`` in the derived
+    schema, and the instance carries ``a = b = k``. The instance is valid in
+    every single generation, but invalid for any mix of two generations, so
+    every concurrent /validate-instance must report ``ok``.
+    """
+    package = unique_package("testsnap")
+    base_id = f"gts.x.{package}.core.item.v1~"
+    derived_id = f"{base_id}x.{package}._.leaf.v1~"
+    instance_id = f"{derived_id}x.{package}._.obj.v1"
+
+    def generation(k: int) -> list:
+        return [
+            gts_schema(base_id, {
+                "type": "object",
+                "required": ["a"],
+                "properties": {"id": {"type": "string"}, "a": {"const": k}},
+            }),
+            _derived(base_id, derived_id, {
+                "type": "object",
+                "required": ["b"],
+                "properties": {"b": {"const": k}},
+            }),
+            {"id": instance_id, "a": k, "b": k},
+        ]
+
+    _register(generation(0), bulk=True)
+    done = threading.Event()
+
+    def reader(pinned: typing.Optional[int]) -> typing.List[str]:
+        failures = []
+        headers = {GENERATION_HEADER: str(pinned)} if pinned is not None else {}
+        while not done.is_set():
+            r = requests.post(
+                get_gts_base_url() + "/validate-instance",
+                json={"instance_id": instance_id},
+                headers=headers,
+                timeout=30,
+            )
+            if r.status_code != 200 or r.json().get("ok") is not True:
+                failures.append(f"{r.status_code}: {r.text[:200]}")
+            elif pinned is not None and _generation(r) != pinned:
+                failures.append(f"pinned to {pinned}, evaluated against {_generation(r)}")
+        return failures
+
+    _, pinned = _query_ids(base_id + "*")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        readers = [pool.submit(reader, None) for _ in range(2)] + [pool.submit(reader, pinned)]
+        for k in range(1, ROUNDS + 1):
+            _register(generation(k), bulk=True)
+        done.set()
+        failures = [failure for future in readers for failure in future.result()]
+
+    assert not failures, f"{len(failures)} validations mixed generations: {failures[:5]}"
@@ -0,0 +1,167 @@
+"""Vendor-sharded registry behind a router (section 9.3.3).
+
+Starts three shard processes and a router with ``GTS_SERVER_CMD`` (see
+``local_servers.py``; skipped when no start command is configured):
+
+- shard ``x`` owns vendor ``x``,
+- shard ``abc`` owns vendor ``abc``,
+- shard ``rest`` owns every other vendor (``*``), including ``xyz``.
+
+The OP#7 relationship fixtures, including the multi-vendor chain, are
+replayed through the router, and cross-shard ``$ref`` chains are checked
+with validation and relationship resolution.
+"""
+
+import typing
+
+import pytest
+import requests
+
+from .helpers import gts_schema
+from .local_servers import LocalServer, free_port, require_server_command
+from .perf.workload import load_fixture_requests, send
+
+SHARD_VENDORS = {"x": "x", "abc": "abc", "rest": "*"}
+
+MULTI_VENDOR_CHAIN = (
+    "gts.x.platform.events.base.v1~"
+    "abc.app._.custom_event.v1~"
+    "xyz.plugin._.specialized.v1~"
+)
+X_BASE = "gts.x.platform.events.base.v1~"
+# the cross-shard chain has its own x base so it does not replace the OP#7 one
+X_CROSS_BASE = "gts.x.platform.events.cross_shard_base.v1~"
+ABC_EVENT = "gts.abc.app.events.custom.v1~"
+XYZ_AUDIT = "gts.xyz.plugin.events.audit.v1~"
+
+
+class Cluster(typing.NamedTuple):
+    router: LocalServer
+    shards: typing.Dict[str, LocalServer]
+
+
+@pytest.fixture(scope="module")
+def cluster() -> typing.Iterator[Cluster]:
+    require_server_command()
+    router_port = free_port()
+    router_url = f"http://127.0.0.1:{router_port}"
+    shards: typing.Dict[str, LocalServer] = {}
+    try:
+        for name in SHARD_VENDORS:
+            shards[name] = LocalServer("--router", router_url).start()
+        routes = []
+        for name, vendors in SHARD_VENDORS.items():
+            routes += ["--shard", f"{vendors}={shards[name].base_url}"]
+        with LocalServer(*routes, port=router_port) as router:
+            yield Cluster(router, shards)
+    finally:
+        for shard in shards.values():
+            shard.__exit__()
+
+
+def _register(server: LocalServer, body: typing.Any, bulk: bool = False) -> requests.Response:
+    return requests.post(
+        server.base_url + ("/entities/bulk" if bulk else "/entities"), json=body, timeout=30
+    )
+
+
+def _entity_status(server: LocalServer, gts_id: str) -> int:
+    return requests.get(f"{server.base_url}/entities/{gts_id}", timeout=30).status_code
+
+
+@pytest.fixture(scope="module")
+def op7_failures(cluster: Cluster) -> typing.List[str]:
+    """Replay the OP#7 fixtures through the router; return the mismatches."""
+    failures = []
+    for fixture in load_fixture_requests(["test_op7_relationship_resolution"]):
+        _, ok = send(cluster.router.base_url, fixture)
+        if not ok:
+            failures.append(f"{fixture.source}: {fixture.method} {fixture.path} != {fixture.expected_status}")
+    return failures
+
+
+@pytest.fixture(scope="module")
+def cross_shard_chain(cluster: Cluster) -> None:
+    """xyz (shard rest) -> abc (shard abc) -> x (shard x) via plain $ref."""
+    r = _register(cluster.router, gts_schema(X_CROSS_BASE, {
+        "type": "object",
+        "required": ["eventId", "timestamp"],
+        "properties": {"eventId": {"type": "string"}, "timestamp": {"type": "string"}},
+    }))
+    assert r.status_code == 200, r.text
+    r = _register(cluster.router, [
+        gts_schema(ABC_EVENT, {
+            "type": "object",
+            "allOf": [
+                {"$ref": f"gts://{X_CROSS_BASE}"},
+                {"required": ["vendorData"], "properties": {"vendorData": {"type": "object"}}},
+            ],
+        }),
+        gts_schema(XYZ_AUDIT, {
+            "type": "object",
+            "allOf": [
+                {"$ref": f"gts://{ABC_EVENT}"},
+                {"properties": {"actor": {"type": "string"}}},
+            ],
+        }),
+        {"id": f"{XYZ_AUDIT}xyz.plugin._.complete.v1", "eventId": "e1", "timestamp": "t", "vendorData": {}},
+        # misses eventId, required by the x base two shards away
+        {"id": f"{XYZ_AUDIT}xyz.plugin._.incomplete.v1", "timestamp": "t", "vendorData": {}},
+    ], bulk=True)
+    assert r.status_code == 200, r.text
+
+
+def test_op7_fixtures_through_router(op7_failures: typing.List[str]) -> None:
+    assert not op7_failures, "\n".join(op7_failures)
+
+
+def test_chain_is_placed_on_leftmost_vendor_shard(cluster: Cluster, op7_failures: typing.List[str]) -> None:
+    # registered by the OP#7 multi-vendor fixture; the whole chain belongs
+    # to vendor x although abc and xyz appear in it
+    for gts_id in (X_BASE, X_BASE + "abc.app._.custom_event.v1~", MULTI_VENDOR_CHAIN):
+        assert _entity_status(cluster.router, gts_id) == 200, gts_id
+        assert _entity_status(cluster.shards["x"], gts_id) == 200, gts_id
+        assert _entity_status(cluster.shards["abc"], gts_id) == 404, gts_id
+        assert _entity_status(cluster.shards["rest"], gts_id) == 404, gts_id
+
+    r = requests.get(
+        cluster.router.base_url + "/resolve-relationships",
+        params={"gts_id": MULTI_VENDOR_CHAIN},
+        timeout=30,
+    )
+    assert r.status_code == 200, r.text
+
+
+def test_misplaced_registration_is_rejected(cluster: Cluster) -> None:
+    r = _register(cluster.shards["abc"], gts_schema("gts.x.platform.events.misplaced.v1~", {"type": "object"}))
+    assert r.status_code == 421, r.text
+
+
+def test_cross_shard_refs_resolve(cluster: Cluster, cross_shard_chain: None) -> None:
+    router = cluster.router
+    assert _entity_status(cluster.shards["x"], X_CROSS_BASE) == 200
+    assert _entity_status(cluster.shards["abc"], ABC_EVENT) == 200
+    assert _entity_status(cluster.shards["rest"], XYZ_AUDIT) == 200
+
+    r = requests.get(router.base_url + "/resolve-relationships", params={"gts_id": XYZ_AUDIT}, timeout=30)
+    assert r.status_code == 200, r.text
+    r = requests.post(router.base_url + "/validate-schema", json={"schema_id": XYZ_AUDIT}, timeout=30)
+    assert r.status_code == 200 and r.json()["ok"] is True, r.text
+
+    verdicts = {}
+    for name in ("complete", "incomplete"):
+        r = requests.post(
+            router.base_url + "/validate-instance",
+            json={"instance_id": f"{XYZ_AUDIT}xyz.plugin._.{name}.v1"},
+            timeout=30,
+        )
+        assert r.status_code == 200, r.text
+        verdicts[name] = r.json()["ok"]
+    assert verdicts == {"complete": True, "incomplete": False}
+
+
+def test_query_fans_out_across_shards(cluster: Cluster, op7_failures: typing.List[str], cross_shard_chain: None) -> None:
+    r = requests.get(cluster.router.base_url + "/query", params={"expr": "gts.*", "limit": 1000}, timeout=30)
+    assert r.status_code == 200, r.text
+    for gts_id in (X_BASE, X_CROSS_BASE, ABC_EVENT, XYZ_AUDIT):
+        assert gts_id in r.text
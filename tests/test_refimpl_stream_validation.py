@@ -0,0 +1,181 @@
+"""Streaming validation of large instances (section 9.14).
+
+A synthetic order export of DOCUMENT_BYTES, almost all of it one large
+``items`` array, is generated on the fly and streamed to
+/validate-instance/stream with chunked transfer encoding, once valid and
+once with a single violation near its end. ``memory.rss_bytes``
+(GET /metrics) is sampled while the documents stream; its growth over the
+value before the runs is reported and must stay well below the size of the
+document. ``memory.peak_rss_bytes`` is not used: it is a high-water mark
+over the whole lifetime of the server, which earlier tests may have set.
+"""
+
+import json
+import threading
+import typing
+import uuid
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema, unique_package
+
+DOCUMENT_BYTES = 50 * 1024 * 1024
+ITEMS_PER_CHUNK = 1000
+# a parsed document costs several times its size; streaming must not come close to one
+MAX_PEAK_DELTA = DOCUMENT_BYTES // 2
+RSS_SAMPLE_INTERVAL_S = 0.05
+
+
+def _item(k: int) -> dict:
+    return {"sku": f"SKU-{k:08d}", "name": f"item {k}", "qty": k % 7 + 1, "price": round(k % 1000 * 0.25, 2)}
+
+
+def _document(instance_id: str, bad_item_from_end: typing.Optional[int] = None) -> typing.Tuple[typing.Iterator[bytes], int]:
+    """Chunks of a JSON instance of about DOCUMENT_BYTES, and its item count."""
+    item_size = len(json.dumps(_item(10 ** 7))) + 1
+    count = DOCUMENT_BYTES // item_size
+    bad = count - bad_item_from_end if bad_item_from_end is not None else -1
+
+    def chunks() -> typing.Iterator[bytes]:
+        yield json.dumps({"id": instance_id, "orderId": str(uuid.uuid4())})[:-1].encode() + b', "items": ['
+        for start in range(0, count, ITEMS_PER_CHUNK):
+            items = []
+            for k in range(start, min(start + ITEMS_PER_CHUNK, count)):
+                item = _item(k)
+                if k == bad:
+                    item["qty"] = 0
+                items.append(json.dumps(item))
+            yield ("," if start else "").encode() + ",".join(items).encode()
+        yield b"]}"
+
+    return chunks(), count
+
+
+def _rss(session: requests.Session) -> int:
+    r = session.get(get_gts_base_url() + "/metrics", timeout=30)
+    assert r.status_code == 200, r.text
+    return r.json()["memory"]["rss_bytes"]
+
+
+def _max_rss_during(action: typing.Callable[[], typing.Any]) -> int:
+    """Highest memory.rss_bytes sampled while action() runs."""
+    samples: typing.List[int] = []
+    done = threading.Event()
+
+    def sample() -> None:
+        session = requests.Session()
+        while not done.is_set():
+            samples.append(_rss(session))
+            done.wait(RSS_SAMPLE_INTERVAL_S)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        action()
+    finally:
+        done.set()
+        sampler.join()
+    assert samples, "GET /metrics failed while streaming"
+    return max(samples)
+
+
+@pytest.fixture(scope="module")
+def schema_id() -> str:
+    package = unique_package("teststream")
+    schema_id = f"gts.x.{package}.orders.export.v1~"
+    schema = gts_schema(schema_id, {
+        "type": "object",
+        "required": ["id", "orderId", "items"],
+        "properties": {
+            "id": {"type": "string"},
+            "orderId": {"type": "string", "format": "uuid"},
+            "items": {
+                "type": "array",
+                "minItems": 1,
+                "items": {
+                    "type": "object",
+                    "required": ["sku", "qty", "price"],
+                    "additionalProperties": False,
+                    "properties": {
+                        "sku": {"type": "string", "pattern": "^SKU-[0-9]{8}$"},
+                        "name": {"type": "string", "maxLength": 64},
+                        "qty": {"type": "integer", "minimum": 1},
+                        "price": {"type": "number", "minimum": 0},
+                    },
+                },
+            },
+        },
+    })
+    r = requests.post(get_gts_base_url() + "/entities", json=schema, timeout=30)
+    assert r.status_code == 200, r.text
+    return schema_id
+
+
+def _stream(schema_id: str, bad_item_from_end: typing.Optional[int] = None) -> dict:
+    instance_id = f"{schema_id}x.teststream._.export_{uuid.uuid4().hex[:8]}.v1"
+    chunks, _ = _document(instance_id, bad_item_from_end)
+    r = requests.post(
+        get_gts_base_url() + "/validate-instance/stream",
+        params={"schema_id": schema_id},
+        data=chunks,
+        headers={"Content-Type": "application/json"},
+        timeout=600,
+    )
+    assert r.status_code == 200, r.text[:500]
+    body = r.json()
+    assert body.get("id") in (None, instance_id)
+    return body
+
+
+def test_streamed_instance_is_validated_in_bounded_memory(schema_id: str, record_property) -> None:
+    results: typing.Dict[str, dict] = {}
+
+    def stream_both() -> None:
+        results["valid"] = _stream(schema_id)
+        results["invalid"] = _stream(schema_id, bad_item_from_end=10)
+
+    before = _rss(requests.Session())
+    delta = _max_rss_during(stream_both) - before
+    valid, invalid = results["valid"], results["invalid"]
+
+    record_property("document_bytes", DOCUMENT_BYTES)
+    record_property("rss_delta_bytes", delta)
+    assert valid["ok"] is True, valid
+    assert invalid["ok"] is False, invalid
+    if "bytes" in valid:
+        assert valid["bytes"] >= DOCUMENT_BYTES * 0.9
+    assert delta <= MAX_PEAK_DELTA, (
+        f"RSS grew by {delta / 2 ** 20:.1f} MB while streaming a "
+        f"{DOCUMENT_BYTES / 2 ** 20:.0f} MB document (limit {MAX_PEAK_DELTA / 2 ** 20:.0f} MB)"
+    )
+
+
+def test_streamed_verdict_matches_registered_instance(schema_id: str) -> None:
+    """The same (small) document gives the same verdict streamed and registered."""
+    for qty, expected in ((1, True), (0, False)):
+        instance_id = f"{schema_id}x.teststream._.small_{qty}.v1"
+        instance = {"id": instance_id, "orderId": str(uuid.uuid4()), "items": [{**_item(1), "qty": qty}]}
+        r = requests.post(get_gts_base_url() + "/entities", json=instance, timeout=30)
+        assert r.status_code == 200, r.text
+        registered = requests.post(
+            get_gts_base_url() + "/validate-instance", json={"instance_id": instance_id}, timeout=30,
+        ).json()
+        streamed = requests.post(
+            get_gts_base_url() + "/validate-instance/stream", params={"schema_id": schema_id}, json=instance, timeout=30,
+        ).json()
+        assert registered["ok"] is expected
+        assert streamed["ok"] is expected
+
+
+def test_malformed_body_is_invalid(schema_id: str) -> None:
+    r = requests.post(
+        get_gts_base_url() + "/validate-instance/stream",
+        params={"schema_id": schema_id},
+        data=b'{"id": "x", "items": [1, 2',
+        headers={"Content-Type": "application/json"},
+        timeout=30,
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["ok"] is False
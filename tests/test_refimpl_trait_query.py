@@ -0,0 +1,126 @@
+"""Trait value index for OP#10 queries (sections 3.3 and 9.7.8).
+
+Two generated event families, SMALL and LARGE types, each route exactly
+RARE types to one topic and the rest to common topics. A query for the
+rare topic returns the same number of types in both families and must
+cost about the same. Re-registering a type that sets a trait must move
+it and its descendants between index entries.
+"""
+
+import statistics
+import time
+import typing
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema, unique_package
+
+SMALL = 500
+LARGE = 5000
+RARE = 10
+COMMON_TOPICS = 20
+QUERIES = 200
+# p50 over the large family may exceed the p50 over the small one by this factor plus slack
+INDEX_TOLERANCE = 1.5
+INDEX_SLACK_MS = 2.0
+
+
+def _base(schema_id: str) -> dict:
+    return gts_schema(schema_id, {
+        "type": "object",
+        "x-gts-traits-schema": {
+            "type": "object",
+            "properties": {
+                "topicRef": {"type": "string"},
+                "retention": {"type": "string", "default": "P30D"},
+            },
+        },
+    })
+
+
+def _derived(schema_id: str, parent: str, traits: dict) -> dict:
+    return gts_schema(schema_id, {
+        "type": "object",
+        "allOf": [{"$ref": f"gts://{parent}"}, {"type": "object", "x-gts-traits": traits}],
+    })
+
+
+def _bulk(entities: typing.List[dict]) -> None:
+    r = requests.post(get_gts_base_url() + "/entities/bulk", json=entities, timeout=300)
+    assert r.status_code == 200, r.text[:500]
+
+
+def _query(session: requests.Session, expr: str) -> typing.Tuple[float, typing.List[dict]]:
+    start = time.perf_counter()
+    r = session.get(get_gts_base_url() + "/query", params={"expr": expr, "limit": 1000}, timeout=30)
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    assert r.status_code == 200, r.text[:500]
+    body = r.json()
+    assert "error" not in body, body
+    return elapsed_ms, body["results"]
+
+
+def _family(size: int) -> typing.Tuple[str, str]:
+    """Register a base type and size derived types; returns (base id, rare topic)."""
+    package = unique_package("testtraitquery")
+    base = f"gts.x.{package}.events.type.v1~"
+    rare = f"gts.x.core.events.topic.v1~x.{package}._.rare.v1"
+    entities = [_base(base)]
+    for n in range(size):
+        topic = rare if n % (size // RARE) == 0 else f"gts.x.core.events.topic.v1~x.{package}._.common_{n % COMMON_TOPICS}.v1"
+        entities.append(_derived(f"{base}x.{package}._.event_{n}.v1~", base, {"topicRef": topic}))
+    _bulk(entities)
+    return base, rare
+
+
+def _rare_query_p50(session: requests.Session, base: str, rare: str) -> float:
+    expr = f'{base}*[x-gts-traits.topicRef="{rare}"]'
+    samples = []
+    for _ in range(QUERIES):
+        elapsed_ms, results = _query(session, expr)
+        samples.append(elapsed_ms)
+        assert len(results) == RARE
+    return statistics.median(samples[QUERIES // 10:])
+
+
+def test_trait_query_cost_does_not_grow_with_registry(record_property) -> None:
+    session = requests.Session()
+    small = _rare_query_p50(session, *_family(SMALL))
+    large = _rare_query_p50(session, *_family(LARGE))
+    record_property(f"query_{SMALL}_types_p50_ms", round(small, 3))
+    record_property(f"query_{LARGE}_types_p50_ms", round(large, 3))
+    limit = small * INDEX_TOLERANCE + INDEX_SLACK_MS
+    assert large <= limit, (
+        f"trait query over {LARGE} types: p50 {large:.3f} ms, limit {limit:.3f} ms "
+        f"({small:.3f} ms over {SMALL} types)"
+    )
+
+
+@pytest.fixture
+def routed() -> typing.Tuple[str, str, typing.List[str]]:
+    """A base, a mid-level type setting topicRef, and three leaves below it."""
+    package = unique_package("testtraitquery")
+    base = f"gts.x.{package}.events.type.v1~"
+    mid = f"{base}x.{package}._.audit.v1~"
+    leaves = [f"{mid}x.{package}._.leaf_{n}.v1~" for n in range(3)]
+    _bulk(
+        [_base(base), _derived(mid, base, {"topicRef": "gts.x.core.events.topic.v1~x.core._.audit.v1"})]
+        + [_derived(leaf, mid, {"retention": "P7D"}) for leaf in leaves]
+    )
+    return base, mid, leaves
+
+
+def test_reregistration_updates_descendants(routed: typing.Tuple[str, str, typing.List[str]]) -> None:
+    base, mid, leaves = routed
+    session = requests.Session()
+    audit = f'{base}*[x-gts-traits.topicRef="gts.x.core.events.topic.v1~x.core._.audit.v1"]'
+    notification = f'{base}*[x-gts-traits.topicRef="gts.x.core.events.topic.v1~x.core._.notification.v1"]'
+    assert len(_query(session, audit)[1]) == 4
+    assert len(_query(session, notification)[1]) == 0
+
+    _bulk([_derived(mid, base, {"topicRef": "gts.x.core.events.topic.v1~x.core._.notification.v1"})])
+    assert len(_query(session, audit)[1]) == 0
+    assert len(_query(session, notification)[1]) == 4
+    assert len(_query(session, f"{base}*[x-gts-traits.retention=P7D]")[1]) == len(leaves)
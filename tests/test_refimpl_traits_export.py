@@ -0,0 +1,160 @@
+"""Bulk effective traits export: GET /traits?pattern= (section 9.7.7).
+
+The ``examples/events`` schemas are exported with the event type wildcard
+and compared with the traits written in the example files and with
+GET /traits/{type_id}. Two generated hierarchies with LEAVES leaf types
+each, one below a shallow ancestry and one below a DEEP-level ancestry,
+check that the export shares the merge of common ancestors: exporting
+the deep hierarchy must not cost much more than the shallow one.
+"""
+
+import json
+import os
+import time
+import typing
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema, unique_package
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "events")
+EVENT_TYPE = "gts.x.core.events.type.v1~"
+
+LEAVES = 2000
+SHALLOW = 2
+DEEP = 20
+REPEATS = 3
+# the deep export may exceed the shallow one by this factor plus slack
+DEPTH_TOLERANCE = 1.5
+DEPTH_SLACK_MS = 50.0
+
+
+def _load(*parts: str) -> typing.Any:
+    with open(os.path.join(EXAMPLES_DIR, *parts), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _export(pattern: str) -> typing.Tuple[float, typing.List[dict]]:
+    start = time.perf_counter()
+    r = requests.get(get_gts_base_url() + "/traits", params={"pattern": pattern}, stream=True, timeout=120)
+    assert r.status_code == 200, r.text[:500]
+    lines = [json.loads(line) for line in r.iter_lines() if line.strip()]
+    return (time.perf_counter() - start) * 1000.0, lines
+
+
+def _by_id(lines: typing.List[dict]) -> typing.Dict[str, dict]:
+    ids = [line["id"] for line in lines]
+    assert ids == sorted(ids), "export is not ordered by identifier"
+    assert len(set(ids)) == len(ids), "export lists a type twice"
+    return {line["id"]: line for line in lines}
+
+
+@pytest.fixture(scope="module")
+def events() -> typing.Dict[str, dict]:
+    schemas = {}
+    for name in os.listdir(os.path.join(EXAMPLES_DIR, "schemas")):
+        schema = _load("schemas", name)
+        schemas[schema["$id"][len("gts://"):]] = schema
+    for schema_id in sorted(schemas, key=lambda i: i.count("~")):
+        r = requests.post(get_gts_base_url() + "/entities", json=schemas[schema_id], timeout=30)
+        assert r.status_code == 200, r.text
+    return schemas
+
+
+def test_export_of_example_event_types(events: typing.Dict[str, dict]) -> None:
+    defaults = {
+        name: prop["default"]
+        for name, prop in events[EVENT_TYPE]["x-gts-traits-schema"]["properties"].items()
+        if "default" in prop
+    }
+    expected = {}
+    for schema_id, schema in events.items():
+        if schema_id.startswith(EVENT_TYPE) and schema_id != EVENT_TYPE:
+            values = {k: v for part in schema.get("allOf", []) for k, v in part.get("x-gts-traits", {}).items()}
+            expected[schema_id] = {**defaults, **values}
+    assert len(expected) == 3
+
+    _, lines = _export(EVENT_TYPE + "*")
+    exported = _by_id(lines)
+    exported.pop(EVENT_TYPE, None)
+    assert {i: line["traits"] for i, line in exported.items()} == expected
+    for type_id, line in exported.items():
+        single = requests.get(get_gts_base_url() + f"/traits/{type_id}", timeout=30).json()
+        assert line["ok"] is single["ok"]
+        assert line["traits"] == single["traits"]
+
+
+def test_export_skips_non_matching_types_and_instances(events: typing.Dict[str, dict]) -> None:
+    topic = _load("instances", "gts.x.core.events.topic.v1~x.core.idp.contacts.v1.json")
+    r = requests.post(get_gts_base_url() + "/entities", json=topic, timeout=30)
+    assert r.status_code == 200, r.text
+    _, lines = _export("gts.x.core.events.*")
+    ids = set(_by_id(lines))
+    assert topic["id"] not in ids
+    assert "gts.x.core.events.type_combined.v1~x.commerce.orders.order_placed.v1.0~" in ids
+    assert not any(i.startswith("gts.x.core.idp.") for i in ids)
+    assert _export("gts.x.core.events.nothing.v1~*")[1] == []
+
+
+def test_invalid_pattern_is_rejected() -> None:
+    r = requests.get(get_gts_base_url() + "/traits", params={"pattern": "gts.x.*.events"}, timeout=30)
+    assert r.status_code == 422, r.text
+
+
+def _hierarchy(depth: int) -> typing.Tuple[str, typing.List[dict]]:
+    """A base type with a trait schema, depth - 1 single-child levels below it, and LEAVES leaf types."""
+    package = unique_package("testtraitsexport")
+    chain = [f"gts.x.{package}.events.type.v1~"]
+    schemas = [gts_schema(chain[0], {
+        "type": "object",
+        "x-gts-traits-schema": {
+            "type": "object",
+            "properties": {
+                "topic": {"type": "string", "default": "default"},
+                "retention": {"type": "string", "default": "P30D"},
+                "priority": {"type": "integer", "default": 0},
+            },
+        },
+    })]
+    for k in range(1, depth):
+        chain.append(f"{chain[-1]}x.{package}._.level_{k}.v1~")
+        overlay: dict = {"type": "object"}
+        if k == depth - 1:
+            overlay["x-gts-traits"] = {"topic": package}
+        schemas.append(gts_schema(chain[-1], {"type": "object", "allOf": [{"$ref": f"gts://{chain[-2]}"}, overlay]}))
+    for n in range(LEAVES):
+        leaf = f"{chain[-1]}x.{package}._.leaf_{n}.v1~"
+        overlay = {"type": "object", "x-gts-traits": {"retention": f"P{n + 1}D"}}
+        schemas.append(gts_schema(leaf, {"type": "object", "allOf": [{"$ref": f"gts://{chain[-1]}"}, overlay]}))
+    r = requests.post(get_gts_base_url() + "/entities/bulk", json=schemas, timeout=300)
+    assert r.status_code == 200, r.text[:500]
+    return package, schemas
+
+
+def _leaf_export_ms(package: str, schemas: typing.List[dict]) -> float:
+    parent = schemas[-LEAVES - 1]["$id"][len("gts://"):]
+    samples = []
+    for _ in range(REPEATS):
+        elapsed_ms, lines = _export(parent + "*")
+        samples.append(elapsed_ms)
+    leaves = {i: line for i, line in _by_id(lines).items() if ".leaf_" in i}
+    assert len(leaves) == LEAVES
+    for n in (0, LEAVES // 2, LEAVES - 1):
+        line = leaves[schemas[-LEAVES + n]["$id"][len("gts://"):]]
+        assert line["ok"] is True, line
+        assert line["traits"] == {"topic": package, "retention": f"P{n + 1}D", "priority": 0}
+    return sorted(samples)[REPEATS // 2]
+
+
+def test_export_shares_ancestor_merges(record_property) -> None:
+    shallow = _leaf_export_ms(*_hierarchy(SHALLOW))
+    deep = _leaf_export_ms(*_hierarchy(DEEP))
+    record_property(f"export_{LEAVES}_depth_{SHALLOW}_ms", round(shallow, 3))
+    record_property(f"export_{LEAVES}_depth_{DEEP}_ms", round(deep, 3))
+    limit = shallow * DEPTH_TOLERANCE + DEPTH_SLACK_MS
+    assert deep <= limit, (
+        f"exporting {LEAVES} types below a {DEEP}-level ancestry took {deep:.1f} ms, limit {limit:.1f} ms "
+        f"({shallow:.1f} ms below a {SHALLOW}-level ancestry)"
+    )
@@ -0,0 +1,116 @@
+"""Fast-fail validation modes (section 9.13).
+
+The OP#6 and OP#12 conformance fixtures are replayed in suite order.
+Every validation request is sent in full mode and again with
+``mode=first-error`` and ``max_errors``; the verdicts must be identical.
+A document violating many constraints checks that the reduced modes
+bound the reported errors.
+"""
+
+import typing
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema, unique_package
+from .perf.workload import FixtureRequest, load_fixture_requests
+
+VALIDATION_PATHS = ("/validate-instance", "/validate-entity", "/validate-schema")
+MODES: typing.List[typing.Dict[str, typing.Any]] = [
+    {"mode": "first-error"},
+    {"max_errors": 1},
+    {"max_errors": 3},
+]
+MANY_FIELDS = 500
+
+
+def _send(session: requests.Session, fixture: FixtureRequest, params: typing.Optional[dict] = None) -> requests.Response:
+    return session.request(
+        fixture.method,
+        get_gts_base_url() + fixture.path,
+        params={**fixture.params, **(params or {})} or None,
+        json=fixture.body,
+        timeout=30,
+    )
+
+
+@pytest.mark.parametrize("module", ["test_op6_schema_validation", "test_op12_schema_vs_schema_validation"])
+def test_reduced_modes_match_full_verdicts(module: str) -> None:
+    session = requests.Session()
+    compared = 0
+    mismatches = []
+    for fixture in load_fixture_requests([module]):
+        full = _send(session, fixture)
+        if fixture.method != "POST" or fixture.path not in VALIDATION_PATHS or full.status_code != 200:
+            continue
+        verdict = full.json()["ok"]
+        for params in MODES:
+            r = _send(session, fixture, params)
+            body = r.json() if r.status_code == 200 else {}
+            if r.status_code != 200 or body.get("ok") is not verdict:
+                mismatches.append(f"{fixture.source} {fixture.path} {params}: {r.status_code} {r.text[:200]} (full: ok={verdict})")
+            elif "errors" in body:
+                limit = params.get("max_errors", 1)
+                if len(body["errors"]) > limit:
+                    mismatches.append(f"{fixture.source} {fixture.path} {params}: {len(body['errors'])} errors reported")
+        compared += 1
+    assert compared, f"no validation requests found in {module}"
+    assert not mismatches, f"{len(mismatches)} of {compared} verdicts differ: {mismatches[:5]}"
+
+
+@pytest.fixture(scope="module")
+def many_violations() -> str:
+    """A registered instance that violates MANY_FIELDS constraints of its schema."""
+    package = unique_package("testmodes")
+    schema_id = f"gts.x.{package}.core.record.v1~"
+    fields = {f"field_{k}": {"type": "integer", "maximum": 0} for k in range(MANY_FIELDS)}
+    schema = gts_schema(schema_id, {
+        "type": "object",
+        "required": ["id"] + sorted(fields),
+        "properties": {"id": {"type": "string"}, **fields},
+    })
+    instance_id = f"{schema_id}x.{package}._.broken.v1"
+    # half of the fields are missing, the other half are out of range
+    instance = {"id": instance_id, **{f"field_{k}": k + 1 for k in range(0, MANY_FIELDS, 2)}}
+    for entity in (schema, instance):
+        r = requests.post(get_gts_base_url() + "/entities", json=entity, timeout=30)
+        assert r.status_code == 200, r.text
+    return instance_id
+
+
+@pytest.mark.parametrize("path, field", [("/validate-instance", "instance_id"), ("/validate-entity", "entity_id")])
+def test_reduced_modes_bound_reported_errors(many_violations: str, path: str, field: str) -> None:
+    url = get_gts_base_url() + path
+    body = {field: many_violations}
+
+    full = requests.post(url, json=body, timeout=30)
+    assert full.status_code == 200, full.text
+    assert full.json()["ok"] is False
+
+    first = requests.post(url, params={"mode": "first-error"}, json=body, timeout=30)
+    assert first.status_code == 200, first.text
+    result = first.json()
+    assert result["ok"] is False
+    assert result["id"] == many_violations
+    assert result.get("error")
+    assert len(result.get("errors", [])) <= 1
+
+    bounded = requests.post(url, params={"max_errors": 5}, json=body, timeout=30)
+    assert bounded.status_code == 200, bounded.text
+    result = bounded.json()
+    assert result["ok"] is False
+    assert len(result.get("errors", [])) <= 5
+    if "errors" in result:
+        assert result.get("truncated") is True
+
+
+@pytest.mark.parametrize("params", [{"mode": "fastest"}, {"max_errors": 0}])
+def test_invalid_mode_parameters_are_rejected(many_violations: str, params: dict) -> None:
+    r = requests.post(
+        get_gts_base_url() + "/validate-instance",
+        params=params,
+        json={"instance_id": many_violations},
+        timeout=30,
+    )
+    assert r.status_code == 422, r.text
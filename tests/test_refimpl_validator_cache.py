@@ -0,0 +1,136 @@
+"""Compiled OP#6 validators are cached per schema generation (section 9.12).
+
+The ``examples/events`` schemas and the first ``order_placed`` instance
+are registered, then the instance is validated ITERATIONS times through
+each OP#6 endpoint. The first call after the schema is (re-)registered
+compiles the validator; the steady state must be far cheaper. Registering
+the schema, or its base type, again must take effect on the very next
+validation.
+"""
+
+import copy
+import json
+import os
+import time
+import typing
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .perf.stats import summarize
+
+ITERATIONS = 10_000
+# steady-state p50 must be at least this many times faster than the first call
+MIN_SPEEDUP = 3.0
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "events")
+BASE_ID = "gts.x.core.events.type.v1~"
+SCHEMA_ID = "gts.x.core.events.type.v1~x.commerce.orders.order_placed.v1.0~"
+INSTANCE_FILE = "gts.x.core.events.type.v1~x.commerce.orders.order_placed.v1~.examples.json"
+
+ENDPOINTS = [("/validate-instance", "instance_id"), ("/validate-entity", "entity_id")]
+
+
+def _load(*parts: str) -> typing.Any:
+    with open(os.path.join(EXAMPLES_DIR, *parts), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _schemas() -> typing.Dict[str, dict]:
+    schemas = {}
+    for name in os.listdir(os.path.join(EXAMPLES_DIR, "schemas")):
+        schema = _load("schemas", name)
+        schemas[schema["$id"][len("gts://"):]] = schema
+    return schemas
+
+
+def _register(session: requests.Session, body: dict) -> None:
+    r = session.post(get_gts_base_url() + "/entities", json=body, timeout=30)
+    assert r.status_code == 200, r.text
+
+
+def _validate(session: requests.Session, path: str, field: str, instance_id: str) -> typing.Tuple[float, bool]:
+    start = time.perf_counter()
+    r = session.post(get_gts_base_url() + path, json={field: instance_id}, timeout=30)
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    assert r.status_code == 200, r.text
+    return elapsed_ms, r.json()["ok"]
+
+
+@pytest.fixture(scope="module")
+def session() -> requests.Session:
+    return requests.Session()
+
+
+@pytest.fixture(scope="module")
+def schemas(session: requests.Session) -> typing.Dict[str, dict]:
+    schemas = _schemas()
+    # base types first, so that every $ref target is registered
+    for schema_id in sorted(schemas, key=lambda i: i.count("~")):
+        _register(session, schemas[schema_id])
+    return schemas
+
+
+@pytest.fixture(scope="module")
+def instance_id(session: requests.Session, schemas: typing.Dict[str, dict]) -> str:
+    instance = _load("instances", INSTANCE_FILE)[0]
+    assert instance["type"] == SCHEMA_ID
+    _register(session, instance)
+    return instance["id"]
+
+
+@pytest.mark.parametrize("path, field", ENDPOINTS)
+def test_steady_state_is_far_below_first_call(
+    session: requests.Session, schemas: typing.Dict[str, dict], instance_id: str,
+    path: str, field: str, record_property,
+) -> None:
+    # a fresh registration makes the next call compile the validator again
+    _register(session, schemas[SCHEMA_ID])
+    first_ms, ok = _validate(session, path, field, instance_id)
+    assert ok is True
+
+    samples = []
+    for _ in range(ITERATIONS):
+        elapsed_ms, ok = _validate(session, path, field, instance_id)
+        assert ok is True
+        samples.append(elapsed_ms)
+    steady = summarize(samples[ITERATIONS // 2:])
+    record_property("first_ms", round(first_ms, 3))
+    record_property("steady_p50_ms", steady["p50_ms"])
+    record_property("steady_p99_ms", steady["p99_ms"])
+    assert steady["p50_ms"] * MIN_SPEEDUP <= first_ms, (
+        f"{path}: steady-state p50 {steady['p50_ms']} ms is not {MIN_SPEEDUP}x below "
+        f"the first call ({first_ms:.2f} ms)"
+    )
+
+
+@pytest.mark.parametrize("path, field", ENDPOINTS)
+@pytest.mark.parametrize("changed_id", [SCHEMA_ID, BASE_ID])
+def test_reregistration_invalidates_compiled_validator(
+    session: requests.Session, schemas: typing.Dict[str, dict], instance_id: str,
+    path: str, field: str, changed_id: str,
+) -> None:
+    original = schemas[changed_id]
+    stricter = copy.deepcopy(original)
+    if changed_id == SCHEMA_ID:
+        # the example order totals 149.99
+        payload = stricter["allOf"][1]["properties"]["payload"]
+        payload["properties"]["totalAmount"]["maximum"] = 100
+    else:
+        stricter["required"] = list(stricter.get("required", [])) + ["testCacheMarker"]
+
+    # compile and warm the validator
+    for _ in range(10):
+        assert _validate(session, path, field, instance_id)[1] is True
+    try:
+        _register(session, stricter)
+        assert _validate(session, path, field, instance_id)[1] is False, (
+            f"{path} still used the validator compiled before {changed_id} was registered again"
+        )
+        assert _validate(session, path, field, instance_id)[1] is False
+    finally:
+        _register(session, original)
+    assert _validate(session, path, field, instance_id)[1] is True, (
+        f"{path} still used the stricter validator after {changed_id} was restored"
+    )
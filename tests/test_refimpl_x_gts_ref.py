@@ -1,5 +1,10 @@
 """Tests for x-gts-ref validation: prefix enforcement, JSON Pointer resolution, and combinator semantics."""
 
+import statistics
+import time
+
+import requests
+
 from .conftest import get_gts_base_url
 from httprunner import HttpRunner, Config, Step, RunRequest
 
@@ -1013,6 +1018,201 @@ class TestCaseXGtsRef_NestedCombinators(HttpRunner):
     ]
 
 
+def _register_pointer_schema(label, schema_id, properties, expect_status):
+    """Register a schema whose x-gts-ref pointers are resolved at registration (section 9.6)."""
+    step = (
+        RunRequest(label)
+        .post("/entities")
+        .with_json({
+            "$$id": f"gts://{schema_id}",
+            "$$schema": "http://json-schema.org/draft-07/schema#",
+            "title": "PTR-TITLE",
+            "type": "object",
+            "properties": properties,
+        })
+        .validate()
+        .assert_equal("status_code", expect_status)
+    )
+    if expect_status == 422:
+        step = step.assert_equal("body.ok", False).assert_contains("body.error", "x-gts-ref validation failed")
+    return Step(step)
+
+
+def _not_registered(label, schema_id):
+    return Step(
+        RunRequest(label)
+        .get(f"/entities/{schema_id}")
+        .validate()
+        .assert_equal("status_code", 404)
+    )
+
+
+class TestCaseXGtsRef_PointerPlanRegistration(HttpRunner):
+    """x-gts-ref: relative pointers are resolved and checked when the schema is registered"""
+    config = Config("x-gts-ref: pointer plans at registration").base_url(get_gts_base_url())
+
+    def test_start(self):
+        """Run x-gts-ref registration-time pointer test steps."""
+        super().test_start()
+
+    teststeps = [
+        _register_pointer_schema(
+            "pointer to a missing location is rejected",
+            "gts.x.testref_plan._.missing.v1~",
+            {"id": {"type": "string", "x-gts-ref": "/properties/nothing_here/const"}},
+            422,
+        ),
+        _not_registered("rejected schema is not registered", "gts.x.testref_plan._.missing.v1~"),
+        _register_pointer_schema(
+            "pointer to an object is rejected",
+            "gts.x.testref_plan._.object_target.v1~",
+            {"id": {"type": "string", "x-gts-ref": "/properties"}},
+            422,
+        ),
+        _register_pointer_schema(
+            "pointer to a non-GTS string is rejected",
+            "gts.x.testref_plan._.title_target.v1~",
+            {"id": {"type": "string", "x-gts-ref": "/title"}},
+            422,
+        ),
+        _register_pointer_schema(
+            "pointer past the end of an array is rejected",
+            "gts.x.testref_plan._.array_index.v1~",
+            {
+                "kinds": {"type": "string", "enum": ["gts.x.testref_plan._.array_index.v1~"]},
+                "id": {"type": "string", "x-gts-ref": "/properties/kinds/enum/1"},
+            },
+            422,
+        ),
+        _register_pointer_schema(
+            "pointer cycle is rejected",
+            "gts.x.testref_plan._.cycle.v1~",
+            {
+                "a": {"type": "string", "x-gts-ref": "/properties/b"},
+                "b": {"type": "string", "x-gts-ref": "/properties/c"},
+                "c": {"type": "string", "x-gts-ref": "/properties/a"},
+            },
+            422,
+        ),
+        _not_registered("schema with a pointer cycle is not registered", "gts.x.testref_plan._.cycle.v1~"),
+        _register_pointer_schema(
+            "escaped pointer tokens resolve",
+            "gts.x.testref_plan._.escaped.v1~",
+            {
+                "a/b": {"type": "string", "const": "gts.x.testref_plan._.escaped.v1~"},
+                "id": {"type": "string", "x-gts-ref": "/properties/a~1b/const"},
+            },
+            200,
+        ),
+        _register_pointer_schema(
+            "pointer chain through another x-gts-ref field resolves",
+            "gts.x.testref_plan._.chain.v1~",
+            {
+                "type": {"type": "string", "x-gts-ref": "/$$id"},
+                "kind": {"type": "string", "x-gts-ref": "/properties/type"},
+                "id": {"type": "string", "x-gts-ref": "./properties/kind"},
+            },
+            200,
+        ),
+        Step(
+            RunRequest("register instance of the pointer chain schema")
+            .post("/entities")
+            .with_json({
+                "type": "gts.x.testref_plan._.chain.v1~",
+                "kind": "gts.x.testref_plan._.chain.v1~",
+                "id": "gts.x.testref_plan._.chain.v1~x.vendor._.c1.v1",
+            })
+            .validate()
+            .assert_equal("status_code", 200)
+        ),
+        Step(
+            RunRequest("validate instance of the pointer chain schema")
+            .post("/validate-instance")
+            .with_json({"instance_id": "gts.x.testref_plan._.chain.v1~x.vendor._.c1.v1"})
+            .validate()
+            .assert_equal("status_code", 200)
+            .assert_equal("body.ok", True)
+        ),
+        Step(
+            RunRequest("register instance with a kind outside the pointer chain target")
+            .post("/entities")
+            .with_json({
+                "type": "gts.x.testref_plan._.chain.v1~",
+                "kind": "gts.x.testref_plan._.other.v1~",
+                "id": "gts.x.testref_plan._.chain.v1~x.vendor._.c2.v1",
+            })
+            .validate()
+            .assert_equal("status_code", 200)
+        ),
+        Step(
+            RunRequest("validate instance with a wrong kind - should fail")
+            .post("/validate-instance")
+            .with_json({"instance_id": "gts.x.testref_plan._.chain.v1~x.vendor._.c2.v1"})
+            .validate()
+            .assert_equal("status_code", 200)
+            .assert_equal("body.ok", False)
+        ),
+    ]
+
+
+# -- repeated validation: pointer plans must not cost more than literal refs ---
+
+PLAN_FIELDS = 200
+PLAN_VALIDATIONS = 500
+# p50 with pointer refs may exceed the p50 with literal refs by this factor plus slack
+PLAN_TOLERANCE = 1.5
+PLAN_SLACK_MS = 1.0
+
+
+def _plan_schema(schema_id, pointers):
+    properties = {"id": {"type": "string"}}
+    for k in range(PLAN_FIELDS):
+        # anchors nested a few levels deep, so that walking the pointer is not free
+        properties[f"anchor_{k}"] = {
+            "type": "object",
+            "properties": {"meta": {"type": "object", "properties": {"kind": {"const": schema_id}}}},
+        }
+        ref = f"/properties/anchor_{k}/properties/meta/properties/kind/const" if pointers else schema_id
+        properties[f"ref_{k}"] = {"type": "string", "x-gts-ref": ref}
+    return {
+        "$id": f"gts://{schema_id}",
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties": properties,
+    }
+
+
+def _plan_p50(session, schema_id, pointers):
+    base_url = get_gts_base_url()
+    r = session.post(base_url + "/entities", json=_plan_schema(schema_id, pointers), timeout=30)
+    assert r.status_code == 200, r.text
+    instance_id = f"{schema_id}x.vendor._.bench.v1"
+    instance = {"id": instance_id, **{f"ref_{k}": schema_id for k in range(PLAN_FIELDS)}}
+    r = session.post(base_url + "/entities", json=instance, timeout=30)
+    assert r.status_code == 200, r.text
+    samples = []
+    for _ in range(PLAN_VALIDATIONS):
+        start = time.perf_counter()
+        r = session.post(base_url + "/validate-instance", json={"instance_id": instance_id}, timeout=30)
+        samples.append((time.perf_counter() - start) * 1000.0)
+        assert r.status_code == 200 and r.json()["ok"] is True, r.text
+    return statistics.median(samples[PLAN_VALIDATIONS // 10:])
+
+
+def test_pointer_refs_validate_as_fast_as_literal_refs(record_property):
+    """Validation applies the registration-time plan instead of re-walking pointers."""
+    session = requests.Session()
+    literal = _plan_p50(session, "gts.x.testref_plan._.bench_literal.v1~", pointers=False)
+    pointer = _plan_p50(session, "gts.x.testref_plan._.bench_pointer.v1~", pointers=True)
+    record_property("literal_p50_ms", round(literal, 3))
+    record_property("pointer_p50_ms", round(pointer, 3))
+    limit = literal * PLAN_TOLERANCE + PLAN_SLACK_MS
+    assert pointer <= limit, (
+        f"{PLAN_FIELDS} pointer refs: p50 {pointer:.3f} ms, "
+        f"limit {limit:.3f} ms ({literal:.3f} ms with literal refs)"
+    )
+
+
 if __name__ == "__main__":
     TestCaseXGtsRef_PrefixAndSelfRef().test_start()
     TestCaseXGtsRef_JsonPointer().test_start()
@@ -1021,3 +1221,4 @@ if __name__ == "__main__":
     TestCaseXGtsRef_AnyOf().test_start()
     TestCaseXGtsRef_AllOf().test_start()
     TestCaseXGtsRef_NestedCombinators().test_start()
+    TestCaseXGtsRef_PointerPlanRegistration().test_start()
@@ -0,0 +1,149 @@
+"""Batched x-gts-ref existence checks (section 9.6).
+
+A module type in the style of ``examples/modules`` lists its capabilities
+as an array of ``x-gts-ref`` values. Module instances with REFS capability
+references are registered with ``validate=true`` and validated. All
+references must be checked within a latency budget, and when some of them
+are missing, one response must report every missing reference.
+"""
+
+import time
+import typing
+
+import pytest
+import requests
+
+from .conftest import get_gts_base_url
+from .helpers import gts_schema, unique_package
+
+REFS = 2000
+MISSING = 50
+REPEATS = 3
+# allowed latency over a module with a single reference
+BUDGET_MS = 250.0
+
+
+class Catalog(typing.NamedTuple):
+    package: str
+    module_type: str
+    capabilities: typing.List[str]
+
+
+def _post(path: str, body: typing.Any, **params: str) -> typing.Tuple[float, requests.Response]:
+    start = time.perf_counter()
+    r = requests.post(get_gts_base_url() + path, params=params or None, json=body, timeout=60)
+    return (time.perf_counter() - start) * 1000.0, r
+
+
+@pytest.fixture(scope="module")
+def catalog() -> Catalog:
+    package = unique_package("testrefbatch")
+    capability_type = f"gts.x.{package}.modules.capability.v1~"
+    module_type = f"gts.x.{package}.modules.module.v1~"
+    capabilities = [f"{capability_type}x.{package}.api.cap_{k}.v1" for k in range(REFS)]
+    entities = [
+        gts_schema(capability_type, {
+            "type": "object",
+            "required": ["id", "description"],
+            "properties": {
+                "id": {"type": "string", "x-gts-ref": "/$id"},
+                "description": {"type": "string", "maxLength": 500},
+            },
+            "additionalProperties": False,
+        }),
+        gts_schema(module_type, {
+            "type": "object",
+            "required": ["id", "displayName"],
+            "properties": {
+                "id": {"type": "string"},
+                "displayName": {"type": "string", "minLength": 1},
+                "capabilities": {
+                    "type": "array",
+                    "items": {"type": "string", "x-gts-ref": capability_type},
+                    "uniqueItems": True,
+                },
+                "requirements": {
+                    "type": "array",
+                    "items": {"type": "string", "x-gts-ref": module_type},
+                },
+            },
+        }),
+    ] + [{"id": capability, "description": f"capability {k}"} for k, capability in enumerate(capabilities)]
+    _, r = _post("/entities/bulk", entities)
+    assert r.status_code == 200, r.text
+    return Catalog(package, module_type, capabilities)
+
+
+def _module(catalog: Catalog, name: str, capabilities: typing.List[str], requirements: typing.Sequence[str] = ()) -> dict:
+    return {
+        "id": f"{catalog.module_type}x.{catalog.package}._.{name}.v1",
+        "displayName": name,
+        "capabilities": capabilities,
+        "requirements": list(requirements),
+    }
+
+
+def _median_ms(path: str, make_body: typing.Callable[[int], typing.Any], **params: str) -> typing.Tuple[float, requests.Response]:
+    samples = []
+    r = None
+    for attempt in range(REPEATS):
+        elapsed_ms, r = _post(path, make_body(attempt), **params)
+        samples.append(elapsed_ms)
+    assert r is not None
+    return sorted(samples)[len(samples) // 2], r
+
+
+def test_thousands_of_refs_are_resolved_within_budget(catalog: Catalog, record_property) -> None:
+    baseline, r = _median_ms(
+        "/entities", lambda i: _module(catalog, f"single_{i}", catalog.capabilities[:1]), validate="true",
+    )
+    assert r.status_code == 200, r.text
+    latency, r = _median_ms(
+        "/entities", lambda i: _module(catalog, f"wide_{i}", catalog.capabilities), validate="true",
+    )
+    assert r.status_code == 200, r.text[:500]
+    record_property("register_single_ref_ms", round(baseline, 3))
+    record_property(f"register_{REFS}_refs_ms", round(latency, 3))
+    assert latency <= baseline + BUDGET_MS, (
+        f"registering {REFS} references took {latency:.1f} ms "
+        f"({baseline:.1f} ms for one reference, budget {BUDGET_MS} ms)"
+    )
+
+    instance_id = _module(catalog, "wide_0", [])["id"]
+    single_id = _module(catalog, "single_0", [])["id"]
+    baseline, r = _median_ms("/validate-instance", lambda i: {"instance_id": single_id})
+    assert r.json()["ok"] is True, r.text
+    latency, r = _median_ms("/validate-instance", lambda i: {"instance_id": instance_id})
+    assert r.status_code == 200 and r.json()["ok"] is True, r.text[:500]
+    record_property(f"validate_{REFS}_refs_ms", round(latency, 3))
+    assert latency <= baseline + BUDGET_MS, (
+        f"validating {REFS} references took {latency:.1f} ms "
+        f"({baseline:.1f} ms for one reference, budget {BUDGET_MS} ms)"
+    )
+
+
+def test_every_missing_ref_is_reported_in_one_response(catalog: Catalog) -> None:
+    capabilities = list(catalog.capabilities)
+    missing = []
+    # replace references spread over the whole array with unregistered ones
+    for k in range(0, REFS, REFS // MISSING):
+        capabilities[k] = capabilities[k].replace(".api.cap_", ".api.gone_")
+        missing.append(capabilities[k])
+    missing_module = _module(catalog, "absent_dependency", [])["id"]
+    module = _module(catalog, "broken", capabilities, requirements=[missing_module])
+    missing.append(missing_module)
+
+    _, r = _post("/entities", module, validate="true")
+    assert r.status_code == 422, r.text[:500]
+    body = r.json()
+    assert body["ok"] is False
+    reported = body.get("error", "")
+    unreported = [ref for ref in missing if ref not in reported]
+    if "missing_refs" in body:
+        listed = {entry["ref"] for entry in body["missing_refs"]}
+        assert listed == set(missing), f"missing_refs lists {len(listed)} references, expected {len(missing)}"
+        paths = {entry["path"] for entry in body["missing_refs"]}
+        assert "/requirements/0" in paths
+        assert f"/capabilities/{REFS // MISSING}" in paths
+        unreported = []
+    assert not unreported, f"{len(unreported)} of {len(missing)} missing references not reported, e.g. {unreported[:3]}"
@@ -0,0 +1,35 @@
+"""Offline checks of the JSON vectors (tests/vectors).
+
+The vector files must match the HttpRunner test classes they are exported
+from, and the reference OP#1 automaton of section 8.3 must pass them.
+"""
+
+import pytest
+
+from .perf.corpus import generate
+from .vectors import reference
+from .vectors.export import VECTOR_MODULES, export_module, render, vector_path
+from .vectors.runner import adapter_target, load_vectors, run
+
+
+@pytest.mark.parametrize("module_name", VECTOR_MODULES)
+def test_vector_file_is_up_to_date(module_name: str) -> None:
+    with open(vector_path(module_name), encoding="utf-8") as f:
+        stored = f.read()
+    assert stored == render(export_module(module_name)), (
+        f"{vector_path(module_name)} is stale; regenerate with 'python -m tests.vectors.export'"
+    )
+
+
+def test_reference_automaton_passes_op1_vectors() -> None:
+    vectors = load_vectors([vector_path("test_op1_id_validation")])
+    failed = run(vectors, adapter_target(reference))
+    assert not failed, [(vector["request"]["params"], failures) for vector, failures in failed[:5]]
+
+
+def test_reference_automaton_agrees_with_section_8_2_regex() -> None:
+    disagreements = [
+        entry.gts_id for entry in generate(5000, seed=35)
+        if entry.valid is not None and reference.validate_id(entry.gts_id)["valid"] is not entry.valid
+    ]
+    assert not disagreements, disagreements[:5]
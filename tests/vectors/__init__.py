@@ -0,0 +1,40 @@
+"""Language-neutral conformance vectors for the identifier operations.
+
+OP#1 (ID validation), OP#3 (ID parsing), OP#4 (pattern matching) and
+OP#5 (ID to UUID) are pure functions of their inputs. Their conformance
+cases are kept as JSON files next to this module (``op*.json``) so that
+any implementation can run them without an HTTP server, e.g. directly
+from a Go or Rust unit test.
+
+Each file has the form::
+
+    {
+      "operation": "OP#3",
+      "source": "tests/test_op3_id_parsing.py",
+      "vectors": [
+        {
+          "case": "TestCaseTestOp3IdParsing_ChainInstance",
+          "step": "parse id (chain -> instance)",
+          "request": {"method": "GET", "path": "/parse-id",
+                      "params": {"gts_id": "gts.x.test3...v1.2"}},
+          "expect": {
+            "status": 200,
+            "checks": [
+              {"check": "equal", "path": "segments[-1].is_type", "value": false}
+            ]
+          }
+        }
+      ]
+    }
+
+``request`` is the HTTP request of ``tests/openapi.json``; ``params`` are
+also the arguments of the operation when it is called in-process.
+``checks`` apply to the response body: ``path`` is a dotted path with
+optional (negative) list indexes, ``check`` is one of ``equal``,
+``not_equal`` and ``startswith``. A missing path compares as ``null``
+(so ``{"check": "equal", "value": null}`` accepts an absent field).
+
+The files are generated from the HttpRunner test classes, which stay the
+source of truth (``python -m tests.vectors.export``); ``runner.py`` runs
+them against a server or an in-process adapter.
+"""
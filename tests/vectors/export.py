@@ -0,0 +1,84 @@
+"""Generate the vector files from the HttpRunner test classes.
+
+Usage (from the repository root)::
+
+    python -m tests.vectors.export
+"""
+
+import json
+import os
+import sys
+import typing
+
+from ..perf.workload import class_parameters, fixture_classes, operation_label, substitute
+
+VECTOR_MODULES = (
+    "test_op1_id_validation",
+    "test_op3_id_parsing",
+    "test_op4_id_match_pattern",
+    "test_op5_id_uuid",
+)
+
+VECTOR_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def vector_path(module_name: str) -> str:
+    """``test_op3_id_parsing`` -> ``tests/vectors/op3_id_parsing.json``."""
+    return os.path.join(VECTOR_DIR, module_name[len("test_"):] + ".json")
+
+
+def _expectation(validators: typing.List[typing.Dict[str, typing.Any]]) -> typing.Dict[str, typing.Any]:
+    status = 200
+    checks = []
+    for validator in validators:
+        for check, (path, value, _message) in validator.items():
+            if path == "status_code":
+                status = int(value)
+            elif path.startswith("body."):
+                checks.append({"check": check, "path": path[len("body."):], "value": value})
+            else:
+                raise ValueError(f"unsupported validator {check} on {path}")
+    return {"status": status, "checks": checks}
+
+
+def export_module(module_name: str) -> typing.Dict[str, typing.Any]:
+    """Vector document of one ``test_op*`` module."""
+    vectors = []
+    for cls in fixture_classes(module_name):
+        for variables in class_parameters(cls):
+            for step in cls.teststeps:
+                struct = step.struct()
+                request = struct.request
+                vectors.append({
+                    "case": cls.__name__,
+                    "step": struct.name,
+                    "request": {
+                        "method": str(getattr(request.method, "value", request.method)).upper(),
+                        "path": substitute(request.url, variables),
+                        "params": substitute(dict(request.params), variables),
+                    },
+                    "expect": substitute(_expectation(struct.validators), variables),
+                })
+    return {
+        "operation": operation_label(module_name),
+        "source": f"tests/{module_name}.py",
+        "vectors": vectors,
+    }
+
+
+def render(document: typing.Dict[str, typing.Any]) -> str:
+    return json.dumps(document, indent=2, ensure_ascii=False) + "\n"
+
+
+def main() -> int:
+    for module_name in VECTOR_MODULES:
+        path = vector_path(module_name)
+        document = export_module(module_name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(render(document))
+        print(f"{path}: {len(document['vectors'])} vectors", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Reference single-pass validator for OP#1 (section 8.3).
+
+A direct transcription of the automaton in section 8.3, including the
+size limits of section 2.4: every character is examined once, the only
+lookahead is the fixed-size UUID tail, so the run time is linear in the
+input length whatever the input looks like.
+
+The module doubles as an example adapter for ``runner.py``::
+
+    python -m tests.vectors.runner --adapter tests.vectors.reference \\
+        --vectors tests/vectors/op1_id_validation.json
+"""
+
+import re
+import typing
+
+# section 2.4
+MAX_ID_LENGTH = 1024
+MAX_CHAIN_DEPTH = 64
+MAX_TOKEN_LENGTH = 64
+MAX_VERSION_NUMBER = 2 ** 32 - 1
+MAX_VERSION_DIGITS = len(str(MAX_VERSION_NUMBER))
+PREFIX = "gts."
+
+_TOKEN_FIRST = frozenset("abcdefghijklmnopqrstuvwxyz_")
+_TOKEN_REST = _TOKEN_FIRST | frozenset("0123456789")
+_DIGITS = frozenset("0123456789")
+_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+_UUID_LENGTH = 36
+
+# states
+TOKEN_START, TOKEN, VERSION, MAJOR_START, MAJOR, MAJOR_ZERO, MINOR_START, MINOR, MINOR_ZERO, AFTER_TILDE = range(10)
+# states in which a trailing '*' is a valid wildcard: the start of a token or number
+_WILDCARD_STATES = (TOKEN_START, MAJOR_START, MINOR_START, AFTER_TILDE)
+
+
+class InvalidId(ValueError):
+    def __init__(self, position: int, message: str) -> None:
+        super().__init__(f"{message} at position {position}")
+        self.position = position
+
+
+def _check_version_number(gts_id: str, start: int, end: int) -> None:
+    # at most MAX_VERSION_DIGITS digits, so the conversion is O(1)
+    if int(gts_id[start:end]) > MAX_VERSION_NUMBER:
+        raise InvalidId(start, f"version number greater than {MAX_VERSION_NUMBER}")
+
+
+def scan(gts_id: str) -> bool:
+    """Validate ``gts_id``; return whether it is a wildcard pattern, raise ``InvalidId`` otherwise."""
+    if len(gts_id) > MAX_ID_LENGTH:
+        raise InvalidId(MAX_ID_LENGTH, f"identifier longer than {MAX_ID_LENGTH} characters")
+    if not gts_id.startswith(PREFIX):
+        raise InvalidId(0, "identifier must start with 'gts.'")
+
+    state = TOKEN_START
+    token = 0      # 0..3: vendor, package, namespace, type
+    segment = 0    # index of the segment in the chain
+    start = 0      # position where the current token or version number started
+    i = len(PREFIX)
+    n = len(gts_id)
+    while i < n:
+        c = gts_id[i]
+        if c == "*":
+            if i != n - 1:
+                raise InvalidId(i, "wildcard '*' must be the last character")
+            if state not in _WILDCARD_STATES:
+                raise InvalidId(i, "wildcard '*' must start a segment token or version number")
+            return True
+        if state == AFTER_TILDE:
+            if segment + 1 == MAX_CHAIN_DEPTH:
+                raise InvalidId(i, f"chain longer than {MAX_CHAIN_DEPTH} segments")
+            if n - i == _UUID_LENGTH and _UUID_RE.fullmatch(gts_id, i):
+                return False
+            state, token, segment = TOKEN_START, 0, segment + 1
+            continue  # re-examine c as the first character of the next segment
+        if state == TOKEN_START:
+            if c not in _TOKEN_FIRST:
+                raise InvalidId(i, "segment token must start with a lowercase letter or '_'")
+            state, start = TOKEN, i
+        elif state == TOKEN:
+            if c == ".":
+                token += 1
+                state = VERSION if token == 4 else TOKEN_START
+            elif c not in _TOKEN_REST:
+                raise InvalidId(i, f"unexpected character {c!r} in segment token")
+            elif i - start == MAX_TOKEN_LENGTH:
+                raise InvalidId(i, f"segment token longer than {MAX_TOKEN_LENGTH} characters")
+        elif state == VERSION:
+            if c != "v":
+                raise InvalidId(i, "expected version 'v<MAJOR>[.<MINOR>]'")
+            state = MAJOR_START
+        elif state in (MAJOR_START, MINOR_START):
+            if c not in _DIGITS:
+                raise InvalidId(i, "expected a version number")
+            if c == "0":
+                state = MAJOR_ZERO if state == MAJOR_START else MINOR_ZERO
+            else:
+                state = MAJOR if state == MAJOR_START else MINOR
+            start = i
+        else:  # MAJOR, MAJOR_ZERO, MINOR, MINOR_ZERO
+            if c in _DIGITS and state in (MAJOR, MINOR):
+                if i - start == MAX_VERSION_DIGITS:
+                    raise InvalidId(i, f"version number longer than {MAX_VERSION_DIGITS} digits")
+            elif c == "." and state in (MAJOR, MAJOR_ZERO):
+                _check_version_number(gts_id, start, i)
+                state = MINOR_START
+            elif c == "~":
+                _check_version_number(gts_id, start, i)
+                state = AFTER_TILDE
+            else:
+                raise InvalidId(i, f"unexpected character {c!r} in version")
+        i += 1
+
+    if state in (MAJOR, MINOR):
+        _check_version_number(gts_id, start, n)
+    if state == AFTER_TILDE:
+        return False  # type identifier
+    if state in (MAJOR, MAJOR_ZERO, MINOR, MINOR_ZERO):
+        if segment == 0:
+            raise InvalidId(n, "a standalone identifier must be a type ending with '~'")
+        return False  # well-known instance
+    raise InvalidId(n, "identifier ends inside a segment")
+
+
+def validate_id(gts_id: str) -> typing.Dict[str, typing.Any]:
+    """``GET /validate-id`` response body."""
+    try:
+        is_wildcard = scan(gts_id)
+    except InvalidId as e:
+        return {"id": gts_id, "valid": False, "is_wildcard": "*" in gts_id, "error": str(e)}
+    return {"id": gts_id, "valid": True, "is_wildcard": is_wildcard, "error": ""}
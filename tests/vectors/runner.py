@@ -0,0 +1,177 @@
+"""Run the identifier vectors against a server or an in-process adapter.
+
+Over HTTP every vector is one request to the server under test. With an
+adapter the operations are called directly, which runs thousands of
+vectors in milliseconds. An adapter is any Python object (usually a
+module) with one callable per operation, named after the request path:
+``validate_id(gts_id)``, ``parse_id(gts_id)``,
+``match_id_pattern(candidate, pattern)`` and ``uuid(gts_id)``. Each returns
+the response body of the HTTP operation as a dict; an exception counts as
+a failed vector.
+
+Usage (from the repository root)::
+
+    python -m tests.vectors.runner --base-url http://127.0.0.1:8000
+    python -m tests.vectors.runner --adapter my_gts.adapter
+    python -m tests.vectors.runner --adapter my_gts.adapter --repeat 1000
+"""
+
+import argparse
+import glob
+import importlib
+import json
+import os
+import re
+import sys
+import time
+import typing
+
+import requests
+
+from .export import VECTOR_DIR
+
+_INDEX_RE = re.compile(r"^(\w*)((?:\[-?\d+\])*)$")
+_MISSING = object()
+
+Target = typing.Callable[[typing.Dict[str, typing.Any]], typing.Tuple[int, typing.Any]]
+
+
+def load_vectors(paths: typing.Optional[typing.Iterable[str]] = None) -> typing.List[typing.Dict[str, typing.Any]]:
+    """All vectors of the given files (default: every ``op*.json`` here), tagged with their operation."""
+    if paths is None:
+        paths = sorted(glob.glob(os.path.join(VECTOR_DIR, "op*.json")))
+    vectors = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            document = json.load(f)
+        for vector in document["vectors"]:
+            vectors.append({"operation": document["operation"], **vector})
+    return vectors
+
+
+def lookup(body: typing.Any, path: str) -> typing.Any:
+    """Resolve ``segments[-1].is_type`` style paths; ``_MISSING`` if absent."""
+    value = body
+    for part in path.split("."):
+        match = _INDEX_RE.match(part)
+        if not match:
+            return _MISSING
+        name, indexes = match.groups()
+        if name:
+            if not isinstance(value, dict) or name not in value:
+                return _MISSING
+            value = value[name]
+        for index in re.findall(r"-?\d+", indexes):
+            if not isinstance(value, list) or not -len(value) <= int(index) < len(value):
+                return _MISSING
+            value = value[int(index)]
+    return value
+
+
+def check_vector(vector: typing.Dict[str, typing.Any], status: int, body: typing.Any) -> typing.List[str]:
+    """Failed expectations of one vector (empty when it passes)."""
+    expect = vector["expect"]
+    if status != expect["status"]:
+        return [f"status {status} != {expect['status']}"]
+    failures = []
+    for check in expect["checks"]:
+        actual = lookup(body, check["path"])
+        value = None if actual is _MISSING else actual
+        if check["check"] == "equal":
+            passed = value == check["value"]
+        elif check["check"] == "not_equal":
+            passed = value != check["value"]
+        elif check["check"] == "startswith":
+            passed = isinstance(actual, str) and actual.startswith(check["value"])
+        else:
+            raise ValueError(f"unknown check {check['check']!r}")
+        if not passed:
+            shown = "<missing>" if actual is _MISSING else json.dumps(actual)
+            failures.append(f"{check['path']}: {check['check']} {json.dumps(check['value'])}, got {shown}")
+    return failures
+
+
+def http_target(base_url: str, timeout: float = 30.0) -> Target:
+    session = requests.Session()
+
+    def call(request: typing.Dict[str, typing.Any]) -> typing.Tuple[int, typing.Any]:
+        response = session.request(
+            request["method"], base_url + request["path"], params=request["params"], timeout=timeout,
+        )
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.status_code, None
+
+    return call
+
+
+def adapter_target(adapter: typing.Any) -> Target:
+    def call(request: typing.Dict[str, typing.Any]) -> typing.Tuple[int, typing.Any]:
+        operation = getattr(adapter, request["path"].strip("/").replace("-", "_"))
+        return 200, operation(**request["params"])
+
+    return call
+
+
+def load_adapter(spec: str) -> typing.Any:
+    """``package.module`` or ``package.module:attribute``."""
+    module_name, _, attribute = spec.partition(":")
+    adapter = importlib.import_module(module_name)
+    return getattr(adapter, attribute) if attribute else adapter
+
+
+def run(
+    vectors: typing.Sequence[typing.Dict[str, typing.Any]], target: Target,
+) -> typing.List[typing.Tuple[typing.Dict[str, typing.Any], typing.List[str]]]:
+    """Run every vector once; return ``(vector, failures)`` for the failing ones."""
+    failed = []
+    for vector in vectors:
+        try:
+            status, body = target(vector["request"])
+            failures = check_vector(vector, status, body)
+        except Exception as e:  # an adapter raising is a failed vector, not a crash
+            failures = [f"{type(e).__name__}: {e}"]
+        if failures:
+            failed.append((vector, failures))
+    return failed
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    where = parser.add_mutually_exclusive_group(required=True)
+    where.add_argument("--base-url", help="Run against a server, e.g. http://127.0.0.1:8000.")
+    where.add_argument("--adapter", help="Run in-process against module[:attribute].")
+    parser.add_argument("--vectors", nargs="*", help="Vector files (default: all files in tests/vectors).")
+    parser.add_argument("--repeat", type=int, default=1, help="Run the vectors this many times (default: 1).")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    if args.adapter:
+        target = adapter_target(load_adapter(args.adapter))
+    else:
+        base_url = args.base_url if args.base_url.startswith(("http://", "https://")) else f"http://{args.base_url}"
+        target = http_target(base_url.rstrip("/"), args.timeout)
+
+    vectors = load_vectors(args.vectors)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        failed = run(vectors, target)
+    elapsed = time.perf_counter() - start
+
+    for vector, failures in failed:
+        params = ", ".join(f"{k}={v!r}" for k, v in vector["request"]["params"].items())
+        print(f"FAIL {vector['operation']} {vector['case']} ({params}): {'; '.join(failures)}", file=sys.stderr)
+    total = len(vectors) * args.repeat
+    print(
+        f"{len(vectors) - len(failed)}/{len(vectors)} vectors passed; "
+        f"{total} runs in {elapsed * 1000:.1f} ms ({total / elapsed if elapsed else 0:.0f} vectors/s)",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())